@@ -25,6 +25,9 @@ from models import (
     verticals,
     exec_summary,
     user_sessions,
+    app_summary_counters,
+    data_versions,
+    app_status_snapshots,
 )
 
 
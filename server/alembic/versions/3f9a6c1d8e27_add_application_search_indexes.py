@@ -0,0 +1,53 @@
+"""(add):application search indexes
+
+Revision ID: 3f9a6c1d8e27
+Revises: 7c41d2e9b5a3
+Create Date: 2026-10-18 11:02:19.540318
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3f9a6c1d8e27'
+down_revision: Union[str, Sequence[str], None] = '7c41d2e9b5a3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# The ngram parser drops every token that contains a stopword, and the
+# default InnoDB list has "a", "i", "in", "on", ... so terms such as "ai",
+# "api" or "ia" would match nothing. InnoDB reads innodb_ft_enable_stopword
+# when the index is built, so it is switched off for this session only.
+# Build it the same way if it is ever dropped by hand.
+CREATE_SEARCH_INDEX = """
+    CREATE FULLTEXT INDEX ftx_applications_search
+    ON applications (name, vendor_company, owner_name, imitra_ticket_id)
+    WITH PARSER ngram
+"""
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        'ix_applications_imitra_ticket_id',
+        'applications',
+        ['imitra_ticket_id'],
+        unique=False,
+    )
+
+    if op.get_bind().dialect.name == 'mysql':
+        op.execute('SET SESSION innodb_ft_enable_stopword = 0')
+        op.execute(CREATE_SEARCH_INDEX)
+        op.execute('SET SESSION innodb_ft_enable_stopword = DEFAULT')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if op.get_bind().dialect.name == 'mysql':
+        op.drop_index('ftx_applications_search', table_name='applications')
+
+    op.drop_index('ix_applications_imitra_ticket_id', table_name='applications')
@@ -0,0 +1,72 @@
+"""(add):app summary counters
+
+Revision ID: 7c41d2e9b5a3
+Revises: a2830c855e39
+Create Date: 2026-10-18 10:12:41.118204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7c41d2e9b5a3'
+down_revision: Union[str, Sequence[str], None] = 'a2830c855e39'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'app_summary_counters',
+        sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column('status', sa.String(length=40), nullable=False),
+        sa.Column('app_type', sa.String(length=100), nullable=False),
+        sa.Column('env_internal', sa.Boolean(), nullable=False),
+        sa.Column('env_external', sa.Boolean(), nullable=False),
+        sa.Column('is_app_ai', sa.Boolean(), nullable=False),
+        sa.Column('is_privacy_applicable', sa.Boolean(), nullable=False),
+        sa.Column('app_priority', sa.Integer(), nullable=False),
+        sa.Column('app_count', sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint(
+            'status',
+            'app_type',
+            'env_internal',
+            'env_external',
+            'is_app_ai',
+            'is_privacy_applicable',
+            'app_priority',
+            name='uix_app_summary_key',
+        ),
+    )
+
+    # Backfill from the current active applications
+    op.execute(
+        """
+        INSERT INTO app_summary_counters (
+            status, app_type, env_internal, env_external,
+            is_app_ai, is_privacy_applicable, app_priority, app_count
+        )
+        SELECT
+            REPLACE(REPLACE(LOWER(COALESCE(status, '')), ' ', '_'), '-', '_'),
+            COALESCE(app_type, ''),
+            LOWER(COALESCE(environment, '')) LIKE '%internal%',
+            LOWER(COALESCE(environment, '')) LIKE '%external%',
+            COALESCE(is_app_ai, 0) = 1,
+            COALESCE(is_privacy_applicable, 0) = 1,
+            COALESCE(app_priority, 0),
+            COUNT(*)
+        FROM applications
+        WHERE is_active = 1
+        GROUP BY 1, 2, 3, 4, 5, 6, 7
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('app_summary_counters')
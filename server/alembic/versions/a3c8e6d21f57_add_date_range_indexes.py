@@ -0,0 +1,49 @@
+"""(add):indexes for date range filters
+
+Revision ID: a3c8e6d21f57
+Revises: f7d1c5a9e2b4
+Create Date: 2026-10-18 17:05:32.184406
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a3c8e6d21f57'
+down_revision: Union[str, Sequence[str], None] = 'f7d1c5a9e2b4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+INDEXES = [
+    (
+        'ix_applications_started_at',
+        'applications',
+        ['started_at'],
+    ),
+    (
+        'ix_applications_active_status_completed',
+        'applications',
+        ['is_active', 'status', 'completed_at'],
+    ),
+    (
+        'ix_app_depts_status_active_ended',
+        'application_departments',
+        ['status', 'is_active', 'ended_at'],
+    ),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for name, table, columns in INDEXES:
+        op.create_index(name, table, columns, unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for name, table, _ in reversed(INDEXES):
+        op.drop_index(name, table_name=table)
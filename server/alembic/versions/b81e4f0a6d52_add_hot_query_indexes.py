@@ -0,0 +1,71 @@
+"""(add):composite indexes for hot queries
+
+Revision ID: b81e4f0a6d52
+Revises: 3f9a6c1d8e27
+Create Date: 2026-10-18 11:40:05.771930
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b81e4f0a6d52'
+down_revision: Union[str, Sequence[str], None] = '3f9a6c1d8e27'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+INDEXES = [
+    (
+        'ix_app_depts_app_dept_active_status',
+        'application_departments',
+        ['application_id', 'department_id', 'is_active', 'status'],
+    ),
+    (
+        'ix_comments_app_dept_created',
+        'comments',
+        ['application_id', 'department_id', 'created_at'],
+    ),
+    (
+        'ix_exec_summaries_app_dept_scope_created',
+        'executive_summaries',
+        ['application_id', 'department_id', 'scope', 'created_at'],
+    ),
+    (
+        'ix_applications_active_status_priority_started',
+        'applications',
+        ['is_active', 'status', 'app_priority', 'started_at'],
+    ),
+    (
+        'ix_app_control_results_app_control',
+        'application_control_results',
+        ['application_id', 'department_control_id'],
+    ),
+    (
+        'ix_user_sessions_user_active',
+        'user_sessions',
+        ['user_id', 'is_active'],
+    ),
+    # get_app_types_summary groups every application by app_type with no
+    # other filter; this lets it read the index instead of the table
+    (
+        'ix_applications_app_type_flags',
+        'applications',
+        ['app_type', 'is_app_ai', 'is_privacy_applicable'],
+    ),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for name, table, columns in INDEXES:
+        op.create_index(name, table, columns, unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for name, table, _ in reversed(INDEXES):
+        op.drop_index(name, table_name=table)
@@ -0,0 +1,38 @@
+"""(add):updated_at, id indexes for the change feed
+
+Revision ID: c6e1f9a3b852
+Revises: a3c8e6d21f57
+Create Date: 2026-10-18 18:20:47.603918
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c6e1f9a3b852'
+down_revision: Union[str, Sequence[str], None] = 'a3c8e6d21f57'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+INDEXES = [
+    ('ix_applications_updated_id', 'applications', ['updated_at', 'id']),
+    ('ix_app_depts_updated_id', 'application_departments', ['updated_at', 'id']),
+    ('ix_comments_updated_id', 'comments', ['updated_at', 'id']),
+    ('ix_exec_summaries_updated_id', 'executive_summaries', ['updated_at', 'id']),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for name, table, columns in INDEXES:
+        op.create_index(name, table, columns, unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for name, table, _ in reversed(INDEXES):
+        op.drop_index(name, table_name=table)
@@ -0,0 +1,112 @@
+"""(add):latest comment / exec summary pointers on application_departments
+
+Revision ID: d4a7c93e1f08
+Revises: b81e4f0a6d52
+Create Date: 2026-10-18 12:21:47.302615
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd4a7c93e1f08'
+down_revision: Union[str, Sequence[str], None] = 'b81e4f0a6d52'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        'application_departments',
+        sa.Column('latest_comment_id', sa.String(length=40), nullable=True),
+    )
+    op.add_column(
+        'application_departments',
+        sa.Column('latest_exec_summary_id', sa.String(length=40), nullable=True),
+    )
+    op.add_column(
+        'application_departments',
+        sa.Column('comment_count', sa.Integer(), server_default='0', nullable=False),
+    )
+    op.create_foreign_key(
+        'fk_app_depts_latest_comment',
+        'application_departments',
+        'comments',
+        ['latest_comment_id'],
+        ['id'],
+        ondelete='set null',
+        onupdate='cascade',
+    )
+    op.create_foreign_key(
+        'fk_app_depts_latest_exec_summary',
+        'application_departments',
+        'executive_summaries',
+        ['latest_exec_summary_id'],
+        ['id'],
+        ondelete='set null',
+        onupdate='cascade',
+    )
+
+    # Backfill, same as `python -m services.summaries.app_dept_pointers`
+    op.execute(
+        """
+        UPDATE application_departments ad
+        JOIN (
+            SELECT application_id, department_id, COUNT(*) AS cnt
+            FROM comments
+            GROUP BY application_id, department_id
+        ) c ON c.application_id = ad.application_id
+            AND c.department_id = ad.department_id
+        SET ad.comment_count = c.cnt
+        """
+    )
+    op.execute(
+        """
+        UPDATE application_departments ad
+        JOIN (
+            SELECT id, application_id, department_id,
+                ROW_NUMBER() OVER (
+                    PARTITION BY application_id, department_id
+                    ORDER BY created_at DESC, id DESC
+                ) AS rn
+            FROM comments
+        ) lc ON lc.application_id = ad.application_id
+            AND lc.department_id = ad.department_id
+            AND lc.rn = 1
+        SET ad.latest_comment_id = lc.id
+        """
+    )
+    op.execute(
+        """
+        UPDATE application_departments ad
+        JOIN (
+            SELECT id, application_id, department_id,
+                ROW_NUMBER() OVER (
+                    PARTITION BY application_id, department_id
+                    ORDER BY created_at DESC, id DESC
+                ) AS rn
+            FROM executive_summaries
+            WHERE scope = 'department'
+        ) le ON le.application_id = ad.application_id
+            AND le.department_id = ad.department_id
+            AND le.rn = 1
+        SET ad.latest_exec_summary_id = le.id
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_constraint(
+        'fk_app_depts_latest_exec_summary', 'application_departments', type_='foreignkey'
+    )
+    op.drop_constraint(
+        'fk_app_depts_latest_comment', 'application_departments', type_='foreignkey'
+    )
+    op.drop_column('application_departments', 'comment_count')
+    op.drop_column('application_departments', 'latest_exec_summary_id')
+    op.drop_column('application_departments', 'latest_comment_id')
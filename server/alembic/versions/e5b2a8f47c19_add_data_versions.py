@@ -0,0 +1,46 @@
+"""(add):data versions
+
+Revision ID: e5b2a8f47c19
+Revises: d4a7c93e1f08
+Create Date: 2026-10-18 13:05:33.918240
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e5b2a8f47c19'
+down_revision: Union[str, Sequence[str], None] = 'd4a7c93e1f08'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    data_versions = op.create_table(
+        'data_versions',
+        sa.Column('name', sa.String(length=40), nullable=False),
+        sa.Column('version', sa.BigInteger(), nullable=False),
+        sa.PrimaryKeyConstraint('name'),
+    )
+    op.bulk_insert(
+        data_versions,
+        [
+            {'name': name, 'version': 0}
+            for name in (
+                'applications',
+                'app_departments',
+                'comments',
+                'exec_summaries',
+                'reference',
+            )
+        ],
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('data_versions')
@@ -0,0 +1,70 @@
+"""(add):app status snapshots
+
+Revision ID: f7d1c5a9e2b4
+Revises: e5b2a8f47c19
+Create Date: 2026-10-18 15:42:10.517304
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f7d1c5a9e2b4'
+down_revision: Union[str, Sequence[str], None] = 'e5b2a8f47c19'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'app_status_snapshots',
+        sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column('snapshot_date', sa.Date(), nullable=False),
+        sa.Column('vertical_id', sa.Integer(), nullable=False),
+        sa.Column('scope', sa.String(length=40), nullable=False),
+        sa.Column('app_priority', sa.Integer(), nullable=False),
+        sa.Column('severity', sa.Integer(), nullable=False),
+        sa.Column('app_status', sa.String(length=40), nullable=False),
+        sa.Column('department_id', sa.Integer(), nullable=False),
+        sa.Column('dept_status', sa.String(length=40), nullable=False),
+        sa.Column('item_count', sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint(
+            'snapshot_date',
+            'vertical_id',
+            'scope',
+            'app_priority',
+            'severity',
+            'app_status',
+            'department_id',
+            'dept_status',
+            name='uix_app_status_snapshot_key',
+        ),
+    )
+    op.create_index(
+        'ix_app_status_snapshots_dept_date',
+        'app_status_snapshots',
+        ['department_id', 'snapshot_date'],
+        unique=False,
+    )
+    op.bulk_insert(
+        sa.table(
+            'data_versions',
+            sa.column('name', sa.String),
+            sa.column('version', sa.BigInteger),
+        ),
+        [{'name': 'snapshots', 'version': 0}],
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("DELETE FROM data_versions WHERE name = 'snapshots'")
+    op.drop_index(
+        'ix_app_status_snapshots_dept_date', table_name='app_status_snapshots'
+    )
+    op.drop_table('app_status_snapshots')
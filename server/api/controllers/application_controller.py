@@ -1,6 +1,6 @@
 from fastapi import HTTPException, status, BackgroundTasks
-from sqlalchemy import select, and_, desc, asc, func, or_, case
-from sqlalchemy.orm import Session, joinedload, selectinload
+from sqlalchemy import select, and_, desc, asc, func, or_, literal
+from sqlalchemy.orm import Session, selectinload
 from sqlalchemy.exc import IntegrityError
 from models import (
     Application,
@@ -11,6 +11,7 @@ from models import (
     ApplicationControlResult,
     User,
     ExecutiveSummary,
+    Vertical,
 )
 from schemas.app_schemas import (
     ApplicationCreate,
@@ -18,9 +19,7 @@ from schemas.app_schemas import (
     ApplicationUpdate,
     NewAppListOut,
     AppQueryParams,
-    AppStatuses,
     VerticalOut,
-    AppsSummaryOut,
     EnvironmentCounts,
 )
 from schemas.department_schemas import DepartmentOut
@@ -28,11 +27,22 @@ from schemas.exec_summary_schemas import ExecSummaryOut
 from services.notifications.email_notify import send_new_app_mails_bg
 from schemas.notification_schemas import NewAppData
 import os
+import base64
+import json
+from datetime import datetime
 from dotenv import load_dotenv
-from api.controllers.user_management_controller import get_user_departments
+from services.auth.context import AuthContext
+from services.summaries.app_summary import read_apps_summary
+from services.summaries.app_facets import compute_app_facets, apps_summary_from_facets
+from services.summaries.date_ranges import day_range
+from services.search.app_search import search_condition, search_rank
+from services.projections.fieldsets import APP_LIST_FIELDS
+from api.controllers.exec_summary_controller import load_latest_app_exec_summaries
 from api.controllers.department_controller import (
     get_app_department_by_name,
     get_department_by_name,
+    load_departments_with_latest_comment,
+    load_departments_with_latest_exec_summary,
 )
 
 load_dotenv()
@@ -202,7 +212,7 @@ def apply_scope_filter(stmt, scope: str | None):
     return stmt
 
 
-def apply_filters(stmt, params: AppQueryParams, current_user: User, db: Session):
+def apply_filters(stmt, params: AppQueryParams, auth: AuthContext, db: Session):
     """
     Apply filtering based on user role, department, verticals, status, type, priority, and search params.
     Returns a SQLAlchemy statement ready for execution.
@@ -210,15 +220,14 @@ def apply_filters(stmt, params: AppQueryParams, current_user: User, db: Session)
     # --------------------------
     # User role based filters
     # --------------------------
-    user_depts = get_user_departments(db=db, user_id=current_user.id)
+    user_depts = auth.department_ids
 
-    if current_user.role != "user":
+    if auth.role != "user":
         if len(user_depts) == 1 and 9 in user_depts:
             stmt = stmt.where(Application.is_privacy_applicable)
 
-    if current_user.role not in ["admin", "manager", "moderator", "user"]:
-        vertical_ids = [v.id for v in current_user.verticals]
-        stmt = stmt.where(Application.vertical_id.in_(vertical_ids))
+    if auth.role not in ["admin", "manager", "moderator", "user"]:
+        stmt = stmt.where(Application.vertical_id.in_(auth.vertical_ids))
 
     # --------------------------
     # Scope filter (custom)
@@ -275,10 +284,9 @@ def apply_filters(stmt, params: AppQueryParams, current_user: User, db: Session)
     # Application age
     # --------------------------
     if params.app_age_from:
-        stmt = stmt.where(Application.started_at.is_not(None))
-        stmt = stmt.where(Application.started_at >= params.app_age_from)
-        if params.app_age_to:
-            stmt = stmt.where(Application.started_at <= params.app_age_to)
+        stmt = stmt.where(
+            *day_range(Application.started_at, params.app_age_from, params.app_age_to)
+        )
 
     # --------------------------
     # App type filters
@@ -313,149 +321,239 @@ def apply_filters(stmt, params: AppQueryParams, current_user: User, db: Session)
     # Search filters
     # --------------------------
     if params.search and params.search != "null":
-        search_value = f"%{params.search}%"
-        search_column = (
-            getattr(Application, params.search_by, None) if params.search_by else None
+        stmt = stmt.where(
+            search_condition(db=db, term=params.search, search_by=params.search_by)
         )
 
-        if params.search_by == "ticket_id":
-            stmt = stmt.where(Application.imitra_ticket_id.ilike(search_value))
-        elif search_column is not None:
-            stmt = stmt.where(search_column.ilike(search_value))
-        else:
-            stmt = stmt.where(
-                or_(
-                    Application.name.ilike(search_value),
-                    Application.vendor_company.ilike(search_value),
-                    Application.owner_name.ilike(search_value),
-                    Application.imitra_ticket_id.ilike(search_value),
-                )
-            )
-
     return stmt
 
 
-def compute_apps_summary(db: Session, stmt) -> AppsSummaryOut:
-    normalized_status = func.replace(
-        func.replace(func.lower(stmt.c.status), " ", "_"), "-", "_"
-    )
+# sort_by values allowed by AppQueryParams.validate_sort_by -> column
+SORT_COLUMNS = {
+    "updated_at": Application.updated_at,
+    "created_at": Application.created_at,
+    "started_at": Application.started_at,
+    "name": Application.name,
+    "priority": Application.app_priority,
+}
+
+DATETIME_SORT_FIELDS = {"updated_at", "created_at", "started_at"}
 
-    agg_row = db.execute(
-        select(
-            # Total
-            func.count().label("total_apps"),
-            # Status counts
-            func.sum(case((normalized_status == "in_progress", 1), else_=0)).label(
-                "in_progress"
-            ),
-            func.sum(case((normalized_status == "not_yet_started", 1), else_=0)).label(
-                "not_yet_started"
-            ),
-            func.sum(case((normalized_status == "closed", 1), else_=0)).label("closed"),
-            func.sum(case((normalized_status == "completed", 1), else_=0)).label(
-                "completed"
-            ),
-            func.sum(case((normalized_status == "new_request", 1), else_=0)).label(
-                "new_request"
-            ),
-            func.sum(case((normalized_status == "cancelled", 1), else_=0)).label(
-                "cancelled"
-            ),
-            func.sum(case((normalized_status == "reopen", 1), else_=0)).label("reopen"),
-            func.sum(case((normalized_status == "hold", 1), else_=0)).label("hold"),
-            func.sum(case((normalized_status == "go_live", 1), else_=0)).label(
-                "go_live"
-            ),
-            # Environment
-            func.sum(case((stmt.c.environment.ilike(r"%internal%"), 1), else_=0)).label(
-                "internal_count"
-            ),
-            func.sum(case((stmt.c.environment.ilike(r"%external%"), 1), else_=0)).label(
-                "external_count"
-            ),
-            # App types
-            func.sum(case((stmt.c.app_type == "mobile", 1), else_=0)).label("mobile"),
-            func.sum(case((stmt.c.app_type == "web", 1), else_=0)).label("web"),
-            func.sum(case((stmt.c.app_type == "mobile_web", 1), else_=0)).label(
-                "mobile_web"
-            ),
-            # Features
-            func.sum(case((stmt.c.is_app_ai == True, 1), else_=0)).label("ai"),
-            func.sum(case((stmt.c.is_privacy_applicable == True, 1), else_=0)).label(
-                "privacy"
-            ),
-        ).select_from(stmt)
-    ).first()
-
-    # Priority counts (separate query)
-    priority_rows = db.execute(
-        select(stmt.c.app_priority, func.count())
-        .select_from(stmt)
-        .group_by(stmt.c.app_priority)
-    ).all()
 
-    priority_counts = {row[0]: row[1] for row in priority_rows}
-
-    return AppsSummaryOut(
-        total_apps=agg_row.total_apps if agg_row else 0 or 0,
-        app_statuses=AppStatuses(
-            in_progress=agg_row.in_progress if agg_row else 0 or 0,
-            not_yet_started=agg_row.not_yet_started if agg_row else 0 or 0,
-            closed=agg_row.closed if agg_row else 0 or 0,
-            completed=agg_row.completed if agg_row else 0 or 0,
-            new_request=agg_row.new_request if agg_row else 0 or 0,
-            cancelled=agg_row.cancelled if agg_row else 0 or 0,
-            reopen=agg_row.reopen if agg_row else 0 or 0,
-            hold=agg_row.hold if agg_row else 0 or 0,
-            go_live=agg_row.go_live if agg_row else 0 or 0,
-        ),
-        priority_counts=priority_counts,
-        ai_app_count=agg_row.ai if agg_row else 0 or 0,
-        privacy_app_count=agg_row.privacy if agg_row else 0 or 0,
-        mobile_app_count=agg_row.mobile if agg_row else 0 or 0,
-        web_app_count=agg_row.web if agg_row else 0 or 0,
-        mobile_web_app_count=agg_row.mobile_web if agg_row else 0 or 0,
-        internal_environment_count=agg_row.internal_count if agg_row else 0 or 0,
-        external_environment_count=agg_row.external_count if agg_row else 0 or 0,
+def _encode_cursor(app: Application, params: AppQueryParams) -> str:
+    value = getattr(app, SORT_COLUMNS[params.sort_by].key)
+    if isinstance(value, datetime):
+        value = value.isoformat()
+
+    raw = json.dumps(
+        {"s": params.sort_by, "o": params.sort_order, "v": value, "id": app.id}
     )
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii")
 
 
-def list_all_apps(db: Session, params: AppQueryParams, current_user: User):
+def _decode_cursor(cursor: str, params: AppQueryParams) -> tuple:
     try:
-        stmt = (
-            select(Application)
-            .where(Application.is_active)
-            .options(
-                joinedload(Application.departments),
-                selectinload(Application.executive_summaries),
+        data = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+        sort_value, last_id = data["v"], data["id"]
+        if sort_value is not None and params.sort_by in DATETIME_SORT_FIELDS:
+            sort_value = datetime.fromisoformat(sort_value)
+    except Exception:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor"
+        )
+
+    if data.get("s") != params.sort_by or data.get("o") != params.sort_order:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Cursor does not match the requested sort",
+        )
+
+    return sort_value, last_id
+
+
+def apply_keyset_filter(stmt, params: AppQueryParams, sort_value, last_id: str):
+    """
+    Rows strictly after (sort_value, last_id) in (sort column, id) order.
+    NULL sort values follow MySQL ordering: first when ascending, last when
+    descending.
+    """
+    column = SORT_COLUMNS[params.sort_by]
+
+    if params.sort_order == "desc":
+        if sort_value is None:
+            return stmt.where(and_(column.is_(None), Application.id < last_id))
+        return stmt.where(
+            or_(
+                column < sort_value,
+                and_(column == sort_value, Application.id < last_id),
+                column.is_(None),
             )
         )
-        apps_summary = compute_apps_summary(db=db, stmt=stmt.subquery())
 
-        # Apply filters (role, vertical, priority, type, search, etc.)
-        stmt = apply_filters(stmt, params, current_user, db=db)
+    if sort_value is None:
+        return stmt.where(
+            or_(
+                and_(column.is_(None), Application.id > last_id),
+                column.is_not(None),
+            )
+        )
+    return stmt.where(
+        or_(
+            column > sort_value,
+            and_(column == sort_value, Application.id > last_id),
+        )
+    )
 
-        filtered_subquery = stmt.subquery()
 
-        filtered_summary = compute_apps_summary(db=db, stmt=filtered_subquery)
+def hydrate_apps(app_ids: list[str], db: Session) -> list[Application]:
+    """Full Application rows for `app_ids`, returned in the same order."""
+    if not app_ids:
+        return []
 
-        # Build summary
+    apps = db.scalars(
+        select(Application)
+        .where(Application.id.in_(app_ids))
+        .options(
+            selectinload(Application.executive_summaries),
+            selectinload(Application.app_vertical),
+        )
+    ).all()
 
-        # Pagination & fetch applications
-        sort_column = getattr(Application, params.sort_by)
-        sort_column = (
-            desc(sort_column) if params.sort_order == "desc" else asc(sort_column)
+    apps_by_id = {app.id: app for app in apps}
+    return [apps_by_id[app_id] for app_id in app_ids if app_id in apps_by_id]
+
+
+def _sparse_apps_out(rows, params: AppQueryParams, db: Session) -> list[dict]:
+    apps_out = APP_LIST_FIELDS.to_dicts(rows, params.fields)
+    relations = APP_LIST_FIELDS.relations_in(params.fields)
+    if not relations or not rows:
+        return apps_out
+
+    app_ids = [row.id for row in rows]
+
+    if "departments" in relations:
+        departments_by_app = (
+            load_departments_with_latest_exec_summary(app_ids=app_ids, db=db)
+            if params.mode == "executive"
+            else load_departments_with_latest_comment(app_ids=app_ids, db=db)
         )
+        for app_out in apps_out:
+            app_out["departments"] = departments_by_app.get(app_out["id"], [])
+
+    if "app_vertical" in relations:
+        verticals = {
+            v.id: VerticalOut.model_validate(v)
+            for v in db.scalars(
+                select(Vertical).where(
+                    Vertical.id.in_({row.vertical_id for row in rows if row.vertical_id})
+                )
+            )
+        }
+        for app_out, row in zip(apps_out, rows):
+            app_out["app_vertical"] = verticals.get(row.vertical_id)
+
+    if "latest_executive_summary" in relations:
+        summaries = load_latest_app_exec_summaries(app_ids=app_ids, db=db)
+        for app_out in apps_out:
+            app_out["latest_executive_summary"] = summaries.get(app_out["id"])
+
+    return apps_out
+
 
-        apps = (
-            db.execute(
-                stmt.order_by(sort_column)
+def list_all_apps(db: Session, params: AppQueryParams, auth: AuthContext):
+    try:
+        stmt = select(Application).where(Application.is_active)
+        # Unfiltered summary comes from the maintained counters
+        apps_summary = read_apps_summary(db=db)
+
+        # Apply filters (role, vertical, priority, type, search, etc.)
+        stmt = apply_filters(stmt, params, auth, db=db)
+
+        # Every facet of the filtered set in one round trip
+        facets = compute_app_facets(db=db, filtered=stmt.subquery())
+        filtered_summary = apps_summary_from_facets(facets)
+
+        # Pagination & fetch applications
+        # id breaks ties so rows keep a stable order across pages
+        direction = desc if params.sort_order == "desc" else asc
+        if params.sort_by == "relevance":
+            if params.pagination == "cursor":
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail="Cursor pagination does not support relevance sort",
+                )
+            rank = (
+                search_rank(db=db, term=params.search, search_by=params.search_by)
+                if params.search and params.search != "null"
+                else literal(0)
+            )
+            order_by = (
+                desc(rank),
+                desc(Application.started_at),
+                desc(Application.id),
+            )
+        else:
+            order_by = (
+                direction(SORT_COLUMNS[params.sort_by]),
+                direction(Application.id),
+            )
+
+        if params.fields:
+            # Sparse fieldset: plain rows of the requested columns (plus the
+            # sort column for cursors), relations are batch loaded per page
+            extra = ["vertical_id"] if "app_vertical" in params.fields else []
+            if params.sort_by in SORT_COLUMNS:
+                extra.append(SORT_COLUMNS[params.sort_by].key)
+            stmt = stmt.with_only_columns(
+                *APP_LIST_FIELDS.select_columns(params.fields, extra=tuple(extra))
+            )
+        else:
+            # Two phases: page over narrow id rows, then hydrate just those
+            # ids, so eager loads never multiply the rows LIMIT counts
+            stmt = stmt.with_only_columns(Application.id)
+
+        has_more = False
+        next_cursor = None
+
+        if params.pagination == "cursor":
+            if params.cursor:
+                sort_value, last_id = _decode_cursor(params.cursor, params)
+                stmt = apply_keyset_filter(stmt, params, sort_value, last_id)
+
+            # one extra row tells us whether another page exists
+            rows = db.execute(
+                stmt.order_by(*order_by).limit(params.page_size + 1)
+            ).all()
+            has_more = len(rows) > params.page_size
+            rows = rows[: params.page_size]
+
+        else:
+            rows = db.execute(
+                stmt.order_by(*order_by)
                 .limit(params.page_size)
                 .offset(params.page * params.page_size - params.page_size)
-            )
-            .scalars()
-            .unique()
-            .all()
+            ).all()
+
+        apps = rows if params.fields else hydrate_apps([row.id for row in rows], db)
+
+        if has_more:
+            next_cursor = _encode_cursor(apps[-1], params)
+
+        if params.fields:
+            return {
+                "apps": _sparse_apps_out(rows=apps, params=params, db=db),
+                "apps_summary": apps_summary,
+                "filtered_apps_summary": filtered_summary,
+                "facets": facets,
+                "next_cursor": next_cursor,
+            }
+
+        is_exec = params.mode == "executive"
+        app_ids = [app.id for app in apps]
+        departments_by_app = (
+            load_departments_with_latest_exec_summary(app_ids=app_ids, db=db)
+            if is_exec
+            else load_departments_with_latest_comment(app_ids=app_ids, db=db)
         )
 
         apps_out = [
@@ -463,7 +561,8 @@ def list_all_apps(db: Session, params: AppQueryParams, current_user: User):
                 app,
                 db,
                 dept_filter_id=params.dept_filter_id,
-                is_exec=params.mode == "executive",
+                is_exec=is_exec,
+                departments_by_app=departments_by_app,
             )
             for app in apps
         ]
@@ -472,8 +571,13 @@ def list_all_apps(db: Session, params: AppQueryParams, current_user: User):
             "apps": apps_out,
             "apps_summary": apps_summary,
             "filtered_apps_summary": filtered_summary,
+            "facets": facets,
+            "next_cursor": next_cursor,
         }
 
+    except HTTPException:
+        raise
+
     except Exception as e:
         print("Error listing apps:", e)
         raise HTTPException(
@@ -602,7 +706,7 @@ def update_app(
         )
 
 
-def get_app_details(app_id: str, db: Session, current_user: User):
+def get_app_details(app_id: str, db: Session, auth: AuthContext):
     try:
         app = db.scalar(
             select(Application).where(Application.id == app_id, Application.is_active)
@@ -612,9 +716,8 @@ def get_app_details(app_id: str, db: Session, current_user: User):
                 status_code=status.HTTP_404_NOT_FOUND, detail=f"App not found {app_id}"
             )
 
-        if current_user.role in ["digital_head"]:
-            user_verticals = [v.id for v in current_user.verticals]
-            if app.vertical_id not in user_verticals:
+        if auth.role in ["digital_head"]:
+            if app.vertical_id not in auth.vertical_ids:
                 raise HTTPException(
                     status_code=status.HTTP_403_FORBIDDEN,
                     detail="Unauthorized to access this application",
@@ -32,6 +32,7 @@ from services.auth.microsoft_oauth import (
     verify_id_token,
 )
 from services.auth.deps import get_current_session
+from services.auth.session_cache import auth_cache
 
 load_dotenv()
 
@@ -467,9 +468,11 @@ def logout(
                 detail="CSRF token missing or invalid",
             )
 
+        logged_out_session_id = session.id
         db.delete(session)
 
         db.commit()
+        auth_cache.revoke_session(logged_out_session_id)
         return {"msg": "Logged out"}
 
     except HTTPException:
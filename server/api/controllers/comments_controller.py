@@ -6,6 +6,7 @@ from models import Application, Comment, ApplicationDepartments
 
 from schemas import comment_schemas as c_schemas
 from schemas.evidence_schemas import EvidenceOut
+from services.summaries.app_dept_pointers import record_new_comment
 from pydantic import BaseModel
 import os
 
@@ -59,6 +60,7 @@ def create_comment(payload: c_schemas.CommentInput, db: Session):
             status=status_,
         )
         db.add(new_comment)
+        record_new_comment(db=db, comment=new_comment)
         db.commit()
         db.refresh(new_comment)
         return new_comment
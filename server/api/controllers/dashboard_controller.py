@@ -1,5 +1,7 @@
 from collections import defaultdict
-from datetime import date, timedelta
+from concurrent.futures import ThreadPoolExecutor
+from time import perf_counter
+from typing import Any, Callable
 
 from fastapi import HTTPException, status
 from sqlalchemy import and_, case, func, select, table
@@ -7,8 +9,18 @@ from sqlalchemy.orm import Session
 
 from api.constants.priorities import PRIORITY_ID_TO_KEY
 from api.constants.statuses import ALL_APP_STATUSES, ALL_DEPT_STATUSES
+from db.config import Config
+from db.connection import SessionLocal
 from models import Application, ApplicationDepartments, Department
 from schemas import dashboard_schemas as ds
+from services.analytics.app_analytics import app_analytics
+from services.caching.aggregate_cache import cached_aggregate
+from services.summaries.cycle_times import compute_cycle_times
+from services.summaries.date_ranges import age_cutoffs, day_range, sla_range
+from .trend_controller import group_labels
+
+# Table groups (services/caching/data_versions.py) the aggregates read
+DASHBOARD_DATA_GROUPS = ("applications", "app_departments", "reference")
 
 
 # ---------- helpers ----------
@@ -53,9 +65,13 @@ def _apply_scope_filter(stmt, scope: str | None):
 # ---------- Application status summary ----------
 
 
+@cached_aggregate(*DASHBOARD_DATA_GROUPS)
 def get_app_status_summary(
     db: Session, params: ds.AppSummaryQueryParams | None
 ) -> ds.ApplicationSummary:
+    if app_analytics.enabled:
+        return app_analytics.get_app_status_summary(db, params)
+
     try:
         stmt = (
             select(
@@ -84,23 +100,11 @@ def get_app_status_summary(
                 )
 
             if params.app_age_from and params.app_age_to:
-                stmt = stmt.where(
-                    and_(
-                        Application.started_at.is_not(None),
-                        Application.started_at >= params.app_age_from,
-                    )
+                age_range = day_range(
+                    Application.started_at, params.app_age_from, params.app_age_to
                 )
-                count_stmt = count_stmt.where(
-                    and_(
-                        Application.started_at.is_not(None),
-                        Application.started_at >= params.app_age_from,
-                    )
-                )
-                if params.app_age_to:
-                    stmt = stmt.where(Application.started_at <= params.app_age_to)
-                    count_stmt = count_stmt.where(
-                        Application.started_at <= params.app_age_to
-                    )
+                stmt = stmt.where(*age_range)
+                count_stmt = count_stmt.where(*age_range)
 
         rows = db.execute(stmt).all()
 
@@ -134,9 +138,13 @@ def get_app_status_summary(
         )
 
 
+@cached_aggregate(*DASHBOARD_DATA_GROUPS)
 def get_department_status_summary(
     db: Session, params: ds.DeptSummaryQueryParams
 ) -> ds.DepartmentSummaryResponse:
+    if app_analytics.enabled:
+        return app_analytics.get_department_status_summary(db, params)
+
     try:
         stmt = (
             select(
@@ -190,18 +198,11 @@ def get_department_status_summary(
             )
 
         if params.app_age_from:
-            stmt = stmt.where(Application.started_at.is_not(None))
-
-            stmt = stmt.where(and_(Application.started_at >= params.app_age_from))
-            total_apps_stmt = total_apps_stmt.where(
-                and_(Application.started_at >= params.app_age_from)
+            age_range = day_range(
+                Application.started_at, params.app_age_from, params.app_age_to
             )
-
-            if params.app_age_to:
-                stmt = stmt.where(Application.started_at <= params.app_age_to)
-                total_apps_stmt = total_apps_stmt.where(
-                    Application.started_at <= params.app_age_to
-                )
+            stmt = stmt.where(*age_range)
+            total_apps_stmt = total_apps_stmt.where(*age_range)
 
         rows = db.execute(stmt).all()
 
@@ -251,7 +252,11 @@ def get_department_status_summary(
         )
 
 
+@cached_aggregate(*DASHBOARD_DATA_GROUPS)
 def get_priority_wise_grouped_summary(db: Session, status_filter: str | None):
+    if app_analytics.enabled:
+        return app_analytics.get_priority_wise_grouped_summary(db, status_filter)
+
     try:
         stmt = (
             select(
@@ -308,7 +313,11 @@ def get_priority_wise_grouped_summary(db: Session, status_filter: str | None):
         )
 
 
+@cached_aggregate(*DASHBOARD_DATA_GROUPS)
 def get_vertical_wise_app_statuses(db: Session, params: ds.VerticalWiseSummaryParams):
+    if app_analytics.enabled:
+        return app_analytics.get_vertical_wise_app_statuses(db, params)
+
     try:
         stmt = (
             select(
@@ -355,6 +364,7 @@ def get_vertical_wise_app_statuses(db: Session, params: ds.VerticalWiseSummaryPa
     return response
 
 
+@cached_aggregate(*DASHBOARD_DATA_GROUPS)
 def get_department_sub_category(
     db: Session,
     department_id: int,
@@ -389,33 +399,8 @@ def get_department_sub_category(
         if app_status and app_status != "all":
             stmt = stmt.where(Application.status == app_status)
 
-        today = date.today()
-
         if sla_filter and sla_filter > 0:
-            stmt = stmt.where(Application.started_at.is_not(None))
-
-            if sla_filter == 30:
-                stmt = stmt.where(
-                    func.date(Application.started_at) >= today - timedelta(days=30)
-                )
-            elif sla_filter == 60:
-                stmt = stmt.where(
-                    func.date(Application.started_at).between(
-                        today - timedelta(days=60),
-                        today - timedelta(days=30),
-                    )
-                )
-            elif sla_filter == 90:
-                stmt = stmt.where(
-                    func.date(Application.started_at).between(
-                        today - timedelta(days=90),
-                        today - timedelta(days=60),
-                    )
-                )
-            elif sla_filter == 91:
-                stmt = stmt.where(
-                    func.date(Application.started_at) < today - timedelta(days=90)
-                )
+            stmt = stmt.where(*sla_range(Application.started_at, sla_filter))
 
         rows = db.execute(stmt).all()
 
@@ -456,7 +441,11 @@ def get_department_sub_category(
         )
 
 
+@cached_aggregate(*DASHBOARD_DATA_GROUPS)
 def get_statuses_per_dept(db: Session, params: ds.StatusPerDepartmentParams):
+    if app_analytics.enabled:
+        return app_analytics.get_statuses_per_dept(db, params)
+
     try:
         stmt = (
             select(
@@ -489,40 +478,16 @@ def get_statuses_per_dept(db: Session, params: ds.StatusPerDepartmentParams):
                 stmt = stmt.where(Application.app_priority.in_(params.priority))
 
             if params.app_age_from:
-                stmt = stmt.where(Application.started_at.is_not(None))
-
-                stmt = stmt.where(and_(Application.started_at >= params.app_age_from))
-
-                if params.app_age_to:
-                    stmt = stmt.where(Application.started_at <= params.app_age_to)
-
-            # today = date.today()
+                stmt = stmt.where(
+                    *day_range(
+                        Application.started_at, params.app_age_from, params.app_age_to
+                    )
+                )
 
             # if params.sla_filter and params.sla_filter > 0:
-            #     stmt = stmt.where(Application.started_at.is_not(None))
-
-            #     if params.sla_filter == 30:
-            #         stmt = stmt.where(
-            #             func.date(Application.started_at) >= today - timedelta(days=30)
-            #         )
-            #     elif params.sla_filter == 60:
-            #         stmt = stmt.where(
-            #             func.date(Application.started_at).between(
-            #                 today - timedelta(days=60),
-            #                 today - timedelta(days=30),
-            #             )
-            #         )
-            #     elif params.sla_filter == 90:
-            #         stmt = stmt.where(
-            #             func.date(Application.started_at).between(
-            #                 today - timedelta(days=90),
-            #                 today - timedelta(days=60),
-            #             )
-            #         )
-            #     elif params.sla_filter == 91:
-            #         stmt = stmt.where(
-            #             func.date(Application.started_at) < today - timedelta(days=90)
-            #         )
+            #     stmt = stmt.where(
+            #         *sla_range(Application.started_at, params.sla_filter)
+            #     )
 
         rows = db.execute(stmt).all()
 
@@ -543,7 +508,81 @@ def get_statuses_per_dept(db: Session, params: ds.StatusPerDepartmentParams):
         )
 
 
+@cached_aggregate(*DASHBOARD_DATA_GROUPS)
+def get_status_matrix(
+    db: Session, params: ds.StatusMatrixParams
+) -> list[ds.StatusMatrixCell]:
+    """
+    Every (department, dept_status, app_status) count in one query. Each cell
+    equals get_statuses_per_dept for that pair, so the UI can slice it instead
+    of asking once per pair.
+    """
+    if app_analytics.enabled:
+        return app_analytics.get_status_matrix(db, params)
+
+    try:
+        # (application, department) is unique, so rows are distinct apps
+        stmt = (
+            select(
+                Department.id.label("department_id"),
+                Department.name.label("department"),
+                ApplicationDepartments.status.label("dept_status"),
+                Application.status.label("app_status"),
+                func.count().label("item_count"),
+            )
+            .select_from(ApplicationDepartments)
+            .join(Application, Application.id == ApplicationDepartments.application_id)
+            .join(Department, Department.id == ApplicationDepartments.department_id)
+            .where(
+                ApplicationDepartments.is_active,
+                ApplicationDepartments.status.is_not(None),
+                Application.status.is_not(None),
+            )
+            .group_by(
+                Department.id,
+                Department.name,
+                ApplicationDepartments.status,
+                Application.status,
+            )
+        )
+
+        if params.severity:
+            stmt = stmt.where(Application.severity.in_(params.severity))
+
+        if params.priority:
+            stmt = stmt.where(Application.app_priority.in_(params.priority))
+
+        if params.app_age_from:
+            stmt = stmt.where(
+                *day_range(
+                    Application.started_at, params.app_age_from, params.app_age_to
+                )
+            )
+
+        return [
+            ds.StatusMatrixCell(
+                department_id=row.department_id,
+                department=row.department,
+                dept_status=row.dept_status,
+                app_status=row.app_status,
+                count=row.item_count,
+            )
+            for row in db.execute(stmt)
+        ]
+
+    except Exception as e:
+        print("ERROR:", e)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Error fetching department status matrix",
+        )
+
+
+@cached_aggregate(*DASHBOARD_DATA_GROUPS)
 def get_app_types_summary(db: Session, params: ds.AppTypeSummaryParams):
+    if app_analytics.enabled:
+        return app_analytics.get_app_types_summary(db, params)
+
     stmt = select(
         Application.app_type,
         func.count(Application.id).label("total_count"),
@@ -565,12 +604,11 @@ def get_app_types_summary(db: Session, params: ds.AppTypeSummaryParams):
             stmt = stmt.where(Application.app_priority.in_(params.priority))
 
         if params.app_age_from:
-            stmt = stmt.where(Application.started_at.is_not(None))
-
-            stmt = stmt.where(and_(Application.started_at >= params.app_age_from))
-
-            if params.app_age_to:
-                stmt = stmt.where(Application.started_at <= params.app_age_to)
+            stmt = stmt.where(
+                *day_range(
+                    Application.started_at, params.app_age_from, params.app_age_to
+                )
+            )
 
         if params.app_status and params.app_status != "all":
             stmt = stmt.where(Application.status == params.app_status)
@@ -592,6 +630,7 @@ def get_app_types_summary(db: Session, params: ds.AppTypeSummaryParams):
     return transformed
 
 
+@cached_aggregate(*DASHBOARD_DATA_GROUPS)
 def get_vapt_summary(db: Session) -> ds.VAPTSummary:
     try:
         app_type_case = case(
@@ -661,6 +700,7 @@ def get_vapt_summary(db: Session) -> ds.VAPTSummary:
         )
 
 
+@cached_aggregate(*DASHBOARD_DATA_GROUPS)
 def get_vapt_summary_per_status(db: Session):
     try:
         stmt = (
@@ -723,33 +763,18 @@ def get_vapt_summary_per_status(db: Session):
         )
 
 
+@cached_aggregate(*DASHBOARD_DATA_GROUPS)
 def get_application_completion_stats(
     db: Session,
 ) -> list[ds.ApplicationCompletionStats]:
     try:
-        days_diff = func.datediff(func.now(), Application.completed_at)
+        # completed_at >= midnight n days ago <=> datediff(today, completed_at) <= n
+        within_30, within_60, within_90 = age_cutoffs([30, 60, 90])
 
         bucket_case = case(
-            (
-                and_(Application.completed_at.is_not(None), days_diff <= 30),
-                "0-30 days",
-            ),
-            (
-                and_(
-                    Application.completed_at.is_not(None),
-                    days_diff > 30,
-                    days_diff <= 60,
-                ),
-                "31-60 days",
-            ),
-            (
-                and_(
-                    Application.completed_at.is_not(None),
-                    days_diff > 60,
-                    days_diff <= 90,
-                ),
-                "61-90 days",
-            ),
+            (Application.completed_at >= within_30, "0-30 days"),
+            (Application.completed_at >= within_60, "31-60 days"),
+            (Application.completed_at >= within_90, "61-90 days"),
             else_="90+ days",
         )
 
@@ -770,6 +795,7 @@ def get_application_completion_stats(
         )
 
 
+@cached_aggregate(*DASHBOARD_DATA_GROUPS)
 def get_dept_completion_stats(db: Session, params: ds.DateRangeParams | None):
     try:
         stmt = (
@@ -790,19 +816,13 @@ def get_dept_completion_stats(db: Session, params: ds.DateRangeParams | None):
             .group_by(Department.name)
         )
         if params:
-            if params.from_date and params.to_date:
-                stmt = stmt.where(
-                    and_(
-                        ApplicationDepartments.ended_at.is_not(None),
-                        func.date(ApplicationDepartments.ended_at).between(
-                            params.from_date, params.to_date
-                        ),
-                    )
-                )
-
             if params.to_date:
                 stmt = stmt.where(
-                    func.date(ApplicationDepartments.ended_at) <= params.to_date
+                    *day_range(
+                        ApplicationDepartments.ended_at,
+                        params.from_date,
+                        params.to_date,
+                    )
                 )
         rows = db.execute(stmt).all()
 
@@ -815,3 +835,120 @@ def get_dept_completion_stats(db: Session, params: ds.DateRangeParams | None):
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Error fetching department completion statistics",
         )
+
+
+# ---------- Cycle times ----------
+
+
+@cached_aggregate(*DASHBOARD_DATA_GROUPS)
+def get_cycle_time_percentiles(
+    db: Session, params: ds.CycleTimeParams
+) -> list[ds.CycleTimeStats]:
+    try:
+        if params.level == "application" and params.group_by == "department":
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Application cycle times can't be split by department",
+            )
+
+        stats = compute_cycle_times(db, params)
+        labels = group_labels(db, params.group_by, stats.keys())
+
+        return [
+            ds.CycleTimeStats(
+                key=None if key is None else str(key),
+                label=labels.get(key),
+                count=count,
+                p50_days=round(p50, 2),
+                p90_days=round(p90, 2),
+                p99_days=round(p99, 2),
+            )
+            for key, (count, p50, p90, p99) in sorted(
+                stats.items(), key=lambda item: str(item[0])
+            )
+        ]
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        print("ERROR:", e)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Error fetching cycle time percentiles",
+        )
+
+
+# ---------- Dashboard bundle ----------
+
+# The widgets share nothing, so each one runs on its own pooled connection.
+# The executor is shared by all bundle requests and stays well under the pool
+# size, so a burst of dashboard loads queues here instead of draining the pool.
+_bundle_executor = ThreadPoolExecutor(
+    max_workers=max(1, min(4, Config.POOL_SIZE // 2)),
+    thread_name_prefix="dashboard-bundle",
+)
+
+
+def _bundle_widgets(
+    params: ds.DashboardBundleParams,
+) -> dict[str, Callable[[Session], Any]]:
+    filters = {
+        "severity": params.severity,
+        "priority": params.priority,
+        "app_age_from": params.app_age_from,
+        "app_age_to": params.app_age_to,
+    }
+    dates = ds.DateRangeParams(from_date=params.from_date, to_date=params.to_date)
+
+    return {
+        "applications": lambda db: get_app_status_summary(
+            db, ds.AppSummaryQueryParams(**filters, scope=params.scope)
+        ),
+        "departments": lambda db: get_department_status_summary(
+            db, ds.DeptSummaryQueryParams(**filters, status=None, scope=params.scope)
+        ),
+        "priority_wise": lambda db: get_priority_wise_grouped_summary(
+            db, status_filter=None
+        ),
+        "vertical_wise": lambda db: get_vertical_wise_app_statuses(
+            db, ds.VerticalWiseSummaryParams(scope=params.scope)
+        ),
+        "app_types": lambda db: get_app_types_summary(
+            db, ds.AppTypeSummaryParams(**filters, scope=params.scope, app_status=None)
+        ),
+        "vapt": get_vapt_summary,
+        "vapt_per_status": get_vapt_summary_per_status,
+        "completion": get_application_completion_stats,
+        "dept_completions": lambda db: get_dept_completion_stats(db, dates),
+    }
+
+
+def _run_widget(widget: Callable[[Session], Any]) -> tuple[Any, float]:
+    started = perf_counter()
+    db = SessionLocal()
+    try:
+        return widget(db), (perf_counter() - started) * 1000
+    finally:
+        db.close()
+
+
+def get_dashboard_bundle(
+    params: ds.DashboardBundleParams,
+) -> tuple[dict[str, Any], dict[str, float]]:
+    """
+    Compute every dashboard widget concurrently.
+
+    Returns the widget payloads keyed by name and the time each one took in
+    milliseconds. The first widget to fail raises its HTTPException.
+    """
+    futures = {
+        name: _bundle_executor.submit(_run_widget, widget)
+        for name, widget in _bundle_widgets(params).items()
+    }
+
+    data: dict[str, Any] = {}
+    timings: dict[str, float] = {}
+    for name, future in futures.items():
+        data[name], timings[name] = future.result()
+
+    return data, timings
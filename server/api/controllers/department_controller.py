@@ -160,11 +160,7 @@ def get_departments_by_application(app_id: str, db: Session):
         raise HTTPException(500, f"Failed to load departments: {str(e)}")
 
 
-def get_departments_with_latest_comment(
-    app_id: str, db: Session
-) -> list[d_schemas.AppDeptOutWithLatestComment]:
-    print("APP ID", app_id)
-    # 1️⃣ Get assigned departments with ApplicationDepartments info
+def _get_app_departments_for_apps(app_ids: list[str], db: Session, *options) -> dict:
     stmt = (
         select(Department, ApplicationDepartments)
         .join(
@@ -173,161 +169,137 @@ def get_departments_with_latest_comment(
         )
         .where(
             and_(
-                ApplicationDepartments.application_id == app_id,
+                ApplicationDepartments.application_id.in_(app_ids),
                 ApplicationDepartments.is_active,
             )
         )
+        .options(*options)
     )
 
-    departments = db.execute(stmt).all()
+    departments_by_app: dict[str, list] = {}
+    for dep, app_dept in db.execute(stmt).all():
+        departments_by_app.setdefault(app_dept.application_id, []).append(
+            (dep, app_dept)
+        )
 
-    if not departments:
-        # Check if application exists
-        if not db.get(Application, app_id):
-            raise HTTPException(status_code=404, detail="Application not found")
-        return []
+    return departments_by_app
 
-    dept_ids = [dep.id for dep, _ in departments]
 
-    # 2️⃣ Load latest comment per department using a subquery
-    subq = (
-        select(
-            Comment.department_id,
-            Comment.application_id,
-            func.max(Comment.created_at).label("latest_created"),
-        )
-        .where(Comment.department_id.in_(dept_ids), Comment.application_id == app_id)
-        .group_by(Comment.department_id, Comment.application_id)
-        .subquery()
-    )
+def load_departments_with_latest_comment(
+    app_ids: list[str], db: Session
+) -> dict[str, list[d_schemas.AppDeptOutWithLatestComment]]:
+    """
+    Page level loader: departments and the latest comment per department for
+    every app id in `app_ids`, in one query via latest_comment_id.
+    """
+    if not app_ids:
+        return {}
 
-    comments_stmt = (
-        select(Comment)
-        .join(
-            subq,
-            and_(
-                Comment.department_id == subq.c.department_id,
-                Comment.application_id == subq.c.application_id,
-                Comment.created_at == subq.c.latest_created,
-            ),
-        )
-        .options(joinedload(Comment.author))  # eager load author
+    departments_by_app = _get_app_departments_for_apps(
+        app_ids,
+        db,
+        joinedload(ApplicationDepartments.latest_comment).joinedload(Comment.author),
     )
 
-    latest_comments = db.execute(comments_stmt).scalars().all()
-    comment_map = {c.department_id: c for c in latest_comments}
-
-    # 3️⃣ Combine into Pydantic models
-    results: list[d_schemas.AppDeptOutWithLatestComment] = []
-    for dep, app_dept in departments:
-        latest_comment = comment_map.get(dep.id)
-        results.append(
-            d_schemas.AppDeptOutWithLatestComment(
-                id=dep.id,
-                name=dep.name,
-                description=dep.description,
-                status=app_dept.status,
-                started_at=app_dept.started_at,
-                ended_at=app_dept.ended_at,
-                app_category=app_dept.app_category,
-                category_status=app_dept.category_status,
-                go_live_at=app_dept.go_live_at,
-                latest_comment=d_schemas.DeptLatestComment.model_validate(
-                    latest_comment
+    results: dict[str, list[d_schemas.AppDeptOutWithLatestComment]] = {}
+    for app_id, departments in departments_by_app.items():
+        app_results = results.setdefault(app_id, [])
+        for dep, app_dept in departments:
+            latest_comment = app_dept.latest_comment
+            app_results.append(
+                d_schemas.AppDeptOutWithLatestComment(
+                    id=dep.id,
+                    name=dep.name,
+                    description=dep.description,
+                    status=app_dept.status,
+                    started_at=app_dept.started_at,
+                    ended_at=app_dept.ended_at,
+                    app_category=app_dept.app_category,
+                    category_status=app_dept.category_status,
+                    go_live_at=app_dept.go_live_at,
+                    latest_comment=d_schemas.DeptLatestComment.model_validate(
+                        latest_comment
+                    )
+                    if latest_comment
+                    else None,
                 )
-                if latest_comment
-                else None,
             )
-        )
 
     return results
 
 
-def get_departments_with_latest_exec_sumary(
-    app_id: str, db: Session
-) -> list[d_schemas.AppDeptWithLatestExecSummary]:
+def load_departments_with_latest_exec_summary(
+    app_ids: list[str], db: Session
+) -> dict[str, list[d_schemas.AppDeptWithLatestExecSummary]]:
+    """
+    Page level loader: departments and the latest department scoped executive
+    summary for every app id in `app_ids`, in one query via
+    latest_exec_summary_id.
+    """
+    if not app_ids:
+        return {}
+
+    departments_by_app = _get_app_departments_for_apps(
+        app_ids,
+        db,
+        joinedload(ApplicationDepartments.latest_exec_summary).joinedload(
+            ExecutiveSummary.author
+        ),
+    )
 
-    stmt = (
-        select(Department, ApplicationDepartments)
-        .join(
-            ApplicationDepartments,
-            Department.id == ApplicationDepartments.department_id,
-        )
-        .where(
-            and_(
-                ApplicationDepartments.application_id == app_id,
-                ApplicationDepartments.is_active,
+    results: dict[str, list[d_schemas.AppDeptWithLatestExecSummary]] = {}
+    for app_id, departments in departments_by_app.items():
+        app_results = results.setdefault(app_id, [])
+        for dep, app_dept in departments:
+            latest_exec_summary = app_dept.latest_exec_summary
+            app_results.append(
+                d_schemas.AppDeptWithLatestExecSummary(
+                    id=dep.id,
+                    name=dep.name,
+                    description=dep.description,
+                    status=app_dept.status,
+                    started_at=app_dept.started_at,
+                    ended_at=app_dept.ended_at,
+                    app_category=app_dept.app_category,
+                    category_status=app_dept.category_status,
+                    go_live_at=app_dept.go_live_at,
+                    latest_exec_summary=d_schemas.DeptLatestExecSUmmary.model_validate(
+                        latest_exec_summary
+                    )
+                    if latest_exec_summary
+                    else None,
+                )
             )
-        )
-    )
 
-    departments = db.execute(stmt).all()
+    return results
+
+
+def get_departments_with_latest_comment(
+    app_id: str, db: Session
+) -> list[d_schemas.AppDeptOutWithLatestComment]:
+    results = load_departments_with_latest_comment(app_ids=[app_id], db=db)
 
-    if not departments:
+    if not results:
         # Check if application exists
         if not db.get(Application, app_id):
             raise HTTPException(status_code=404, detail="Application not found")
         return []
 
-    dept_ids = [dep.id for dep, _ in departments]
+    return results[app_id]
 
-    # 2️⃣ Load latest comment per department using a subquery
-    subq = (
-        select(
-            ExecutiveSummary.department_id,
-            ExecutiveSummary.application_id,
-            func.max(ExecutiveSummary.created_at).label("latest_created"),
-        )
-        .where(
-            ExecutiveSummary.department_id.in_(dept_ids),
-            ExecutiveSummary.application_id == app_id,
-            ExecutiveSummary.scope == "department",
-        )
-        .group_by(ExecutiveSummary.department_id, ExecutiveSummary.application_id)
-        .subquery()
-    )
 
-    exec_stmt = (
-        select(ExecutiveSummary)
-        .join(
-            subq,
-            and_(
-                ExecutiveSummary.department_id == subq.c.department_id,
-                ExecutiveSummary.application_id == subq.c.application_id,
-                ExecutiveSummary.created_at == subq.c.latest_created,
-                ExecutiveSummary.scope == "department",
-            ),
-        )
-        .options(joinedload(ExecutiveSummary.author))  # eager load author
-    )
+def get_departments_with_latest_exec_sumary(
+    app_id: str, db: Session
+) -> list[d_schemas.AppDeptWithLatestExecSummary]:
+    results = load_departments_with_latest_exec_summary(app_ids=[app_id], db=db)
 
-    latest_exec_summaries = db.execute(exec_stmt).scalars().all()
-    exec_summary_map = {c.department_id: c for c in latest_exec_summaries}
-
-    # 3️⃣ Combine into Pydantic models
-    results: list[d_schemas.AppDeptWithLatestExecSummary] = []
-    for dep, app_dept in departments:
-        latest_exec_summary = exec_summary_map.get(dep.id)
-        results.append(
-            d_schemas.AppDeptWithLatestExecSummary(
-                id=dep.id,
-                name=dep.name,
-                description=dep.description,
-                status=app_dept.status,
-                started_at=app_dept.started_at,
-                ended_at=app_dept.ended_at,
-                app_category=app_dept.app_category,
-                category_status=app_dept.category_status,
-                go_live_at=app_dept.go_live_at,
-                latest_exec_summary=d_schemas.DeptLatestExecSUmmary.model_validate(
-                    latest_exec_summary
-                )
-                if latest_exec_summary
-                else None,
-            )
-        )
+    if not results:
+        # Check if application exists
+        if not db.get(Application, app_id):
+            raise HTTPException(status_code=404, detail="Application not found")
+        return []
 
-    return results
+    return results[app_id]
 
 
 def add_user_to_department(
@@ -1,9 +1,10 @@
 from fastapi import HTTPException, status
-from sqlalchemy import select, and_, desc
-from sqlalchemy.orm import Session, selectinload
+from sqlalchemy import select, and_, desc, func
+from sqlalchemy.orm import Session, selectinload, joinedload
 from models import ExecutiveSummary, Application, ApplicationDepartments, User
 from schemas import exec_summary_schemas as exec_schemas
 from sqlalchemy.exc import IntegrityError
+from services.summaries.app_dept_pointers import record_new_exec_summary
 from datetime import datetime, timezone, timedelta
 
 
@@ -11,6 +12,7 @@ def create_app_exec_summary(db: Session, payload: exec_schemas.ExecSummaryInput)
     try:
         new_exec_summary = ExecutiveSummary(**payload.model_dump())
         db.add(new_exec_summary)
+        record_new_exec_summary(db=db, exec_summary=new_exec_summary)
         db.commit()
         db.refresh(new_exec_summary)
 
@@ -30,6 +32,40 @@ def create_app_exec_summary(db: Session, payload: exec_schemas.ExecSummaryInput)
         )
 
 
+def load_latest_app_exec_summaries(
+    app_ids: list[str], db: Session
+) -> dict[str, exec_schemas.ExecSummaryOut]:
+    """Latest application scoped executive summary per app, in one query."""
+    if not app_ids:
+        return {}
+
+    ranked = (
+        select(
+            ExecutiveSummary.id.label("exec_summary_id"),
+            func.row_number()
+            .over(
+                partition_by=ExecutiveSummary.application_id,
+                order_by=(ExecutiveSummary.created_at.desc(), ExecutiveSummary.id.desc()),
+            )
+            .label("rn"),
+        )
+        .where(
+            ExecutiveSummary.application_id.in_(app_ids),
+            ExecutiveSummary.scope == "application",
+        )
+        .subquery()
+    )
+
+    latest = db.scalars(
+        select(ExecutiveSummary)
+        .join(ranked, ExecutiveSummary.id == ranked.c.exec_summary_id)
+        .where(ranked.c.rn == 1)
+        .options(joinedload(ExecutiveSummary.author))
+    ).all()
+
+    return {e.application_id: exec_schemas.ExecSummaryOut.model_validate(e) for e in latest}
+
+
 def get_application_exec_summary(app_id: str, db: Session):
     try:
         app = db.get(Application, app_id)
@@ -1,89 +1,115 @@
-from models import Application, ApplicationDepartments, Department
-from sqlalchemy import select
+from models import Application, ApplicationDepartments, Comment, Department
+from sqlalchemy import func, select
 from sqlalchemy.orm import Session
 from fastapi import HTTPException, status
-from fastapi.responses import FileResponse
-from .comments_controller import get_latest_app_dept_comment
-import csv
+from fastapi.responses import FileResponse, StreamingResponse
 from collections import defaultdict
-
+from collections.abc import Callable, Iterator
+from datetime import datetime
+from itertools import groupby
+from types import SimpleNamespace
 import os
-import zipfile
-import tempfile
-
 
-def get_departments_by_application_dict(app_id: str, db: Session) -> dict:
-    stmt = (
-        select(Department, ApplicationDepartments.status)
-        .join(ApplicationDepartments)
-        .where(ApplicationDepartments.application_id == app_id)
-    )
+from schemas.export_schemas import ExportJobCreate, ExportJobOut
 
-    results = db.execute(stmt).all()
-
-    if not results:
-        exists = db.get(Application, app_id)
-        if not exists:
-            raise HTTPException(404, "Application not found")
-
-    departments = {}
-
-    for dep, status_ in results:
-        comment = get_latest_app_dept_comment(app_id=app_id, dept_id=dep.id, db=db)
-
-        departments[dep.name] = {
-            "status": status_,
-            "comment": comment.content if comment else "",
-        }
-
-    return departments
+from services.exports.change_feed import (
+    CHANGE_FEED_ENTITIES,
+    InvalidWatermark,
+    iter_changes,
+    parse_since,
+)
+from services.exports.csv_stream import attachment_headers, iter_csv
+from services.exports.export_jobs import ExportJob, ExportType, export_jobs
+from services.exports.xlsx_stream import XLSX_MEDIA_TYPE, Sheet, iter_xlsx
+from services.exports.zip_stream import iter_zip
+from services.projections.fieldsets import APP_EXPORT_FIELDS
 
 
 def get_all_department_names(db: Session) -> list[str]:
-    dept_names = db.scalars(select(Department.name)).all()
+    dept_names = db.scalars(select(Department.name).order_by(Department.id)).all()
     return [name for name in dept_names]
 
 
+# the whole overview, in the order the export has always had
+OVERVIEW_FIELDS = [
+    *(name for name in APP_EXPORT_FIELDS.columns if name != APP_EXPORT_FIELDS.key),
+    "departments",
+]
+
+
 def build_application_csv_row(
-    app: Application, departments: dict, all_departments: list[str]
+    app, departments: dict, all_departments: list[str], fields: list[str]
 ) -> dict:
-    row = {
-        "application_name": app.name,
-        "description": app.description,
-        "environment": app.environment,
-        "region": app.region,
-        "vendor_company": app.vendor_company,
-        "app_priority": app.app_priority,
-        "app_technology": app.app_tech,
-        "vertical": app.vertical,
-        "imitra_ticket_id": app.imitra_ticket_id,
-        "overall_status": app.status,
-        "titan_spoc": app.titan_spoc,
-        "start_date": app.started_at,
-        "app_url": app.app_url,
-        "user_type": app.user_type,
-        "data_type": app.data_type,
-    }
-
-    for dept_name in all_departments:
-        row[f"{dept_name}_status"] = departments.get(dept_name, {}).get("status", "")
-        row[f"{dept_name}_comment"] = departments.get(dept_name, {}).get("comment", "")
+    row = {}
+    for field in fields:
+        if field != "departments":
+            row[field] = getattr(app, field)
+            continue
+        for dept_name in all_departments:
+            row[f"{dept_name}_status"] = departments.get(dept_name, {}).get("status", "")
+            row[f"{dept_name}_comment"] = departments.get(dept_name, {}).get("comment", "")
 
     return row
 
 
-def export_application_overview_rows(db: Session) -> list[dict]:
-    applications = db.scalars(select(Application)).all()
-    all_departments = get_all_department_names(db)
+OVERVIEW_YIELD_PER = 1000
 
-    rows = []
 
-    for app in applications:
-        departments = get_departments_by_application_dict(app_id=app.id, db=db)
+def application_overview_columns(
+    all_departments: list[str], fields: list[str] = OVERVIEW_FIELDS
+) -> list[str]:
+    empty = build_application_csv_row(
+        SimpleNamespace(**dict.fromkeys(fields)), {}, all_departments, fields
+    )
+    return list(empty)
+
+
+def iter_application_overview_rows(
+    db: Session, all_departments: list[str], fields: list[str] = OVERVIEW_FIELDS
+) -> Iterator[dict]:
+    """
+    One overview row per application, streamed.
+
+    A single query returns one row per (application, department) with the
+    latest comment via the latest_comment_id pointer, ordered by application
+    so consecutive rows can be folded into one CSV row. yield_per keeps it
+    on a server side cursor, so only OVERVIEW_YIELD_PER rows are in memory.
+    Only the requested `fields` are selected, and departments are only
+    joined when they are one of them.
+    """
+    key = APP_EXPORT_FIELDS.key
+    with_departments = bool(APP_EXPORT_FIELDS.relations_in(fields))
+    stmt = select(*APP_EXPORT_FIELDS.select_columns(fields, extra=(key,)))
+    if with_departments:
+        stmt = (
+            stmt.add_columns(
+                Department.name.label("department"),
+                ApplicationDepartments.status.label("department_status"),
+                Comment.content.label("comment"),
+            )
+            .outerjoin(
+                ApplicationDepartments,
+                ApplicationDepartments.application_id == Application.id,
+            )
+            .outerjoin(
+                Department, Department.id == ApplicationDepartments.department_id
+            )
+            .outerjoin(Comment, Comment.id == ApplicationDepartments.latest_comment_id)
+        )
+    stmt = stmt.order_by(Application.id).execution_options(
+        yield_per=OVERVIEW_YIELD_PER
+    )
 
-        rows.append(build_application_csv_row(app, departments, all_departments))
+    for _, app_rows in groupby(db.execute(stmt), key=lambda row: getattr(row, key)):
+        departments = {}
+        for row in app_rows:
+            if with_departments and row.department is not None:
+                departments[row.department] = {
+                    "status": row.department_status,
+                    "comment": row.comment or "",
+                }
 
-    return rows
+        yield build_application_csv_row(row, departments, all_departments, fields)
 
 
 def safe_filename(name: str) -> str:
@@ -151,83 +177,159 @@ def get_vertical_applications(db: Session):
         )
 
 
-def export_vertical_applications_zip(db: Session):
-    try:
-        stmt = (
-            select(
-                Application.vertical,
-                Application.name.label("app_name"),
-                Application.status.label("app_status"),
-                Department.name.label("department"),
-                ApplicationDepartments.status.label("department_status"),
-            )
-            .join(
-                ApplicationDepartments,
-                Application.id == ApplicationDepartments.application_id,
-            )
-            .join(Department, Department.id == ApplicationDepartments.department_id)
-        )
+def _vertical_key():
+    return func.coalesce(func.nullif(Application.vertical, ""), "Unknown")
 
-        rows = db.execute(stmt).all()
 
-        # ---------------------------------------
-        # 1. Organize data
-        # ---------------------------------------
-        vertical_data = defaultdict(lambda: defaultdict(dict))
-        all_departments = set()
+def _vertical_departments(db: Session) -> list[str]:
+    return db.scalars(
+        select(Department.name)
+        .select_from(Application)
+        .join(
+            ApplicationDepartments,
+            Application.id == ApplicationDepartments.application_id,
+        )
+        .join(Department, Department.id == ApplicationDepartments.department_id)
+        .distinct()
+        .order_by(Department.name)
+    ).all()
 
-        for row in rows:
-            vertical = row.vertical or "Unknown"
-            app = row.app_name
 
-            vertical_data[vertical][app]["app_status"] = row.app_status
-            vertical_data[vertical][app].setdefault("departments", {})
-            vertical_data[vertical][app]["departments"][row.department] = (
-                row.department_status
-            )
+def _vertical_columns(departments: list[str]) -> list[str]:
+    return ["App Name", "App Status", *departments]
 
-            all_departments.add(row.department)
 
-        departments = sorted(all_departments)
+def _iter_vertical_rows(db: Session, departments: list[str]):
+    """(vertical, row dicts) per vertical from one streamed, ordered query."""
+    vertical = _vertical_key().label("vertical")
+    stmt = (
+        select(
+            vertical,
+            Application.id,
+            Application.name.label("app_name"),
+            Application.status.label("app_status"),
+            Department.name.label("department"),
+            ApplicationDepartments.status.label("department_status"),
+        )
+        .join(
+            ApplicationDepartments,
+            Application.id == ApplicationDepartments.application_id,
+        )
+        .join(Department, Department.id == ApplicationDepartments.department_id)
+        .order_by(vertical, Application.name, Application.id)
+        .execution_options(yield_per=OVERVIEW_YIELD_PER)
+    )
 
-        # ---------------------------------------
-        # 2. Create temp directory & ZIP
-        # ---------------------------------------
-        temp_dir = tempfile.mkdtemp()
-        zip_path = os.path.join(temp_dir, "applications_by_vertical.zip")
+    def vertical_rows(rows):
+        for _, app_rows in groupby(rows, key=lambda row: row.id):
+            app_rows = list(app_rows)
+            statuses = {row.department: row.department_status for row in app_rows}
+            yield {
+                "App Name": app_rows[0].app_name,
+                "App Status": app_rows[0].app_status,
+                **{dept: statuses.get(dept, "N/A") for dept in departments},
+            }
 
-        with zipfile.ZipFile(zip_path, "w", zipfile.ZIP_DEFLATED) as zipf:
-            for vertical, apps in vertical_data.items():
-                safe_vertical = safe_filename(vertical)
-                csv_file = os.path.join(temp_dir, f"{safe_vertical}.csv")
+    for name, rows in groupby(db.execute(stmt), key=lambda row: row.vertical):
+        yield name, vertical_rows(rows)
 
-                with open(csv_file, mode="w", newline="", encoding="utf-8") as f:
-                    writer = csv.writer(f)
 
-                    # Header
-                    writer.writerow(["App Name", "App Status", *departments])
+# ---------- Export bodies ----------
+# db -> chunks; the eager queries run before the first chunk
 
-                    # Rows
-                    for app_name, app_data in apps.items():
-                        row = [
-                            app_name,
-                            app_data["app_status"],
-                        ]
 
-                        for dept in departments:
-                            row.append(app_data["departments"].get(dept, "N/A"))
+def application_overview_csv(
+    db: Session, fields: list[str] = OVERVIEW_FIELDS
+) -> Iterator[str]:
+    all_departments = get_all_department_names(db)
+    rows = iter_application_overview_rows(db, all_departments, fields)
+    return iter_csv(application_overview_columns(all_departments, fields), rows)
 
-                        writer.writerow(row)
 
-                zipf.write(csv_file, arcname=f"{vertical}.csv")
+def application_overview_xlsx(
+    db: Session, fields: list[str] = OVERVIEW_FIELDS
+) -> Iterator[bytes]:
+    all_departments = get_all_department_names(db)
+    columns = application_overview_columns(all_departments, fields)
+    widths = {"application_name": 40, "description": 60, "app_url": 40}
+    for dept_name in all_departments:
+        widths[f"{dept_name}_status"] = 18
+        widths[f"{dept_name}_comment"] = 50
+    rows = iter_application_overview_rows(db, all_departments, fields)
+    return iter_xlsx([Sheet("Applications", columns, rows, widths)])
+
+
+def vertical_applications_zip(db: Session) -> Iterator[bytes]:
+    """
+    One CSV per vertical in a ZIP that is compressed while it is sent. Rows
+    are read with yield_per and written entry by entry, so nothing goes to
+    disk and memory stays at a CSV chunk however large the export is.
+    """
+    departments = _vertical_departments(db)
+    columns = _vertical_columns(departments)
+    entries = (
+        (f"{safe_filename(name)}.csv", iter_csv(columns, rows))
+        for name, rows in _iter_vertical_rows(db, departments)
+    )
+    return iter_zip(entries)
+
 
-        # ---------------------------------------
-        # 3. Return ZIP file
-        # ---------------------------------------
-        return FileResponse(
-            path=zip_path,
-            filename="applications_by_vertical.zip",
-            media_type="application/zip",
+def vertical_applications_xlsx(db: Session) -> Iterator[bytes]:
+    """The ZIP export as one workbook, a sheet per vertical."""
+    departments = _vertical_departments(db)
+    columns = _vertical_columns(departments)
+    widths = {"App Name": 40, **{dept: 18 for dept in departments}}
+    sheets = (
+        Sheet(name, columns, rows, widths)
+        for name, rows in _iter_vertical_rows(db, departments)
+    )
+    return iter_xlsx(sheets)
+
+
+OVERVIEW_DATA_GROUPS = ("applications", "app_departments", "comments", "reference")
+VERTICAL_DATA_GROUPS = ("applications", "app_departments", "reference")
+
+EXPORT_TYPES = {
+    "applications_csv": ExportType(
+        "is_assessment_all_applications.csv",
+        "text/csv",
+        OVERVIEW_DATA_GROUPS,
+        application_overview_csv,
+    ),
+    "applications_xlsx": ExportType(
+        "is_assessment_all_applications.xlsx",
+        XLSX_MEDIA_TYPE,
+        OVERVIEW_DATA_GROUPS,
+        application_overview_xlsx,
+    ),
+    "verticals_zip": ExportType(
+        "applications_by_vertical.zip",
+        "application/zip",
+        VERTICAL_DATA_GROUPS,
+        vertical_applications_zip,
+    ),
+    "verticals_xlsx": ExportType(
+        "applications_by_vertical.xlsx",
+        XLSX_MEDIA_TYPE,
+        VERTICAL_DATA_GROUPS,
+        vertical_applications_xlsx,
+    ),
+}
+
+for _name, _export_type in EXPORT_TYPES.items():
+    export_jobs.register(_name, _export_type)
+
+
+def stream_export(
+    db: Session, export_type: str, fields: list[str] | None = None
+) -> StreamingResponse:
+    """`fields` projects the overview exports; the job queue only builds full ones."""
+    try:
+        export = EXPORT_TYPES[export_type]
+        return StreamingResponse(
+            export.build(db) if fields is None else export.build(db, fields),
+            media_type=export.media_type,
+            headers=attachment_headers(export.filename),
         )
 
     except Exception as e:
@@ -236,3 +338,104 @@ def export_vertical_applications_zip(db: Session):
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Error exporting applications",
         )
+
+
+# ---------- Export jobs ----------
+
+
+def _export_job_out(job: ExportJob, download_url: str) -> ExportJobOut:
+    return ExportJobOut(
+        id=job.id,
+        export_type=job.export_type,
+        status=job.status,
+        cached=job.cached,
+        bytes_written=job.bytes_written,
+        error=job.error,
+        created_at=datetime.fromtimestamp(job.created_at),
+        finished_at=(
+            datetime.fromtimestamp(job.finished_at) if job.finished_at else None
+        ),
+        download_url=download_url if job.status == "done" else None,
+    )
+
+
+def _get_job_or_404(job_id: str) -> ExportJob:
+    job = export_jobs.get(job_id)
+    if job is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Export job not found"
+        )
+    return job
+
+
+def create_export_job(
+    db: Session, payload: ExportJobCreate, download_url: Callable[[str], str]
+) -> ExportJobOut:
+    try:
+        job = export_jobs.submit(db, payload.export_type)
+        return _export_job_out(job, download_url(job.id))
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        print("ERROR:", e)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Error creating export job",
+        )
+
+
+def get_export_job(job_id: str, download_url: Callable[[str], str]) -> ExportJobOut:
+    job = _get_job_or_404(job_id)
+    return _export_job_out(job, download_url(job.id))
+
+
+def get_export_job_file(job_id: str) -> FileResponse:
+    job = _get_job_or_404(job_id)
+    if job.status != "done":
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT, detail="Export is not ready yet"
+        )
+    if not os.path.exists(job.path):
+        raise HTTPException(
+            status_code=status.HTTP_410_GONE,
+            detail="Export file has expired, please export again",
+        )
+
+    return FileResponse(
+        path=job.path, filename=job.filename, media_type=job.media_type
+    )
+
+
+# ---------- Change feed ----------
+
+
+def stream_changes(
+    db: Session, since: str | None, entities: list[str], limit: int
+) -> StreamingResponse:
+    try:
+        unknown = [entity for entity in entities if entity not in CHANGE_FEED_ENTITIES]
+        if unknown:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Unknown entities: {', '.join(unknown)}",
+            )
+
+        try:
+            cursors = parse_since(since)
+        except InvalidWatermark as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+        return StreamingResponse(
+            iter_changes(db, cursors, entities, limit),
+            media_type="application/x-ndjson",
+        )
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        print("ERROR:", e)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Error exporting changes",
+        )
@@ -0,0 +1,165 @@
+from collections import Counter, defaultdict
+from datetime import date
+
+from fastapi import HTTPException, status
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from api.constants.priorities import PRIORITY_ID_TO_KEY
+from api.constants.statuses import ALL_APP_STATUSES, ALL_DEPT_STATUSES
+from models import AppStatusSnapshot, Department, Vertical
+from schemas import dashboard_schemas as ds
+
+# Trends read only app_status_snapshots (see services/summaries/status_snapshots.py)
+
+GROUP_COLUMNS = {
+    "vertical": AppStatusSnapshot.vertical_id,
+    "priority": AppStatusSnapshot.app_priority,
+    "severity": AppStatusSnapshot.severity,
+    "scope": AppStatusSnapshot.scope,
+    "department": AppStatusSnapshot.department_id,
+}
+
+
+def _period(day: date, interval: str):
+    if interval == "month":
+        return (day.year, day.month)
+    if interval == "week":
+        return day.isocalendar()[:2]
+    return day
+
+
+def group_labels(db: Session, group_by: str | None, keys) -> dict:
+    if group_by == "vertical":
+        names = dict(db.execute(select(Vertical.id, Vertical.name)).all())
+        return {key: names.get(key, "Unassigned") for key in keys}
+    if group_by == "department":
+        names = dict(db.execute(select(Department.id, Department.name)).all())
+        return {key: names.get(key) for key in keys}
+    if group_by == "priority":
+        return {key: PRIORITY_ID_TO_KEY.get(key) for key in keys}
+    return {key: None if key is None else str(key) for key in keys}
+
+
+def _status_trend(
+    db: Session,
+    params: ds.TrendQueryParams,
+    status_column,
+    all_statuses: list[str],
+    *criteria,
+) -> list[ds.TrendSeries]:
+    group_column = GROUP_COLUMNS.get(params.group_by)
+    columns = [AppStatusSnapshot.snapshot_date, status_column]
+    if group_column is not None:
+        columns.append(group_column)
+
+    stmt = (
+        select(*columns, func.sum(AppStatusSnapshot.item_count))
+        .where(*criteria)
+        .group_by(*columns)
+    )
+
+    if params.from_date:
+        stmt = stmt.where(AppStatusSnapshot.snapshot_date >= params.from_date)
+    if params.to_date:
+        stmt = stmt.where(AppStatusSnapshot.snapshot_date <= params.to_date)
+    if params.vertical_ids:
+        stmt = stmt.where(AppStatusSnapshot.vertical_id.in_(params.vertical_ids))
+    if params.priority:
+        stmt = stmt.where(AppStatusSnapshot.app_priority.in_(params.priority))
+    if params.severity:
+        stmt = stmt.where(AppStatusSnapshot.severity.in_(params.severity))
+    if params.scope:
+        stmt = stmt.where(AppStatusSnapshot.scope == params.scope)
+    if params.app_status:
+        stmt = stmt.where(AppStatusSnapshot.app_status == params.app_status)
+
+    rows = db.execute(stmt).all()
+
+    # first snapshot in each period
+    kept_dates: dict = {}
+    for day in sorted({row[0] for row in rows}):
+        kept_dates.setdefault(_period(day, params.interval), day)
+    kept = set(kept_dates.values())
+
+    grouped: dict = defaultdict(lambda: defaultdict(Counter))
+    for row in rows:
+        if row[0] not in kept:
+            continue
+        key = row[2] if group_column is not None else None
+        grouped[key][row[0]][row[1]] += int(row[-1] or 0)
+
+    labels = group_labels(db, params.group_by, grouped.keys())
+
+    return [
+        ds.TrendSeries(
+            key=None if key is None else str(key),
+            label=labels.get(key),
+            points=[
+                ds.TrendPoint(
+                    snapshot_date=day,
+                    total=sum(counts.values()),
+                    statuses=[
+                        ds.StatusCountItem(status=s, count=counts.get(s, 0))
+                        for s in all_statuses
+                    ],
+                )
+                for day, counts in sorted(points.items())
+            ],
+        )
+        for key, points in sorted(grouped.items(), key=lambda item: str(item[0]))
+    ]
+
+
+def get_app_status_trend(
+    db: Session, params: ds.TrendQueryParams
+) -> list[ds.TrendSeries]:
+    try:
+        if params.group_by == "department":
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Application trends can't be grouped by department",
+            )
+
+        return _status_trend(
+            db,
+            params,
+            AppStatusSnapshot.app_status,
+            ALL_APP_STATUSES,
+            AppStatusSnapshot.department_id == 0,
+        )
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        print("ERROR:", e)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Error fetching application status trend",
+        )
+
+
+def get_dept_status_trend(
+    db: Session, params: ds.TrendQueryParams
+) -> list[ds.TrendSeries]:
+    try:
+        criteria = [AppStatusSnapshot.department_id != 0]
+        if params.department_id is not None:
+            criteria = [AppStatusSnapshot.department_id == params.department_id]
+
+        return _status_trend(
+            db,
+            params,
+            AppStatusSnapshot.dept_status,
+            ALL_DEPT_STATUSES,
+            *criteria,
+        )
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        print("ERROR:", e)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Error fetching department status trend",
+        )
@@ -9,6 +9,7 @@ from fastapi import (
     status,
     Query,
     BackgroundTasks,
+    Response,
 )
 from sqlalchemy.orm import Session
 from pydantic import BaseModel
@@ -32,7 +33,16 @@ from schemas.app_schemas import (
     AppQueryParams,
 )
 from models import User
-from services.auth.deps import get_current_user, require_admin, require_manager
+from services.auth.deps import (
+    get_current_user,
+    get_auth_context,
+    require_admin,
+    require_manager,
+)
+from services.auth.context import AuthContext
+from services.projections.fieldsets import APP_LIST_FIELDS
+from services.caching.data_versions import DataVersionETag
+from services.extensions.fast_json import FastJSONResponse
 from api.controllers import evidence_controller as e_ctrl
 import os
 from datetime import date
@@ -62,15 +72,22 @@ async def create_application(
         print(e)
 
 
-@router.get("/list")
+@router.get(
+    "/list",
+    response_class=FastJSONResponse,
+    dependencies=[Depends(DataVersionETag())],
+)
 async def new_list_all_apps(
     db: Annotated[Session, Depends(get_db_conn)],
-    current_user: Annotated[User, Depends(get_current_user)],
+    auth: Annotated[AuthContext, Depends(get_auth_context)],
+    response: Response,
     sort_by: Annotated[str, Query()] = "started_at",
     sort_order: Annotated[Literal["asc", "desc"], Query()] = "desc",
     search: Annotated[str | None, Query()] = None,
     page: Annotated[int, Query()] = 1,
     page_size: Annotated[int, Query()] = 15,
+    pagination: Annotated[Literal["offset", "cursor"], Query()] = "offset",
+    cursor: Annotated[str | None, Query()] = None,
     search_by: Annotated[
         Literal[
             "name",
@@ -102,6 +119,10 @@ async def new_list_all_apps(
     scope: Annotated[
         Literal["is_assessment", "vapt_only", "all"], Query()
     ] = "is_assessment",
+    fields: Annotated[
+        str | None,
+        Query(description="Comma separated fields to return, e.g. name,status"),
+    ] = None,
     vertical_ids: Annotated[str | None, Query()] = None,
     environment: Annotated[Literal["external", "internal"] | None, Query()] = None,
 ):
@@ -170,12 +191,23 @@ async def new_list_all_apps(
 
     app_priority_list = app_priority.split(",") if app_priority else []
 
+    try:
+        fields_list = (
+            APP_LIST_FIELDS.parse(fields.split(","))
+            if fields and fields.strip() not in ("null", "undefined")
+            else None
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
     params = AppQueryParams(
         sort_by=sort_by,
         sort_order=sort_order,
         search=search,
         page=page,
         page_size=page_size,
+        pagination=pagination,
+        cursor=cursor,
         search_by=search_by,
         status=status_list,
         dept_filter_id=dept_filter_id,
@@ -192,21 +224,25 @@ async def new_list_all_apps(
         vertical_ids=[int(v) for v in vertical_ids_list],
         environment=environment,
         mode=mode,
+        fields=fields_list,
+    )
+    data = list_all_apps(db=db, params=params, auth=auth)
+    return FastJSONResponse(
+        {"msg": "Applications fetched successfully", "data": data},
+        headers=response.headers,
     )
-    data = list_all_apps(db=db, params=params, current_user=current_user)
-    return {"msg": "Applications fetched successfully", "data": data}
 
 
 @router.get("/{app_id}")
 async def get_application(
     app_id: Annotated[str, Path(title="App Id of the app to be fetched")],
     db: Annotated[Session, Depends(get_db_conn)],
-    current_user: Annotated[User, Depends(get_current_user)],
+    auth: Annotated[AuthContext, Depends(get_auth_context)],
 ):
     """
     Get a specific application by its ID.
     """
-    data = get_app_details(app_id=app_id, db=db, current_user=current_user)
+    data = get_app_details(app_id=app_id, db=db, auth=auth)
     return {"msg": "", "data": data}
 
 
@@ -15,7 +15,8 @@ from typing import Annotated
 
 from api.controllers import comments_controller as comment_ctrl
 from db.connection import get_db_conn
-from services.auth.deps import get_current_user
+from services.auth.deps import get_current_user, get_auth_context
+from services.auth.context import AuthContext
 from models import User
 
 from schemas import comment_schemas as c_schemas
@@ -42,6 +43,7 @@ async def create_comment(
     content: Annotated[str, Form(...)],
     db: Annotated[Session, Depends(get_db_conn)],
     current_user: Annotated[User, Depends(get_current_user)],
+    auth: Annotated[AuthContext, Depends(get_auth_context)],
     app_id: Annotated[str, Path(...)],
     dept_id: Annotated[int, Path(...)],
     severity: Annotated[str | None, Form()] = None,
@@ -50,7 +52,7 @@ async def create_comment(
     try:
         # Authorization
         is_author_valid = is_user_of_dept(
-            dept_id=dept_id, user_id=current_user.id, db=db
+            dept_id=dept_id, user_id=current_user.id, db=db, auth=auth
         )
         if not is_author_valid:
             raise HTTPException(
@@ -1,7 +1,8 @@
 from datetime import date
+from time import perf_counter
 from typing import Annotated, Literal
 
-from fastapi import APIRouter, Depends, Path, Query
+from fastapi import APIRouter, Depends, Path, Query, Response
 from sqlalchemy.orm import Session
 
 from api.controllers import dashboard_controller as dc
@@ -10,21 +11,37 @@ from models import User
 
 from schemas.dashboard_schemas import (
     AppSummaryQueryParams,
+    CycleTimeParams,
+    DashboardBundleParams,
     DeptSummaryQueryParams,
+    StatusMatrixParams,
     StatusPerDepartmentParams,
     AppTypeSummaryParams,
     DateRangeParams,
     VerticalWiseSummaryParams,
 )
-from services.auth.deps import get_current_user
+from services.auth.deps import get_current_user, require_admin
+from services.caching.aggregate_cache import aggregate_cache
+from services.caching.data_versions import DataVersionETag
+from services.extensions.fast_json import FastJSONResponse
+
+# Every dashboard answers If-None-Match with 304 until its data changes
+router = APIRouter(
+    prefix="/dashboard",
+    tags=["dashboard"],
+    default_response_class=FastJSONResponse,
+    dependencies=[Depends(DataVersionETag(*dc.DASHBOARD_DATA_GROUPS))],
+)
 
-router = APIRouter(prefix="/dashboard", tags=["dashboard"])
+# Cache counters change on every request, so they can't sit behind the ETag
+stats_router = APIRouter(prefix="/dashboard", tags=["dashboard"])
 
 
 @router.get("/summary/applications")
 def dashboard_summary(
     db: Annotated[Session, Depends(get_db_conn)],
     current_user: Annotated[User, Depends(get_current_user)],
+    response: Response,
     severity: Annotated[str | None, Query()] = None,
     priority: Annotated[str | None, Query()] = None,
     app_age_from: Annotated[date | None, Query()] = None,
@@ -47,13 +64,15 @@ def dashboard_summary(
         app_age_to=app_age_to,
         app_age_from=app_age_from,
     )
-    return dc.get_app_status_summary(db, params=params)
+    data = dc.get_app_status_summary(db, params=params)
+    return FastJSONResponse(data, headers=response.headers)
 
 
 @router.get("/summary/departments")
 def get_department_status_summary(
     db: Annotated[Session, Depends(get_db_conn)],
     current_user: Annotated[User, Depends(get_current_user)],
+    response: Response,
     app_status: Annotated[str | None, Query(...)] = None,
     severity: Annotated[str | None, Query()] = None,
     priority: Annotated[str | None, Query()] = None,
@@ -77,50 +96,58 @@ def get_department_status_summary(
         app_age_from=app_age_from,
         status=app_status,
     )
-    return dc.get_department_status_summary(db=db, params=params)
+    data = dc.get_department_status_summary(db=db, params=params)
+    return FastJSONResponse(data, headers=response.headers)
 
 
 @router.get("/summary/department/{department_id}/category")
 def get_department_category_status_summary(
     db: Annotated[Session, Depends(get_db_conn)],
     current_user: Annotated[User, Depends(get_current_user)],
+    response: Response,
     dept_status: Annotated[str, Query(...)],
     department_id: Annotated[int, Path(...)],
     app_status: Annotated[str, Query(...)],
     sla_filter: Annotated[int | None, Query(...)] = None,
 ):
-    return dc.get_department_sub_category(
+    data = dc.get_department_sub_category(
         db=db,
         app_status=app_status,
         sla_filter=sla_filter,
         department_id=department_id,
         dept_status=dept_status,
     )
+    return FastJSONResponse(data, headers=response.headers)
 
 
 @router.get("/summary/priority-wise")
 def priority_wise_summary(
     db: Annotated[Session, Depends(get_db_conn)],
     current_user: Annotated[User, Depends(get_current_user)],
+    response: Response,
     status_filter: Annotated[str | None, Query(...)] = None,
 ):
-    return dc.get_priority_wise_grouped_summary(db=db, status_filter=status_filter)
+    data = dc.get_priority_wise_grouped_summary(db=db, status_filter=status_filter)
+    return FastJSONResponse(data, headers=response.headers)
 
 
 @router.get("/summary/vertical-wise")
 def vertical_wise_summary(
     db: Annotated[Session, Depends(get_db_conn)],
     current_user: Annotated[User, Depends(get_current_user)],
+    response: Response,
     scope: Annotated[Literal["is_assessment", "vapt_only"], Query()] = "is_assessment",
 ):
     params = VerticalWiseSummaryParams(scope=scope)
-    return dc.get_vertical_wise_app_statuses(db=db, params=params)
+    data = dc.get_vertical_wise_app_statuses(db=db, params=params)
+    return FastJSONResponse(data, headers=response.headers)
 
 
 @router.get("/summary/departments/status")
 def get_statuses_per_department(
     db: Annotated[Session, Depends(get_db_conn)],
     current_user: Annotated[User, Depends(get_current_user)],
+    response: Response,
     app_status: Annotated[str, Query(...)],
     dept_status: Annotated[str, Query(...)],
     severity: Annotated[str | None, Query()] = None,
@@ -148,13 +175,47 @@ def get_statuses_per_department(
         app_age_from=app_age_from,
         app_age_to=app_age_to,
     )
-    return dc.get_statuses_per_dept(db=db, params=params)
+    data = dc.get_statuses_per_dept(db=db, params=params)
+    return FastJSONResponse(data, headers=response.headers)
+
+
+@router.get("/summary/departments/status-matrix")
+def get_department_status_matrix(
+    db: Annotated[Session, Depends(get_db_conn)],
+    current_user: Annotated[User, Depends(get_current_user)],
+    response: Response,
+    severity: Annotated[str | None, Query()] = None,
+    priority: Annotated[str | None, Query()] = None,
+    app_age_from: Annotated[date | None, Query()] = None,
+    app_age_to: Annotated[date | None, Query()] = None,
+):
+    """
+    Counts per department x dept_status x app_status. Filtering the cells by
+    one (app_status, dept_status) pair gives /summary/departments/status.
+    """
+    int_severity_list = []
+    int_priority_list = []
+    if severity and severity.strip() != "":
+        int_severity_list = [int(s) for s in severity.split(",")]
+
+    if priority and priority.strip() != "":
+        int_priority_list = [int(s) for s in priority.split(",")]
+
+    params = StatusMatrixParams(
+        severity=int_severity_list,
+        priority=int_priority_list,
+        app_age_from=app_age_from,
+        app_age_to=app_age_to,
+    )
+    data = dc.get_status_matrix(db=db, params=params)
+    return FastJSONResponse(data, headers=response.headers)
 
 
 @router.get("/summary/app_type")
 async def get_app_type_summary(
     db: Annotated[Session, Depends(get_db_conn)],
     current_user: Annotated[User, Depends(get_current_user)],
+    response: Response,
     app_status: Annotated[str | None, Query(...)] = None,
     severity: Annotated[str | None, Query()] = None,
     priority: Annotated[str | None, Query()] = None,
@@ -181,23 +242,28 @@ async def get_app_type_summary(
         app_status=app_status,
     )
 
-    return dc.get_app_types_summary(db=db, params=params)
+    data = dc.get_app_types_summary(db=db, params=params)
+    return FastJSONResponse(data, headers=response.headers)
 
 
 @router.get("/summary/vapt")
 async def get_vapt_summary(
     db: Annotated[Session, Depends(get_db_conn)],
     current_user: Annotated[User, Depends(get_current_user)],
+    response: Response,
 ):
-    return dc.get_vapt_summary_per_status(db=db)
+    data = dc.get_vapt_summary_per_status(db=db)
+    return FastJSONResponse(data, headers=response.headers)
 
 
 @router.get("/summary/completion")
 async def get_application_completion_stats(
     db: Annotated[Session, Depends(get_db_conn)],
     current_user: Annotated[User, Depends(get_current_user)],
+    response: Response,
 ):
-    return dc.get_application_completion_stats(db=db)
+    data = dc.get_application_completion_stats(db=db)
+    return FastJSONResponse(data, headers=response.headers)
 
 
 @router.get("/summary/dept_completions")
@@ -205,5 +271,99 @@ async def get_department_completion_stats(
     db: Annotated[Session, Depends(get_db_conn)],
     params: Annotated[DateRangeParams, Query()],
     current_user: Annotated[User, Depends(get_current_user)],
+    response: Response,
+):
+    data = dc.get_dept_completion_stats(db=db, params=params)
+    return FastJSONResponse(data, headers=response.headers)
+
+
+@router.get("/bundle")
+def get_dashboard_bundle(
+    current_user: Annotated[User, Depends(get_current_user)],
+    response: Response,
+    severity: Annotated[str | None, Query()] = None,
+    priority: Annotated[str | None, Query()] = None,
+    app_age_from: Annotated[date | None, Query()] = None,
+    app_age_to: Annotated[date | None, Query()] = None,
+    scope: Annotated[Literal["is_assessment", "vapt_only"], Query()] = "is_assessment",
+    from_date: Annotated[date | None, Query()] = None,
+    to_date: Annotated[date | None, Query()] = None,
+):
+    """
+    Every dashboard widget in one response, computed concurrently.
+
+    Per-widget timings are reported in the Server-Timing header.
+    """
+    started = perf_counter()
+
+    int_severity_list = []
+    int_priority_list = []
+    if severity and severity.strip() != "":
+        severity_list = severity.split(",")
+        int_severity_list = [int(s) for s in severity_list]
+
+    if priority and priority.strip() != "":
+        priority_list = priority.split(",")
+
+        int_priority_list = [int(s) for s in priority_list]
+
+    params = DashboardBundleParams(
+        severity=int_severity_list,
+        priority=int_priority_list,
+        app_age_from=app_age_from,
+        app_age_to=app_age_to,
+        scope=scope,
+        from_date=from_date,
+        to_date=to_date,
+    )
+    data, timings = dc.get_dashboard_bundle(params=params)
+
+    timings["total"] = (perf_counter() - started) * 1000
+    response.headers["Server-Timing"] = ", ".join(
+        f"{name};dur={ms:.1f}" for name, ms in timings.items()
+    )
+    return FastJSONResponse(data, headers=response.headers)
+
+
+@router.get("/cycle-times/{level}")
+def get_cycle_time_percentiles(
+    db: Annotated[Session, Depends(get_db_conn)],
+    current_user: Annotated[User, Depends(get_current_user)],
+    response: Response,
+    level: Annotated[Literal["application", "department"], Path(...)],
+    group_by: Annotated[
+        Literal["department", "vertical", "priority", "month"] | None, Query()
+    ] = None,
+    from_date: Annotated[date | None, Query()] = None,
+    to_date: Annotated[date | None, Query()] = None,
+    department_id: Annotated[int | None, Query()] = None,
+    vertical_ids: Annotated[str | None, Query()] = None,
+    priority: Annotated[str | None, Query()] = None,
+):
+    """p50 / p90 / p99 days from start to completion, per group."""
+    int_vertical_list = []
+    int_priority_list = []
+    if vertical_ids and vertical_ids.strip() != "":
+        int_vertical_list = [int(v) for v in vertical_ids.split(",")]
+
+    if priority and priority.strip() != "":
+        int_priority_list = [int(p) for p in priority.split(",")]
+
+    params = CycleTimeParams(
+        level=level,
+        group_by=group_by,
+        from_date=from_date,
+        to_date=to_date,
+        department_id=department_id,
+        vertical_ids=int_vertical_list,
+        priority=int_priority_list,
+    )
+    data = dc.get_cycle_time_percentiles(db=db, params=params)
+    return FastJSONResponse(data, headers=response.headers)
+
+
+@stats_router.get("/cache-stats")
+def get_dashboard_cache_stats(
+    current_user: Annotated[User, Depends(require_admin)],
 ):
-    return dc.get_dept_completion_stats(db=db, params=params)
+    return {"msg": "", "data": aggregate_cache.stats()}
@@ -4,7 +4,13 @@ from sqlalchemy.orm import Session
 from api.controllers import department_controller as dept_ctrl
 from db.connection import get_db_conn
 from schemas import department_schemas as d_schemas
-from services.auth.deps import require_moderator, require_admin, get_current_user
+from services.auth.deps import (
+    require_moderator,
+    require_admin,
+    get_current_user,
+    get_auth_context,
+)
+from services.auth.context import AuthContext
 
 from typing import Annotated
 from services.auth.permissions import is_user_of_dept
@@ -108,9 +114,12 @@ def update_department_status(
     payload: Annotated[d_schemas.DeptStatusPayload, ""],
     db: Annotated[Session, Depends(get_db_conn)],
     current_user: Annotated[User, Depends(require_moderator)],
+    auth: Annotated[AuthContext, Depends(get_auth_context)],
 ):
     try:
-        if not is_user_of_dept(dept_id=dept_id, user_id=current_user.id, db=db):
+        if not is_user_of_dept(
+            dept_id=dept_id, user_id=current_user.id, db=db, auth=auth
+        ):
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail="Access Denied to update status",
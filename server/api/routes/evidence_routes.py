@@ -4,7 +4,8 @@ from fastapi import HTTPException
 from sqlalchemy.orm import Session
 from models import User
 
-from services.auth.deps import get_current_user, require_manager
+from services.auth.deps import get_current_user, get_auth_context, require_manager
+from services.auth.context import AuthContext
 from services.auth.permissions import is_user_of_dept
 from api.controllers import evidence_controller as e_ctrl
 from db.connection import get_db_conn
@@ -23,6 +24,7 @@ async def add_department_evidences(
     dept_id: Annotated[int, Path(...)],
     db: Annotated[Session, Depends(get_db_conn)],
     current_user: Annotated[User, Depends(get_current_user)],
+    auth: Annotated[AuthContext, Depends(get_auth_context)],
     severity: Annotated[str | None, Form()] = None,
     evidence_files: Annotated[list[UploadFile] | None, File()] = None,
 ):
@@ -39,7 +41,7 @@ async def add_department_evidences(
                 detail="Application you are uploading evidence to is not found",
             )
         if dept_id and not is_user_of_dept(
-            dept_id=dept_id, user_id=current_user.id, db=db
+            dept_id=dept_id, user_id=current_user.id, db=db, auth=auth
         ):
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
@@ -1,51 +1,130 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
 from fastapi.responses import StreamingResponse
-import pandas as pd
 from sqlalchemy.orm import Session
 from db.connection import get_db_conn
-from io import StringIO
 from api.controllers.exports_controller import (
-    export_application_overview_rows,
+    create_export_job,
+    get_export_job,
+    get_export_job_file,
     get_vertical_applications,
-    export_vertical_applications_zip,
+    stream_changes,
+    stream_export,
 )
 from typing import Annotated
+from schemas.export_schemas import ExportJobCreate, ExportJobOut
 from services.auth.deps import get_current_user
+from services.exports.change_feed import CHANGE_FEED_ENTITIES, CHANGE_FEED_MAX_LIMIT
+from services.extensions.fast_json import FastJSONResponse
+from services.projections.fieldsets import APP_EXPORT_FIELDS
 
 router = APIRouter(prefix="/export")
 
+# Large exports built in the background, see services/exports/export_jobs.py
+jobs_router = APIRouter(prefix="/exports/jobs", tags=["exports"])
+
+
+def _overview_fields(fields: str | None) -> list[str] | None:
+    if not fields or fields.strip() in ("null", "undefined"):
+        return None
+    try:
+        return APP_EXPORT_FIELDS.parse(fields.split(","))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
 
 @router.get("/applications", response_class=StreamingResponse)
 def export_applications_csv(
     db: Annotated[Session, Depends(get_db_conn)],
     current_user: Annotated[Session, Depends(get_current_user)],
+    fields: Annotated[
+        str | None,
+        Query(description="Comma separated columns, e.g. application_name,departments"),
+    ] = None,
 ):
-    rows = export_application_overview_rows(db)
-
-    if not rows:
-        return StreamingResponse(iter([""]), media_type="text/csv")
-
-    df = pd.DataFrame(rows)
+    return stream_export(db, "applications_csv", _overview_fields(fields))
 
-    buffer = StringIO()
-    df.to_csv(buffer, index=False)
-    buffer.seek(0)
 
-    headers = {
-        "Content-Disposition": "attachment; filename=is_assessment_all_applications.csv"
-    }
-
-    return StreamingResponse(buffer, media_type="text/csv", headers=headers)
+@router.get("/applications/xlsx", response_class=StreamingResponse)
+def export_applications_xlsx(
+    db: Annotated[Session, Depends(get_db_conn)],
+    current_user: Annotated[Session, Depends(get_current_user)],
+    fields: Annotated[
+        str | None,
+        Query(description="Comma separated columns, e.g. application_name,departments"),
+    ] = None,
+):
+    return stream_export(db, "applications_xlsx", _overview_fields(fields))
 
 
-@router.get("/applications/verticals")
+@router.get("/applications/verticals", response_class=FastJSONResponse)
 def get_applications_per_vertical(
     db: Annotated[Session, Depends(get_db_conn)],
     current_user: Annotated[Session, Depends(get_current_user)],
 ):
-    return get_vertical_applications(db=db)
+    return FastJSONResponse(get_vertical_applications(db=db))
 
 
 @router.get("/applications/verticals/csv")
 def export_vertical_csv(db: Session = Depends(get_db_conn)):
-    return export_vertical_applications_zip(db)
+    return stream_export(db, "verticals_zip")
+
+
+@router.get("/applications/verticals/xlsx")
+def export_vertical_xlsx(
+    db: Annotated[Session, Depends(get_db_conn)],
+    current_user: Annotated[Session, Depends(get_current_user)],
+):
+    return stream_export(db, "verticals_xlsx")
+
+
+@router.get("/changes", response_class=StreamingResponse)
+def export_changes(
+    db: Annotated[Session, Depends(get_db_conn)],
+    current_user: Annotated[Session, Depends(get_current_user)],
+    since: Annotated[str | None, Query()] = None,
+    entities: Annotated[str | None, Query()] = None,
+    limit: Annotated[int, Query(ge=1, le=CHANGE_FEED_MAX_LIMIT)] = 5000,
+):
+    """
+    NDJSON of rows changed since an ISO timestamp or the watermark of the
+    previous page, up to `limit` per entity. Ends with a watermark line;
+    fetch again with it while `has_more` is true.
+    """
+    entity_list = list(CHANGE_FEED_ENTITIES)
+    if entities and entities.strip() != "":
+        entity_list = [e.strip() for e in entities.split(",") if e.strip()]
+
+    return stream_changes(db, since, entity_list, limit)
+
+
+def _download_url(request: Request):
+    return lambda job_id: str(request.url_for("download_export_job", job_id=job_id))
+
+
+@jobs_router.post(
+    "", response_model=ExportJobOut, status_code=status.HTTP_202_ACCEPTED
+)
+def submit_export_job(
+    request: Request,
+    payload: ExportJobCreate,
+    db: Annotated[Session, Depends(get_db_conn)],
+    current_user: Annotated[Session, Depends(get_current_user)],
+):
+    return create_export_job(db, payload, _download_url(request))
+
+
+@jobs_router.get("/{job_id}", response_model=ExportJobOut)
+def export_job_status(
+    request: Request,
+    job_id: str,
+    current_user: Annotated[Session, Depends(get_current_user)],
+):
+    return get_export_job(job_id, _download_url(request))
+
+
+@jobs_router.get("/{job_id}/download", name="download_export_job")
+def download_export_job(
+    job_id: str,
+    current_user: Annotated[Session, Depends(get_current_user)],
+):
+    return get_export_job_file(job_id)
@@ -0,0 +1,91 @@
+from datetime import date
+from typing import Annotated, Literal
+
+from fastapi import APIRouter, Depends, Query, Response
+from sqlalchemy.orm import Session
+
+from api.controllers import trend_controller as tc
+from db.connection import get_db_conn
+from models import User
+from schemas.dashboard_schemas import TrendQueryParams
+from services.auth.deps import get_current_user
+from services.caching.data_versions import DataVersionETag
+from services.extensions.fast_json import FastJSONResponse
+
+# Trend charts only change when a new daily snapshot is written
+router = APIRouter(
+    prefix="/dashboard/trends",
+    tags=["dashboard"],
+    default_response_class=FastJSONResponse,
+    dependencies=[Depends(DataVersionETag("snapshots", "reference"))],
+)
+
+GroupBy = Literal["vertical", "priority", "severity", "scope", "department"]
+
+
+def _int_list(value: str | None) -> list[int]:
+    if value and value.strip() != "":
+        return [int(v) for v in value.split(",")]
+    return []
+
+
+@router.get("/applications")
+def get_app_status_trend(
+    db: Annotated[Session, Depends(get_db_conn)],
+    current_user: Annotated[User, Depends(get_current_user)],
+    response: Response,
+    from_date: Annotated[date | None, Query()] = None,
+    to_date: Annotated[date | None, Query()] = None,
+    interval: Annotated[Literal["day", "week", "month"], Query()] = "day",
+    group_by: Annotated[GroupBy | None, Query()] = None,
+    vertical_ids: Annotated[str | None, Query()] = None,
+    priority: Annotated[str | None, Query()] = None,
+    severity: Annotated[str | None, Query()] = None,
+    scope: Annotated[str | None, Query()] = None,
+    app_status: Annotated[str | None, Query()] = None,
+):
+    params = TrendQueryParams(
+        from_date=from_date,
+        to_date=to_date,
+        interval=interval,
+        group_by=group_by,
+        vertical_ids=_int_list(vertical_ids),
+        priority=_int_list(priority),
+        severity=_int_list(severity),
+        scope=scope,
+        app_status=app_status,
+    )
+    data = tc.get_app_status_trend(db=db, params=params)
+    return FastJSONResponse(data, headers=response.headers)
+
+
+@router.get("/departments")
+def get_dept_status_trend(
+    db: Annotated[Session, Depends(get_db_conn)],
+    current_user: Annotated[User, Depends(get_current_user)],
+    response: Response,
+    department_id: Annotated[int | None, Query()] = None,
+    from_date: Annotated[date | None, Query()] = None,
+    to_date: Annotated[date | None, Query()] = None,
+    interval: Annotated[Literal["day", "week", "month"], Query()] = "day",
+    group_by: Annotated[GroupBy | None, Query()] = None,
+    vertical_ids: Annotated[str | None, Query()] = None,
+    priority: Annotated[str | None, Query()] = None,
+    severity: Annotated[str | None, Query()] = None,
+    scope: Annotated[str | None, Query()] = None,
+    app_status: Annotated[str | None, Query()] = None,
+):
+    params = TrendQueryParams(
+        from_date=from_date,
+        to_date=to_date,
+        interval=interval,
+        group_by=group_by,
+        vertical_ids=_int_list(vertical_ids),
+        priority=_int_list(priority),
+        severity=_int_list(severity),
+        scope=scope,
+        department_id=department_id,
+        app_status=app_status,
+    )
+    data = tc.get_dept_status_trend(db=db, params=params)
+    return FastJSONResponse(data, headers=response.headers)
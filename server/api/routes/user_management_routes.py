@@ -14,6 +14,7 @@ from schemas.auth_schemas import (
     UserOut,
 )
 from api.controllers import user_management_controller as usr_ctrl
+from services.extensions.fast_json import FastJSONResponse
 
 router = APIRouter(prefix="/user-management", tags=["auth"])
 
@@ -42,7 +43,7 @@ async def register(
         )
 
 
-@router.get("/all")
+@router.get("/all", response_class=FastJSONResponse)
 async def list_all_users(
     current_user: Annotated[
         User, Depends(require_admin), "Fetching logged in user details"
@@ -50,7 +51,7 @@ async def list_all_users(
     db: Annotated[Session, Depends(get_db_conn)],
 ):
     data = usr_ctrl.get_all_users(db=db)
-    return {"msg": "All users fetched successfully", "data": data}
+    return FastJSONResponse({"msg": "All users fetched successfully", "data": data})
 
 
 @router.patch("/profile/{editing_user_id}")
@@ -0,0 +1,130 @@
+"""
+Rows the database sends back for one /applications/list page, before and
+after paging over ids first.
+
+before: select(Application) with joinedload(Application.departments) and
+        LIMIT/OFFSET, the page query list_all_apps used to run
+after:  the narrow id page, then hydrate_apps for just those ids
+
+Every statement each variant runs is captured and replayed through the
+DB-API cursor to count the rows and cells (rows x columns) it returns.
+
+    cd server && python -m benchmarks.bench_app_list_rows [n_apps]
+"""
+
+import sys
+import time
+
+from tests import support  # noqa: F401  must come first, sets up the database
+
+from sqlalchemy import desc, event, select
+from sqlalchemy.orm import joinedload, selectinload
+
+from api.controllers.application_controller import hydrate_apps
+from db.connection import SessionLocal, engine
+from models import Application
+
+PAGE_SIZES = (15, 50, 100)
+
+
+def _capture():
+    statements = []
+
+    def listener(conn, cursor, statement, parameters, context, executemany):
+        statements.append((statement, parameters))
+
+    event.listen(engine, "before_cursor_execute", listener)
+    return statements, lambda: event.remove(engine, "before_cursor_execute", listener)
+
+
+def _transferred(statements) -> tuple[int, int]:
+    rows = cells = 0
+    raw = engine.raw_connection()
+    try:
+        for statement, parameters in statements:
+            cursor = raw.cursor()
+            cursor.execute(statement, parameters)
+            fetched = cursor.fetchall()
+            rows += len(fetched)
+            cells += len(fetched) * len(cursor.description or ())
+    finally:
+        raw.close()
+    return rows, cells
+
+
+def _base():
+    return select(Application).where(Application.is_active)
+
+
+ORDER_BY = (desc(Application.started_at), desc(Application.id))
+
+
+def page_before(db, page_size: int, page: int) -> list[Application]:
+    stmt = (
+        _base()
+        .options(
+            joinedload(Application.departments),
+            selectinload(Application.executive_summaries),
+            selectinload(Application.app_vertical),
+        )
+        .order_by(*ORDER_BY)
+        .limit(page_size)
+        .offset((page - 1) * page_size)
+    )
+    return db.execute(stmt).scalars().unique().all()
+
+
+def page_after(db, page_size: int, page: int) -> list[Application]:
+    ids = db.scalars(
+        _base()
+        .with_only_columns(Application.id)
+        .order_by(*ORDER_BY)
+        .limit(page_size)
+        .offset((page - 1) * page_size)
+    ).all()
+    return hydrate_apps(list(ids), db)
+
+
+def measure(fetch, page_size: int, page: int) -> dict:
+    db = SessionLocal()
+    statements, stop = _capture()
+    try:
+        start = time.perf_counter()
+        apps = fetch(db, page_size, page)
+        elapsed = time.perf_counter() - start
+    finally:
+        stop()
+        db.close()
+    rows, cells = _transferred(statements)
+    return {
+        "apps": len(apps),
+        "queries": len(statements),
+        "rows": rows,
+        "cells": cells,
+        "ms": elapsed * 1000,
+    }
+
+
+def main(n_apps: int) -> None:
+    print(f"seeding {n_apps} applications ...")
+    support.create_database(n_apps=n_apps)
+    try:
+        print(
+            f"{'page size':>9} {'variant':>7} {'apps':>5} {'queries':>7} "
+            f"{'rows':>6} {'cells':>8} {'ms':>8}"
+        )
+        for page_size in PAGE_SIZES:
+            for name, fetch in (("before", page_before), ("after", page_after)):
+                measure(fetch, page_size, page=2)  # warm up
+                result = measure(fetch, page_size, page=2)
+                print(
+                    f"{page_size:>9} {name:>7} {result['apps']:>5} "
+                    f"{result['queries']:>7} {result['rows']:>6} "
+                    f"{result['cells']:>8} {result['ms']:>8.1f}"
+                )
+    finally:
+        support.drop_database()
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 2000)
@@ -0,0 +1,99 @@
+"""
+Serialization time of an /applications/list payload at 100, 1,000 and
+10,000 applications.
+
+before: what FastAPI does with a dict returned from a route,
+        jsonable_encoder followed by JSONResponse (json.dumps)
+after:  FastJSONResponse, pydantic-core straight to bytes
+
+The rows are real NewAppListOut models (nested departments and latest
+comments) built by list_all_apps from the seeded database, repeated to
+reach each size. Both outputs are checked to decode to the same JSON.
+
+    cd server && python -m benchmarks.bench_json_serialization
+"""
+
+import json
+import timeit
+
+from tests import support  # noqa: F401  must come first, sets up the database
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+
+from api.controllers.application_controller import list_all_apps
+from db.connection import SessionLocal
+from models import User
+from schemas.app_schemas import AppQueryParams
+from services.auth.context import load_auth_context
+from services.extensions.fast_json import FastJSONResponse
+
+SIZES = (100, 1_000, 10_000)
+REPEATS = 5
+
+
+def render_before(payload) -> bytes:
+    return JSONResponse(jsonable_encoder(payload)).body
+
+
+def render_after(payload) -> bytes:
+    return FastJSONResponse(payload).body
+
+
+def _page_of_apps(seeded: dict) -> dict:
+    db = SessionLocal()
+    try:
+        user = db.get(User, seeded["admin_id"])
+        auth = load_auth_context(support.login(db, user)["session_id"], db)
+        params = AppQueryParams(
+            search=None,
+            sla_filter=None,
+            severity=None,
+            environment=None,
+            vertical_ids=None,
+            app_type=None,
+            app_features=None,
+            app_age_from=None,
+            app_age_to=None,
+            scope="all",
+            page_size=support.SEED_APPS,
+        )
+        return list_all_apps(db=db, params=params, auth=auth)
+    finally:
+        db.close()
+
+
+def _payload(data: dict, size: int) -> dict:
+    apps = data["apps"]
+    return {
+        "msg": "Applications fetched successfully",
+        "data": {**data, "apps": [apps[i % len(apps)] for i in range(size)]},
+    }
+
+
+def _best_ms(render, payload) -> float:
+    timer = timeit.Timer(lambda: render(payload))
+    return min(timer.repeat(repeat=REPEATS, number=1)) * 1000
+
+
+def main() -> None:
+    data = _page_of_apps(support.create_database())
+    try:
+        print(f"{'rows':>6} {'before ms':>10} {'after ms':>9} {'speedup':>8} {'KiB':>8}")
+        for size in SIZES:
+            payload = _payload(data, size)
+            body = render_after(payload)
+            assert json.loads(body) == json.loads(render_before(payload))
+
+            before = _best_ms(render_before, payload)
+            after = _best_ms(render_after, payload)
+            print(
+                f"{size:>6} {before:>10.1f} {after:>9.1f} "
+                f"{before / after:>7.1f}x {len(body) / 1024:>8.0f}"
+            )
+    finally:
+        support.drop_database()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,159 @@
+"""
+Memory used to build an XLSX export at 1,000, 10,000 and 50,000 rows.
+
+before: a regular openpyxl Workbook, every cell kept until save
+after:  iter_xlsx, write-only sheets streamed to a temp file
+
+Rows are synthetic, 30 columns shaped like the applications overview
+(names, long descriptions and comments, statuses, dates, numbers) and
+generated lazily, so the row source itself holds nothing. Each run happens
+in a fresh process and reports how much its max RSS grew while building.
+The regular workbook is skipped past 10,000 rows; it grows by about
+10 MiB per 1,000 rows.
+
+iter_xlsx keeps the finished file in memory until it reaches
+XLSX_SPOOL_BYTES, so its peak is that plus what building costs. The script
+fails unless
+- the shipped peak stays under XLSX_SPOOL_BYTES + SPOOL_HEADROOM_MIB, and
+- with the spool cut to BOUND_SPOOL_BYTES, so every file but the smallest
+  goes to disk, 50,000 rows cost no more than 10,000 plus BOUND_SLACK_MIB.
+
+    cd server && python -m benchmarks.bench_xlsx_memory
+"""
+
+import multiprocessing
+import resource
+import time
+from datetime import datetime, timedelta
+
+from openpyxl import Workbook
+
+from services.exports import xlsx_stream
+from services.exports.xlsx_stream import Sheet, iter_xlsx
+
+SIZES = (1_000, 10_000, 50_000)
+BEFORE_MAX_ROWS = 10_000
+
+SPOOL_HEADROOM_MIB = 4
+BOUND_SPOOL_BYTES = 1024 * 1024
+BOUND_SLACK_MIB = 1
+
+N_DEPARTMENTS = 12
+
+COLUMNS = [
+    "application_name",
+    "description",
+    "app_url",
+    "status",
+    "started_at",
+    "severity",
+    *(
+        f"dept_{n}_{kind}"
+        for n in range(N_DEPARTMENTS)
+        for kind in ("status", "comment")
+    ),
+]
+
+_STATUSES = ("yet_to_connect", "in_progress", "cleared", "hold")
+_STARTED = datetime(2025, 1, 1)
+
+
+def _rows(n_rows: int):
+    for i in range(n_rows):
+        row = {
+            "application_name": f"Application {i:06d}",
+            "description": f"Customer facing service number {i}. " * 4,
+            "app_url": f"https://app-{i}.example.com/login",
+            "status": _STATUSES[i % 4],
+            "started_at": _STARTED + timedelta(hours=i),
+            "severity": i % 5,
+        }
+        for n in range(N_DEPARTMENTS):
+            row[f"dept_{n}_status"] = _STATUSES[(i + n) % 4]
+            row[f"dept_{n}_comment"] = f"Reviewed by department {n}, ticket {i}-{n}"
+        yield row
+
+
+def build_before(n_rows: int) -> int:
+    workbook = Workbook()
+    ws = workbook.active
+    ws.append(COLUMNS)
+    for row in _rows(n_rows):
+        ws.append([row[column] for column in COLUMNS])
+    with open("/dev/null", "wb") as out:
+        workbook.save(out)
+    return 0
+
+
+def build_after(n_rows: int) -> int:
+    sheet = Sheet("Applications", COLUMNS, _rows(n_rows))
+    return sum(len(chunk) for chunk in iter_xlsx([sheet]))
+
+
+def _max_rss_kib() -> int:
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+def _measure(build, n_rows: int, spool_bytes: int | None) -> dict:
+    if spool_bytes is not None:
+        xlsx_stream.XLSX_SPOOL_BYTES = spool_bytes
+    rss_before = _max_rss_kib()
+    start = time.perf_counter()
+    size = build(n_rows)
+    elapsed = time.perf_counter() - start
+    return {
+        "rss_mib": (_max_rss_kib() - rss_before) / 1024,
+        "seconds": elapsed,
+        "file_kib": size / 1024,
+    }
+
+
+def measure(build, n_rows: int, spool_bytes: int | None = None) -> dict:
+    # a fresh process per run, so max RSS isn't carried over from the last
+    with multiprocessing.get_context("fork").Pool(1) as pool:
+        return pool.apply(_measure, (build, n_rows, spool_bytes))
+
+
+def _print(n_rows: int, name: str, result: dict) -> None:
+    file_kib = f"{result['file_kib']:.0f}" if result["file_kib"] else "-"
+    print(
+        f"{n_rows:>6} {name:>12} {result['rss_mib']:>9.1f} "
+        f"{result['seconds']:>6.1f} {file_kib:>9}"
+    )
+
+
+def main() -> None:
+    print(f"{'rows':>6} {'variant':>12} {'RSS +MiB':>9} {'s':>6} {'file KiB':>9}")
+    shipped = {}
+    for n_rows in SIZES:
+        if n_rows <= BEFORE_MAX_ROWS:
+            _print(n_rows, "before", measure(build_before, n_rows))
+        shipped[n_rows] = measure(build_after, n_rows)
+        _print(n_rows, "after", shipped[n_rows])
+
+    spool_mib = xlsx_stream.XLSX_SPOOL_BYTES / 2**20
+    bound_name = f"after/{BOUND_SPOOL_BYTES // 1024}K"
+    bounded = {}
+    for n_rows in SIZES[1:]:
+        bounded[n_rows] = measure(build_after, n_rows, BOUND_SPOOL_BYTES)
+        _print(n_rows, bound_name, bounded[n_rows])
+
+    largest = shipped[SIZES[-1]]["rss_mib"]
+    assert largest <= spool_mib + SPOOL_HEADROOM_MIB, (
+        f"{SIZES[-1]} rows grew RSS by {largest:.1f} MiB, over the "
+        f"{spool_mib:.0f} MiB spool + {SPOOL_HEADROOM_MIB} MiB"
+    )
+    low, high = (bounded[n_rows]["rss_mib"] for n_rows in SIZES[1:])
+    assert high <= low + BOUND_SLACK_MIB, (
+        f"with the file on disk, RSS grew by {low:.1f} MiB at {SIZES[1]} rows "
+        f"but {high:.1f} MiB at {SIZES[-1]}"
+    )
+    print(
+        f"\nbounded: {largest:.1f} MiB at {SIZES[-1]} rows with the "
+        f"{spool_mib:.0f} MiB spool; {low:.1f} -> {high:.1f} MiB from "
+        f"{SIZES[1]} to {SIZES[-1]} rows once the file is on disk"
+    )
+
+
+if __name__ == "__main__":
+    main()
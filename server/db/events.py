@@ -0,0 +1,180 @@
+# db/events.py
+from collections import Counter
+
+from sqlalchemy import event, inspect
+
+from db.connection import SessionLocal
+from models import Application, DepartmentUsers, User, VerticalOwnerMap
+from services.auth.session_cache import auth_cache
+from services.caching.aggregate_cache import aggregate_cache
+from services.caching.data_versions import bump_versions, group_of
+from services.summaries.app_summary import (
+    SUMMARY_FIELDS,
+    apply_summary_deltas,
+    summary_key,
+)
+
+
+def _previous_values(app: Application) -> dict:
+    state = inspect(app)
+    values = {}
+    for field in SUMMARY_FIELDS:
+        history = state.attrs[field].history
+        if history.deleted:
+            values[field] = history.deleted[0]
+        elif history.unchanged:
+            values[field] = history.unchanged[0]
+        else:
+            values[field] = getattr(app, field)
+    return values
+
+
+def _current_values(app: Application) -> dict:
+    return {field: getattr(app, field) for field in SUMMARY_FIELDS}
+
+
+def track_app_summary_changes(session, flush_context):
+    """Keep AppSummaryCounter in step with Application rows in the same transaction."""
+    deltas: Counter = Counter()
+
+    for obj in session.new:
+        if isinstance(obj, Application):
+            key = summary_key(_current_values(obj))
+            if key:
+                deltas[key] += 1
+
+    for obj in session.dirty:
+        if isinstance(obj, Application):
+            old_key = summary_key(_previous_values(obj))
+            new_key = summary_key(_current_values(obj))
+            if old_key != new_key:
+                if old_key:
+                    deltas[old_key] -= 1
+                if new_key:
+                    deltas[new_key] += 1
+
+    for obj in session.deleted:
+        if isinstance(obj, Application):
+            key = summary_key(_previous_values(obj))
+            if key:
+                deltas[key] -= 1
+
+    if deltas:
+        apply_summary_deltas(session.connection(), deltas)
+
+
+# Load the old value when one of these is set on an expired instance, so the
+# flush hook can always tell which counter an app is leaving.
+def _load_old_value(target, value, oldvalue, initiator):
+    pass
+
+
+for _field in SUMMARY_FIELDS:
+    event.listen(
+        getattr(Application, _field), "set", _load_old_value, active_history=True
+    )
+
+event.listen(SessionLocal, "after_flush", track_app_summary_changes)
+
+
+# ----------------------- Auth cache revocation -----------------------
+
+
+def _affected_user_id(obj) -> str | None:
+    if isinstance(obj, User):
+        return obj.id
+    if isinstance(obj, (DepartmentUsers, VerticalOwnerMap)):
+        return obj.user_id
+    return None
+
+
+def track_auth_user_changes(session, flush_context):
+    """Remember users whose role, state or department / vertical links changed."""
+    user_ids = session.info.setdefault("auth_changed_user_ids", set())
+    for obj in (*session.dirty, *session.deleted, *session.new):
+        user_id = _affected_user_id(obj)
+        if user_id is not None:
+            user_ids.add(user_id)
+
+
+def revoke_changed_users(session):
+    for user_id in session.info.pop("auth_changed_user_ids", ()):
+        auth_cache.revoke_user(user_id)
+
+
+def forget_changed_users(session):
+    session.info.pop("auth_changed_user_ids", None)
+
+
+event.listen(SessionLocal, "after_flush", track_auth_user_changes)
+event.listen(SessionLocal, "after_commit", revoke_changed_users)
+event.listen(SessionLocal, "after_rollback", forget_changed_users)
+
+
+# ----------------------- Data versions -----------------------
+
+
+def _pending_groups(session) -> set[str]:
+    return session.info.setdefault("pending_data_groups", set())
+
+
+def track_changed_data_groups(session, flush_context):
+    """Remember every table group written by this flush."""
+    groups = _pending_groups(session)
+    for obj in (*session.new, *session.deleted):
+        groups.add(group_of(type(obj)))
+    for obj in session.dirty:
+        if session.is_modified(obj, include_collections=False):
+            groups.add(group_of(type(obj)))
+    groups.discard(None)
+
+
+def track_data_groups_on_dml(orm_execute_state):
+    """Same for ORM enabled insert() / update() / delete() statements."""
+    if not (
+        orm_execute_state.is_insert
+        or orm_execute_state.is_update
+        or orm_execute_state.is_delete
+    ):
+        return
+
+    mapper = orm_execute_state.bind_mapper
+    group = group_of(mapper.class_) if mapper is not None else None
+    if group:
+        _pending_groups(orm_execute_state.session).add(group)
+
+
+def bump_changed_data_versions(session):
+    """
+    Bump each written group once per transaction, just before it commits.
+
+    Bumping per flush would take the data_versions row locks early, in
+    whatever order the flushes wrote, and hold them for the rest of the
+    transaction. Writers would queue behind each other and could deadlock.
+    Here every lock is taken at the end, in sorted order.
+    """
+    # commit flushes after this hook, so flush now to see the last writes
+    session.flush()
+    groups = session.info.pop("pending_data_groups", None)
+    if groups:
+        bump_versions(session.connection(), groups)
+        session.info.setdefault("changed_data_groups", set()).update(groups)
+
+
+def invalidate_changed_aggregates(session):
+    """Other workers notice the new versions; this one can drop entries now."""
+    groups = session.info.pop("changed_data_groups", None)
+    if groups:
+        aggregate_cache.invalidate(groups)
+
+
+def forget_changed_groups(session):
+    session.info.pop("pending_data_groups", None)
+    session.info.pop("changed_data_groups", None)
+
+
+event.listen(SessionLocal, "after_flush", track_changed_data_groups)
+event.listen(SessionLocal, "do_orm_execute", track_data_groups_on_dml)
+event.listen(SessionLocal, "before_commit", bump_changed_data_versions)
+event.listen(SessionLocal, "after_commit", invalidate_changed_aggregates)
+event.listen(SessionLocal, "after_rollback", forget_changed_groups)
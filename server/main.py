@@ -6,14 +6,17 @@ from slowapi.errors import RateLimitExceeded
 from slowapi.middleware import SlowAPIMiddleware
 
 from services.extensions.rate_limiter import limiter
+from services.caching.data_versions import NotModified, not_modified_handler
 
 # from db.events import checklist_complete_update
+from db.events import track_app_summary_changes
 from api.routes import (
     application_routes,
     auth_routes,
     department_routes,
     comments_routes,
     dashboard_routes,
+    trend_routes,
     file_serving,
     user_management_routes,
     export_routes,
@@ -36,6 +39,7 @@ app.add_exception_handler(
         content={"detail": "Rate limit exceeded. Try again after sometime."},
     ),
 )
+app.add_exception_handler(NotModified, not_modified_handler)
 app.add_middleware(SlowAPIMiddleware)
 
 app.add_middleware(
@@ -105,9 +109,12 @@ app.include_router(application_routes.router)
 app.include_router(department_routes.router)
 app.include_router(comments_routes.router)
 app.include_router(dashboard_routes.router)
+app.include_router(dashboard_routes.stats_router)
+app.include_router(trend_routes.router)
 app.include_router(file_serving.router)
 app.include_router(user_management_routes.router)
 app.include_router(export_routes.router)
+app.include_router(export_routes.jobs_router)
 app.include_router(evidence_routes.router)
 app.include_router(dept_questionnaire_routes.router)
 app.include_router(app_questions_routes.router)
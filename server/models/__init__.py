@@ -23,3 +23,6 @@ from .department_controls import DepartmentControl, ApplicationControlResult
 from .verticals import Vertical, VerticalOwnerMap
 from .user_sessions import UserSession
 from .exec_summary import ExecutiveSummary
+from .app_summary_counters import AppSummaryCounter
+from .data_versions import DataVersion
+from .app_status_snapshots import AppStatusSnapshot
@@ -0,0 +1,49 @@
+from datetime import date
+
+from sqlalchemy import Date, Index, Integer, String, UniqueConstraint
+from sqlalchemy.orm import Mapped, mapped_column
+
+from db.base import Base
+
+
+class AppStatusSnapshot(Base):
+    """
+    Daily fact table of active application counts, written once a day by
+    services.summaries.status_snapshots. Trend dashboards read only this table.
+
+    Rows with department_id 0 count applications; the others count
+    application departments in `dept_status`.
+    """
+
+    __tablename__ = "app_status_snapshots"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+
+    snapshot_date: Mapped[date] = mapped_column(Date, nullable=False)
+
+    # 0 / "" stand in for NULL so the unique key covers every row
+    vertical_id: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    scope: Mapped[str] = mapped_column(String(40), nullable=False, default="")
+    app_priority: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    severity: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    # normalized status, e.g. "in_progress"
+    app_status: Mapped[str] = mapped_column(String(40), nullable=False, default="")
+    department_id: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    dept_status: Mapped[str] = mapped_column(String(40), nullable=False, default="")
+
+    item_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+
+    __table_args__ = (
+        UniqueConstraint(
+            "snapshot_date",
+            "vertical_id",
+            "scope",
+            "app_priority",
+            "severity",
+            "app_status",
+            "department_id",
+            "dept_status",
+            name="uix_app_status_snapshot_key",
+        ),
+        Index("ix_app_status_snapshots_dept_date", "department_id", "snapshot_date"),
+    )
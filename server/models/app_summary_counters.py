@@ -0,0 +1,42 @@
+from sqlalchemy import Boolean, Integer, String, UniqueConstraint
+from sqlalchemy.orm import Mapped, mapped_column
+
+from db.base import Base
+
+
+class AppSummaryCounter(Base):
+    """
+    Count of active applications per summary key. Maintained on flush by
+    db.events so the unfiltered apps summary is a read of a handful of rows.
+    """
+
+    __tablename__ = "app_summary_counters"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+
+    # normalized status, e.g. "in_progress"
+    status: Mapped[str] = mapped_column(String(40), nullable=False, default="")
+    # "" when the application has no app_type
+    app_type: Mapped[str] = mapped_column(String(100), nullable=False, default="")
+    env_internal: Mapped[bool] = mapped_column(Boolean, nullable=False, default=False)
+    env_external: Mapped[bool] = mapped_column(Boolean, nullable=False, default=False)
+    is_app_ai: Mapped[bool] = mapped_column(Boolean, nullable=False, default=False)
+    is_privacy_applicable: Mapped[bool] = mapped_column(
+        Boolean, nullable=False, default=False
+    )
+    app_priority: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+
+    app_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+
+    __table_args__ = (
+        UniqueConstraint(
+            "status",
+            "app_type",
+            "env_internal",
+            "env_external",
+            "is_app_ai",
+            "is_privacy_applicable",
+            "app_priority",
+            name="uix_app_summary_key",
+        ),
+    )
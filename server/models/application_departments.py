@@ -1,4 +1,4 @@
-from sqlalchemy import ForeignKey, Integer, String, UniqueConstraint, DateTime
+from sqlalchemy import ForeignKey, Integer, String, UniqueConstraint, DateTime, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from datetime import datetime
 
@@ -28,7 +28,27 @@ class ApplicationDepartments(Base, BaseMixin):
         nullable=True,
     )
 
+    # Denormalized pointers, kept current by create_comment and
+    # create_app_exec_summary (services/summaries/app_dept_pointers.py)
+    latest_comment_id: Mapped[str | None] = mapped_column(
+        String(40),
+        ForeignKey("comments.id", ondelete="set null", onupdate="cascade"),
+        nullable=True,
+    )
+    latest_exec_summary_id: Mapped[str | None] = mapped_column(
+        String(40),
+        ForeignKey("executive_summaries.id", ondelete="set null", onupdate="cascade"),
+        nullable=True,
+    )
+    comment_count: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=0, server_default="0"
+    )
+
     updated_by_user = relationship("User", foreign_keys=[updated_by])
+    latest_comment = relationship("Comment", foreign_keys=[latest_comment_id])
+    latest_exec_summary = relationship(
+        "ExecutiveSummary", foreign_keys=[latest_exec_summary_id]
+    )
     # -- Table Constraints --
     __table_args__ = (
         UniqueConstraint(
@@ -36,4 +56,19 @@ class ApplicationDepartments(Base, BaseMixin):
             "department_id",
             name="uix_application_department",
         ),
+        Index(
+            "ix_app_depts_app_dept_active_status",
+            "application_id",
+            "department_id",
+            "is_active",
+            "status",
+        ),
+        Index(
+            "ix_app_depts_status_active_ended",
+            "status",
+            "is_active",
+            "ended_at",
+        ),
+        # change feed, see services/exports/change_feed.py
+        Index("ix_app_depts_updated_id", "updated_at", "id"),
     )
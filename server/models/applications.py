@@ -1,4 +1,16 @@
-from sqlalchemy import ForeignKey, String, Text, Integer, DateTime, Boolean, Date, and_
+from sqlalchemy import (
+    DDL,
+    ForeignKey,
+    String,
+    Text,
+    Integer,
+    DateTime,
+    Boolean,
+    Date,
+    Index,
+    and_,
+    event,
+)
 from sqlalchemy.orm import Mapped, mapped_column, relationship, foreign
 
 from datetime import datetime, date
@@ -59,6 +71,46 @@ class Application(Base, BaseMixin):
         String(40), default="is_assessment", nullable=True
     )
 
+    __table_args__ = (
+        Index("ix_applications_imitra_ticket_id", "imitra_ticket_id"),
+        Index(
+            "ix_applications_active_status_priority_started",
+            "is_active",
+            "status",
+            "app_priority",
+            "started_at",
+        ),
+        # Date range filters, see services/summaries/date_ranges.py
+        Index("ix_applications_started_at", "started_at"),
+        Index(
+            "ix_applications_active_status_completed",
+            "is_active",
+            "status",
+            "completed_at",
+        ),
+        # covers the unfiltered app type summary
+        Index(
+            "ix_applications_app_type_flags",
+            "app_type",
+            "is_app_ai",
+            "is_privacy_applicable",
+        ),
+        # change feed, see services/exports/change_feed.py
+        Index("ix_applications_updated_id", "updated_at", "id"),
+        # Search index, see services/search/app_search.py. Built with
+        # innodb_ft_enable_stopword = 0, by migration 3f9a6c1d8e27 and by
+        # create_all through the DDL events below
+        Index(
+            "ftx_applications_search",
+            "name",
+            "vendor_company",
+            "owner_name",
+            "imitra_ticket_id",
+            mysql_prefix="FULLTEXT",
+            mysql_with_parser="ngram",
+        ).ddl_if(dialect="mysql"),
+    )
+
     # -- Relationships --
     creator = relationship(
         "User", back_populates="created_applications", foreign_keys=[creator_id]
@@ -99,3 +151,20 @@ class Application(Base, BaseMixin):
 
     def __repr__(self) -> str:
         return f"<app_id={self.id}, app_name={self.name}>"
+
+
+# InnoDB reads innodb_ft_enable_stopword when a FULLTEXT index is built, and
+# the default stopwords break ngram search for short terms such as "ai".
+# after_create runs once the table's indexes exist.
+event.listen(
+    Application.__table__,
+    "before_create",
+    DDL("SET SESSION innodb_ft_enable_stopword = 0").execute_if(dialect="mysql"),
+)
+event.listen(
+    Application.__table__,
+    "after_create",
+    DDL("SET SESSION innodb_ft_enable_stopword = DEFAULT").execute_if(
+        dialect="mysql"
+    ),
+)
@@ -1,4 +1,4 @@
-from sqlalchemy import String, ForeignKey, Text, Integer
+from sqlalchemy import String, ForeignKey, Text, Integer, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.orm import Mapped, mapped_column
 from db.base import Base, BaseMixin
@@ -24,6 +24,17 @@ class Comment(Base, BaseMixin):
         ForeignKey("departments.id", ondelete="cascade", onupdate="cascade"),
         nullable=False,
     )
+    __table_args__ = (
+        Index(
+            "ix_comments_app_dept_created",
+            "application_id",
+            "department_id",
+            "created_at",
+        ),
+        # change feed, see services/exports/change_feed.py
+        Index("ix_comments_updated_id", "updated_at", "id"),
+    )
+
     # -- Relationships --
 
     author = relationship("User", back_populates="comments")
@@ -0,0 +1,16 @@
+from sqlalchemy import BigInteger, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from db.base import Base
+
+
+class DataVersion(Base):
+    """
+    Monotonic version per table group, bumped in the same transaction as any
+    write to the group (db.events). List and dashboard ETags are built from it.
+    """
+
+    __tablename__ = "data_versions"
+
+    name: Mapped[str] = mapped_column(String(40), primary_key=True)
+    version: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0)
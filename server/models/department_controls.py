@@ -1,4 +1,4 @@
-from sqlalchemy import ForeignKey, Integer, String, UniqueConstraint, DateTime
+from sqlalchemy import ForeignKey, Integer, String, UniqueConstraint, DateTime, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from datetime import datetime, timezone
 
@@ -37,6 +37,10 @@ class ApplicationControlResult(Base):
     )
     updated_at: Mapped[datetime] = mapped_column(DateTime, nullable=False, default=datetime.now(timezone.utc))
 
+    __table_args__ = (
+        Index("ix_app_control_results_app_control", "application_id", "department_control_id"),
+    )
+
     # --- Relationships ---
 
     application = relationship(
@@ -1,4 +1,4 @@
-from sqlalchemy import String, ForeignKey, Text, Integer
+from sqlalchemy import String, ForeignKey, Text, Integer, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.orm import Mapped, mapped_column
 from db.base import Base, BaseMixin
@@ -27,6 +27,18 @@ class ExecutiveSummary(Base, BaseMixin):
 
     scope: Mapped[str] = mapped_column(String(20), nullable=True, default="application")
 
+    __table_args__ = (
+        Index(
+            "ix_exec_summaries_app_dept_scope_created",
+            "application_id",
+            "department_id",
+            "scope",
+            "created_at",
+        ),
+        # change feed, see services/exports/change_feed.py
+        Index("ix_exec_summaries_updated_id", "updated_at", "id"),
+    )
+
     # -- Relationships --
 
     author = relationship("User", back_populates="executive_summaries")
@@ -1,4 +1,4 @@
-from sqlalchemy import ForeignKey, String, DateTime
+from sqlalchemy import ForeignKey, String, DateTime, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from db.base import Base, BaseMixin
 from services.auth.utils import hash_token, verify_token
@@ -24,6 +24,10 @@ class UserSession(Base, BaseMixin):
     expires_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)
     last_used_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
 
+    __table_args__ = (
+        Index("ix_user_sessions_user_active", "user_id", "is_active"),
+    )
+
     user = relationship("User", back_populates="sessions")
 
     def set_refresh_token(self, refresh_token: str) -> None:
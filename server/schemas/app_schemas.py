@@ -207,13 +207,23 @@ class NewAppListOut(BaseModel):
 
     @classmethod
     def from_application(
-        cls, app, db: Session, dept_filter_id: int | None = None, is_exec: bool = False
+        cls,
+        app,
+        db: Session,
+        dept_filter_id: int | None = None,
+        is_exec: bool = False,
+        departments_by_app: dict[str, list] | None = None,
     ):
-        depts_out = (
-            get_departments_with_latest_comment(app_id=app.id, db=db)
-            if not is_exec
-            else get_departments_with_latest_exec_sumary(app_id=app.id, db=db)
-        )
+        # Pages preload departments for every app (see
+        # load_departments_with_latest_comment), single apps fall back to a lookup
+        if departments_by_app is not None:
+            depts_out = departments_by_app.get(app.id, [])
+        else:
+            depts_out = (
+                get_departments_with_latest_comment(app_id=app.id, db=db)
+                if not is_exec
+                else get_departments_with_latest_exec_sumary(app_id=app.id, db=db)
+            )
 
         return cls(
             id=app.id,
@@ -262,6 +272,8 @@ class AppQueryParams(BaseModel):
     ] = Field(None, description="The field you want to search by")
     page: int = 1
     page_size: int = 15
+    pagination: Literal["offset", "cursor"] = "offset"
+    cursor: str | None = None
     status: list[str] | None = None
     vertical: str | None = None
     dept_filter_id: int | None = None
@@ -287,10 +299,20 @@ class AppQueryParams(BaseModel):
     scope: Literal["is_assessment", "vapt_only", "all"] = "is_assessment"
     mode: Literal["default", "executive"] = "default"
 
+    # Sparse fieldset, see services/projections/fieldsets.py
+    fields: list[str] | None = None
+
     @field_validator("sort_by")
     @classmethod
     def validate_sort_by(cls, v: str) -> str:
-        valid_fields = {"updated_at", "name", "created_at", "priority", "started_at"}
+        valid_fields = {
+            "updated_at",
+            "name",
+            "created_at",
+            "priority",
+            "started_at",
+            "relevance",
+        }
         if v not in valid_fields:
             raise ValueError(f"sort_by must be one of {valid_fields}")
         return v
@@ -324,3 +346,9 @@ class AppsSummaryOut(BaseModel):
     mobile_web_app_count: int | None = 0
     internal_environment_count: int | None = 0
     external_environment_count: int | None = 0
+
+
+class AppFacetsOut(BaseModel):
+    total_apps: int = 0
+    # facet -> value -> count, e.g. {"status": {"in_progress": 4}}
+    facets: dict[str, dict[str, int]]
@@ -100,6 +100,21 @@ class StatusPerDepartmentParams(BaseModel):
     dept_status: str
 
 
+class StatusMatrixParams(BaseModel):
+    severity: list[int] | None
+    priority: list[int] | None
+    app_age_from: date | None
+    app_age_to: date | None
+
+
+class StatusMatrixCell(BaseModel):
+    department_id: int
+    department: str
+    dept_status: str
+    app_status: str
+    count: int
+
+
 class AppTypeSummaryParams(BaseModel):
     severity: list[int] | None
     priority: list[int] | None
@@ -140,3 +155,62 @@ class ApplicationCompletionStats(BaseModel):
 class DateRangeParams(BaseModel):
     from_date: date | None = None
     to_date: date | None = None
+
+
+class DashboardBundleParams(BaseModel):
+    severity: list[int] | None
+    priority: list[int] | None
+    app_age_from: date | None
+    app_age_to: date | None
+    scope: Literal["is_assessment", "vapt_only"] = "is_assessment"
+    from_date: date | None = None
+    to_date: date | None = None
+
+
+class TrendQueryParams(BaseModel):
+    from_date: date | None = None
+    to_date: date | None = None
+    # one point per day, or the first snapshot of each week / month
+    interval: Literal["day", "week", "month"] = "day"
+    group_by: (
+        Literal["vertical", "priority", "severity", "scope", "department"] | None
+    ) = None
+    vertical_ids: list[int] | None = None
+    priority: list[int] | None = None
+    severity: list[int] | None = None
+    scope: str | None = None
+    department_id: int | None = None
+    app_status: str | None = None
+
+
+class TrendPoint(BaseModel):
+    snapshot_date: date
+    total: int
+    statuses: list[StatusCountItem]
+
+
+class TrendSeries(BaseModel):
+    key: str | None  # group value, None when not grouped
+    label: str | None
+    points: list[TrendPoint]
+
+
+class CycleTimeParams(BaseModel):
+    # application: started_at -> completed_at, department: started_at -> ended_at
+    level: Literal["application", "department"]
+    group_by: Literal["department", "vertical", "priority", "month"] | None = None
+    # on the date the work finished
+    from_date: date | None = None
+    to_date: date | None = None
+    department_id: int | None = None
+    vertical_ids: list[int] | None = None
+    priority: list[int] | None = None
+
+
+class CycleTimeStats(BaseModel):
+    key: str | None  # group value, None when not grouped
+    label: str | None
+    count: int
+    p50_days: float
+    p90_days: float
+    p99_days: float
@@ -0,0 +1,25 @@
+from datetime import datetime
+from typing import Literal
+
+from pydantic import BaseModel
+
+ExportTypeName = Literal[
+    "applications_csv", "applications_xlsx", "verticals_zip", "verticals_xlsx"
+]
+
+
+class ExportJobCreate(BaseModel):
+    export_type: ExportTypeName
+
+
+class ExportJobOut(BaseModel):
+    id: str
+    export_type: ExportTypeName
+    status: Literal["queued", "running", "done", "failed"]
+    # served from an artifact built earlier for the same data
+    cached: bool
+    bytes_written: int
+    error: str | None
+    created_at: datetime
+    finished_at: datetime | None
+    download_url: str | None
@@ -0,0 +1,528 @@
+# services/analytics/app_analytics.py
+"""
+Columnar in-memory copy of applications x application departments for the
+cross-filter dashboards.
+
+Both tables are held as NumPy arrays: statuses, app types and verticals as
+categorical codes, the rest as plain numeric / datetime columns. A dashboard
+query is then a few boolean masks and a `bincount` instead of a GROUP BY
+scan. Set DASHBOARD_ANALYTICS_ENGINE=1 and the dashboard controllers answer
+the app status, department status, statuses per department, app type,
+priority and vertical splits from here.
+
+Freshness: every call reads the data versions (one primary key lookup).
+When applications / application departments changed, rows whose updated_at
+falls after the last load (minus ANALYTICS_LOOKBACK_SECONDS, for writers
+that committed late) are re-read and upserted. A row count mismatch after
+that (hard deletes), a change to departments / verticals, or
+ANALYTICS_FULL_RELOAD_SECONDS passing reloads everything.
+
+The SQL implementations stay the reference; tests/test_app_analytics_parity.py
+compares the two after a full load and after an incremental refresh.
+"""
+
+import os
+import threading
+import time
+from collections import defaultdict
+from datetime import datetime, timedelta
+
+import numpy as np
+import pandas as pd
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from api.constants.priorities import PRIORITY_ID_TO_KEY
+from api.constants.statuses import ALL_APP_STATUSES, ALL_DEPT_STATUSES
+from models import Application, ApplicationDepartments, Department
+from schemas import dashboard_schemas as ds
+from services.caching.data_versions import read_versions
+from services.summaries.app_summary import normalize_status
+from services.summaries.date_ranges import day_bounds
+
+ANALYTICS_ENGINE_ENABLED = os.getenv("DASHBOARD_ANALYTICS_ENGINE", "0") == "1"
+ANALYTICS_FULL_RELOAD_SECONDS = float(
+    os.getenv("ANALYTICS_FULL_RELOAD_SECONDS", "900")
+)
+ANALYTICS_LOOKBACK_SECONDS = float(os.getenv("ANALYTICS_LOOKBACK_SECONDS", "300"))
+
+DATA_GROUPS = ("applications", "app_departments", "reference")
+VAPT_DEPARTMENTS = ("web vapt", "mobile vapt")
+
+APP_COLUMNS = (
+    Application.id,
+    Application.status,
+    Application.app_type,
+    Application.vertical,
+    Application.scope,
+    Application.severity,
+    Application.app_priority,
+    Application.is_active,
+    Application.is_app_ai,
+    Application.is_privacy_applicable,
+    Application.started_at,
+    Application.updated_at,
+)
+
+APP_DEPT_COLUMNS = (
+    ApplicationDepartments.id,
+    ApplicationDepartments.application_id,
+    ApplicationDepartments.department_id,
+    ApplicationDepartments.status,
+    ApplicationDepartments.is_active,
+    ApplicationDepartments.updated_at,
+)
+
+
+def _read_frame(db: Session, columns, *criteria) -> pd.DataFrame:
+    rows = db.execute(select(*columns).where(*criteria)).all()
+    return pd.DataFrame(rows, columns=[c.key for c in columns]).set_index("id")
+
+
+def _upsert(frame: pd.DataFrame, changed: pd.DataFrame) -> pd.DataFrame:
+    if changed.empty:
+        return frame
+    return pd.concat([frame.drop(changed.index, errors="ignore"), changed])
+
+
+def _codes(values) -> tuple[np.ndarray, np.ndarray, dict]:
+    """Categorical codes (-1 for NULL), the distinct values and value -> code."""
+    codes, uniques = pd.factorize(np.asarray(values, dtype=object))
+    uniques = np.asarray(uniques, dtype=object)
+    return codes, uniques, {value: code for code, value in enumerate(uniques)}
+
+
+def _count_by(codes: np.ndarray, mask: np.ndarray, size: int) -> np.ndarray:
+    selected = codes[mask]
+    return np.bincount(selected[selected >= 0], minlength=size)
+
+
+def _normalized_counts(values: np.ndarray, counts: np.ndarray) -> dict[str, int]:
+    result: dict[str, int] = defaultdict(int)
+    for code in np.flatnonzero(counts):
+        result[normalize_status(values[code])] += int(counts[code])
+    return result
+
+
+class _Snapshot:
+    """Immutable arrays for one load; queries never see a half refreshed state."""
+
+    def __init__(
+        self,
+        apps: pd.DataFrame,
+        app_depts: pd.DataFrame,
+        departments: dict[int, str],
+    ):
+        self.apps = apps
+        self.app_depts = app_depts
+        self.departments = departments
+
+        self.active = apps["is_active"].eq(True).to_numpy()
+        self.status, self.status_values, self.status_codes = _codes(apps["status"])
+        self.app_type, self.app_type_values, _ = _codes(apps["app_type"])
+        self.vertical, self.vertical_values, _ = _codes(apps["vertical"])
+        self.scope = np.asarray(apps["scope"], dtype=object)
+        self.severity = pd.to_numeric(apps["severity"]).to_numpy(
+            dtype=float, na_value=np.nan
+        )
+        self.priority = pd.to_numeric(apps["app_priority"]).to_numpy(
+            dtype=float, na_value=np.nan
+        )
+        self.is_ai = apps["is_app_ai"].eq(True).to_numpy()
+        self.is_privacy = apps["is_privacy_applicable"].eq(True).to_numpy()
+        self.started = pd.to_datetime(apps["started_at"]).to_numpy(
+            dtype="datetime64[us]"
+        )
+
+        self.ad_app = apps.index.get_indexer(app_depts["application_id"])
+        self.ad_dept = app_depts["department_id"].to_numpy(dtype=np.int64)
+        self.ad_status, self.ad_status_values, self.ad_status_codes = _codes(
+            app_depts["status"]
+        )
+        self.ad_active = app_depts["is_active"].eq(True).to_numpy()
+        self.n_depts = max(int(self.ad_dept.max(initial=0)), *departments, 0) + 1
+
+        vapt_ids = [
+            dept_id
+            for dept_id, name in departments.items()
+            if name.lower() in VAPT_DEPARTMENTS
+        ]
+        vapt_rows = (
+            self.ad_active & np.isin(self.ad_dept, vapt_ids) & (self.ad_app >= 0)
+        )
+        # the vapt_only scope is a join, so row counts repeat an app per vapt dept
+        self.vapt_rows_per_app = np.bincount(
+            self.ad_app[vapt_rows], minlength=len(apps)
+        )
+        self.is_vapt_app = self.vapt_rows_per_app > 0
+
+    def app_filter(
+        self,
+        severity: list[int] | None = None,
+        priority: list[int] | None = None,
+        started_from=None,
+        started_to=None,
+        status: str | None = None,
+    ) -> np.ndarray:
+        mask = np.ones(len(self.active), dtype=bool)
+        if severity:
+            mask &= np.isin(self.severity, severity)
+        if priority:
+            mask &= np.isin(self.priority, priority)
+        # comparisons with NaT are False, like NULL in SQL
+        start, end = day_bounds(started_from, started_to)
+        if start is not None:
+            mask &= self.started >= np.datetime64(start, "us")
+        if end is not None:
+            mask &= self.started < np.datetime64(end, "us")
+        if status is not None:
+            mask &= self.status == self.status_codes.get(status, -2)
+        return mask
+
+    def scope_mask(self, scope: str | None) -> np.ndarray:
+        if scope == "vapt_only":
+            return self.is_vapt_app
+        if scope == "is_assessment":
+            return self.scope == "is_assessment"
+        return np.ones(len(self.active), dtype=bool)
+
+    def rows_of(self, app_mask: np.ndarray) -> np.ndarray:
+        """App department rows whose application is in `app_mask` (inner join)."""
+        rows = np.zeros(len(self.ad_app), dtype=bool)
+        joined = self.ad_app >= 0
+        rows[joined] = app_mask[self.ad_app[joined]]
+        return rows
+
+
+class AppAnalytics:
+    def __init__(self, enabled: bool):
+        self.enabled = enabled
+        self._lock = threading.Lock()
+        self._snapshot: _Snapshot | None = None
+        self._versions: dict[str, int] | None = None
+        self._watermark: datetime | None = None
+        self._loaded_at = 0.0
+
+    # ----------------------- Loading -----------------------
+
+    def _is_current(self, versions: dict[str, int]) -> bool:
+        return (
+            self._snapshot is not None
+            and versions == self._versions
+            and time.monotonic() - self._loaded_at < ANALYTICS_FULL_RELOAD_SECONDS
+        )
+
+    def snapshot(self, db: Session) -> _Snapshot:
+        versions = read_versions(db, DATA_GROUPS)
+        if self._is_current(versions):
+            return self._snapshot
+        with self._lock:
+            if not self._is_current(versions):
+                self._refresh(db, versions)
+            return self._snapshot
+
+    def _refresh(self, db: Session, versions: dict[str, int]) -> None:
+        full = (
+            self._snapshot is None
+            or self._watermark is None
+            or versions.get("reference") != self._versions.get("reference")
+            or time.monotonic() - self._loaded_at >= ANALYTICS_FULL_RELOAD_SECONDS
+        )
+
+        if not full:
+            since = self._watermark - timedelta(seconds=ANALYTICS_LOOKBACK_SECONDS)
+            apps = _upsert(
+                self._snapshot.apps,
+                _read_frame(db, APP_COLUMNS, Application.updated_at >= since),
+            )
+            app_depts = _upsert(
+                self._snapshot.app_depts,
+                _read_frame(
+                    db, APP_DEPT_COLUMNS, ApplicationDepartments.updated_at >= since
+                ),
+            )
+            app_count = db.scalar(select(func.count(Application.id)))
+            app_dept_count = db.scalar(select(func.count(ApplicationDepartments.id)))
+            full = len(apps) != app_count or len(app_depts) != app_dept_count
+
+        if full:
+            apps = _read_frame(db, APP_COLUMNS)
+            app_depts = _read_frame(db, APP_DEPT_COLUMNS)
+            self._loaded_at = time.monotonic()
+
+        departments = dict(db.execute(select(Department.id, Department.name)).all())
+
+        watermarks = [
+            frame["updated_at"].max()
+            for frame in (apps, app_depts)
+            if not frame.empty
+        ]
+        self._watermark = max(watermarks).to_pydatetime() if watermarks else None
+        self._snapshot = _Snapshot(apps, app_depts, departments)
+        self._versions = versions
+
+    # ----------------------- Queries -----------------------
+    # Each mirrors the dashboard_controller function of the same name,
+    # including its quirks (which filters apply to which count).
+
+    def get_app_status_summary(
+        self, db: Session, params: ds.AppSummaryQueryParams | None
+    ) -> ds.ApplicationSummary:
+        s = self.snapshot(db)
+
+        filtered = s.active.copy()
+        scope = None
+        if params:
+            both_ages = params.app_age_from and params.app_age_to
+            filtered &= s.app_filter(
+                severity=params.severity,
+                priority=params.priority,
+                started_from=params.app_age_from if both_ages else None,
+                started_to=params.app_age_to if both_ages else None,
+            )
+            scope = params.scope
+
+        counts = _normalized_counts(
+            s.status_values,
+            _count_by(s.status, filtered & s.scope_mask(scope), len(s.status_values)),
+        )
+
+        return ds.ApplicationSummary(
+            total_apps=int(s.active.sum()),
+            filtered_apps=int(filtered.sum()),
+            status_chart=[
+                ds.StatusCountItem(status=status, count=counts.get(status, 0))
+                for status in ALL_APP_STATUSES
+            ],
+        )
+
+    def get_department_status_summary(
+        self, db: Session, params: ds.DeptSummaryQueryParams
+    ) -> ds.DepartmentSummaryResponse:
+        s = self.snapshot(db)
+
+        app_mask = s.app_filter(
+            severity=params.severity,
+            priority=params.priority,
+            started_from=params.app_age_from,
+            started_to=params.app_age_to if params.app_age_from else None,
+            status=params.status if params.status != "all" else None,
+        )
+
+        rows = s.ad_active & (s.ad_status >= 0)
+        if (
+            params.status
+            or params.app_age_from
+            or params.app_age_to
+            or params.severity
+            or params.priority
+        ):
+            rows &= s.rows_of(app_mask)
+
+        n_statuses = len(s.ad_status_values)
+        counts = np.bincount(
+            s.ad_dept[rows] * n_statuses + s.ad_status[rows],
+            minlength=s.n_depts * n_statuses,
+        ).reshape(s.n_depts, n_statuses)
+
+        raw: dict[str, dict] = {}
+        for dept_id in np.flatnonzero(counts.sum(axis=1)):
+            if dept_id not in s.departments:
+                continue
+            dept_key = normalize_status(s.departments[dept_id])
+            entry = raw.setdefault(
+                dept_key, {"dept_id": int(dept_id), "statuses": defaultdict(int)}
+            )
+            for status, count in _normalized_counts(
+                s.ad_status_values, counts[dept_id]
+            ).items():
+                entry["statuses"][status] += count
+
+        return ds.DepartmentSummaryResponse(
+            departments=[
+                ds.DepartmentSummaryItem(
+                    department_id=data["dept_id"],
+                    department=dept,
+                    total_apps=sum(data["statuses"].values()),
+                    statuses=[
+                        ds.DepartmentStatusItem(
+                            status=status, count=data["statuses"].get(status, 0)
+                        )
+                        for status in ALL_DEPT_STATUSES
+                    ],
+                )
+                for dept, data in raw.items()
+            ],
+            total_apps=int((s.active & app_mask).sum()),
+        )
+
+    def get_statuses_per_dept(
+        self, db: Session, params: ds.StatusPerDepartmentParams
+    ) -> list[dict]:
+        s = self.snapshot(db)
+
+        app_mask = s.app_filter(
+            severity=params.severity,
+            priority=params.priority,
+            started_from=params.app_age_from,
+            started_to=params.app_age_to if params.app_age_from else None,
+            status=params.app_status,
+        )
+        rows = (
+            s.ad_active
+            & s.rows_of(app_mask)
+            & (s.ad_status == s.ad_status_codes.get(params.dept_status, -2))
+        )
+        # (application, department) is unique, so rows are distinct apps
+        counts = np.bincount(s.ad_dept[rows], minlength=s.n_depts)
+
+        return [
+            {
+                "department_id": int(dept_id),
+                "department": s.departments[dept_id],
+                "count": int(counts[dept_id]),
+            }
+            for dept_id in np.flatnonzero(counts)
+            if dept_id in s.departments
+        ]
+
+    def get_status_matrix(
+        self, db: Session, params: ds.StatusMatrixParams
+    ) -> list[ds.StatusMatrixCell]:
+        s = self.snapshot(db)
+
+        app_mask = s.app_filter(
+            severity=params.severity,
+            priority=params.priority,
+            started_from=params.app_age_from,
+            started_to=params.app_age_to if params.app_age_from else None,
+        )
+        rows = s.ad_active & s.rows_of(app_mask) & (s.ad_status >= 0)
+        app_status = np.full(len(rows), -1)
+        app_status[rows] = s.status[s.ad_app[rows]]
+        rows &= app_status >= 0
+
+        n_dept_statuses = len(s.ad_status_values)
+        n_app_statuses = len(s.status_values)
+        counts = np.bincount(
+            (s.ad_dept[rows] * n_dept_statuses + s.ad_status[rows]) * n_app_statuses
+            + app_status[rows],
+            minlength=s.n_depts * n_dept_statuses * n_app_statuses,
+        ).reshape(s.n_depts, n_dept_statuses, n_app_statuses)
+
+        return [
+            ds.StatusMatrixCell(
+                department_id=int(dept_id),
+                department=s.departments[dept_id],
+                dept_status=s.ad_status_values[dept_status],
+                app_status=s.status_values[app_status_code],
+                count=int(counts[dept_id, dept_status, app_status_code]),
+            )
+            for dept_id, dept_status, app_status_code in zip(*np.nonzero(counts))
+            if dept_id in s.departments
+        ]
+
+    def get_app_types_summary(
+        self, db: Session, params: ds.AppTypeSummaryParams
+    ) -> list[ds.AppTypeSummaryItem]:
+        s = self.snapshot(db)
+
+        mask = s.app_filter(
+            severity=params.severity,
+            priority=params.priority,
+            started_from=params.app_age_from,
+            started_to=params.app_age_to if params.app_age_from else None,
+            status=(
+                params.app_status
+                if params.app_status and params.app_status != "all"
+                else None
+            ),
+        )
+
+        # NULL app_type gets the slot after the last value
+        null_code = len(s.app_type_values)
+        codes = np.where(s.app_type >= 0, s.app_type, null_code)
+        total = np.bincount(codes[mask], minlength=null_code + 1)
+        ai = np.bincount(codes[mask & s.is_ai], minlength=null_code + 1)
+        privacy = np.bincount(codes[mask & s.is_privacy], minlength=null_code + 1)
+
+        return [
+            ds.AppTypeSummaryItem(
+                app_type=(s.app_type_values[code] if code < null_code else None)
+                or "Unknown",
+                total=int(total[code]),
+                ai=int(ai[code]),
+                privacy=int(privacy[code]),
+                other=int(total[code] - ai[code] - privacy[code]),
+            )
+            for code in np.flatnonzero(total)
+        ]
+
+    def get_priority_wise_grouped_summary(
+        self, db: Session, status_filter: str | None
+    ) -> list[ds.PriorityCountItem]:
+        s = self.snapshot(db)
+
+        mask = s.active & s.app_filter(
+            status=status_filter if status_filter and status_filter != "all" else None
+        )
+
+        result = []
+        for priority_id, priority_label in PRIORITY_ID_TO_KEY.items():
+            status_counts = _normalized_counts(
+                s.status_values,
+                _count_by(
+                    s.status, mask & (s.priority == priority_id), len(s.status_values)
+                ),
+            )
+            total_apps = sum(status_counts.values())
+            if total_apps == 0:
+                continue
+            result.append(
+                ds.PriorityCountItem(
+                    priority=priority_label,
+                    total_apps=total_apps,
+                    statuses=[
+                        ds.StatusCountItem(status=status, count=count)
+                        for status, count in status_counts.items()
+                    ],
+                )
+            )
+        return result
+
+    def get_vertical_wise_app_statuses(
+        self, db: Session, params: ds.VerticalWiseSummaryParams
+    ) -> list[ds.VerticalStatusSummary]:
+        s = self.snapshot(db)
+
+        mask = s.active & s.scope_mask(params.scope) & (s.status >= 0)
+        null_code = len(s.vertical_values)
+        verticals = np.where(s.vertical >= 0, s.vertical, null_code)
+        n_statuses = len(s.status_values)
+        weights = s.vapt_rows_per_app[mask] if params.scope == "vapt_only" else None
+        counts = (
+            np.bincount(
+                verticals[mask] * n_statuses + s.status[mask],
+                weights=weights,
+                minlength=(null_code + 1) * n_statuses,
+            )
+            .astype(np.int64)
+            .reshape(null_code + 1, n_statuses)
+        )
+
+        return [
+            ds.VerticalStatusSummary(
+                vertical=s.vertical_values[code] if code < null_code else None,
+                total=int(counts[code].sum()),
+                statuses=[
+                    ds.StatusCountItem(
+                        status=s.status_values[status], count=int(counts[code, status])
+                    )
+                    for status in np.flatnonzero(counts[code])
+                ],
+            )
+            for code in np.flatnonzero(counts.sum(axis=1))
+        ]
+
+
+app_analytics = AppAnalytics(enabled=ANALYTICS_ENGINE_ENABLED)
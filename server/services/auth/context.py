@@ -0,0 +1,66 @@
+from dataclasses import dataclass
+
+from fastapi import Request
+from sqlalchemy import and_, select
+from sqlalchemy.orm import Session
+
+from models import DepartmentUsers, User, UserSession, VerticalOwnerMap
+
+
+@dataclass(frozen=True)
+class AuthContext:
+    """
+    Identity and authorization data for one request, built by
+    `get_current_user` and kept on `request.state.auth`.
+    """
+
+    user: User
+    session: UserSession
+    department_ids: frozenset[int]
+    vertical_ids: frozenset[int]
+
+    @property
+    def role(self) -> str:
+        return self.user.role
+
+    def is_user_of_dept(self, dept_id: int) -> bool:
+        return dept_id in self.department_ids
+
+
+def load_auth_context(session_id: str, db: Session) -> AuthContext | None:
+    """
+    Session, user, department ids and vertical ids in one round trip.
+
+    The outer joins give one row per (department, vertical) pair of the user,
+    which is a handful of rows at most.
+    """
+    rows = db.execute(
+        select(
+            UserSession,
+            User,
+            DepartmentUsers.department_id,
+            VerticalOwnerMap.vertical_id,
+        )
+        .join(User, User.id == UserSession.user_id)
+        .outerjoin(
+            DepartmentUsers,
+            and_(DepartmentUsers.user_id == User.id, DepartmentUsers.is_active),
+        )
+        .outerjoin(VerticalOwnerMap, VerticalOwnerMap.user_id == User.id)
+        .where(UserSession.id == session_id)
+    ).all()
+
+    if not rows:
+        return None
+
+    session, user = rows[0][0], rows[0][1]
+    return AuthContext(
+        user=user,
+        session=session,
+        department_ids=frozenset(r[2] for r in rows if r[2] is not None),
+        vertical_ids=frozenset(r[3] for r in rows if r[3] is not None),
+    )
+
+
+def get_request_auth(request: Request) -> AuthContext | None:
+    return getattr(request.state, "auth", None)
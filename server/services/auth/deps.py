@@ -12,6 +12,8 @@ from .jwt_handler import (
     set_jwt_cookies,
 )
 from .csrf_handler import generate_csrf_token
+from .context import AuthContext
+from .session_cache import auth_cache, load_auth_context_cached
 from datetime import datetime, timezone
 
 
@@ -23,6 +25,13 @@ def raise_403(detail: str):
     raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=detail)
 
 
+def deactivate_session(session: UserSession, db: Session):
+    session_id = session.id
+    session.is_active = False
+    db.commit()
+    auth_cache.revoke_session(session_id)
+
+
 def validate_session(
     session: UserSession,
     token: str,
@@ -32,18 +41,15 @@ def validate_session(
 ):
 
     if token_type == "access" and not session.verify_access_token(token):
-        session.is_active = False
-        db.commit()
+        deactivate_session(session=session, db=db)
         raise_401("Access token reuse detected.")
 
     elif token_type == "refresh" and not session.verify_refresh_token(token):
-        session.is_active = False
-        db.commit()
+        deactivate_session(session=session, db=db)
         raise_401("Refresh token reuse detected.")
 
     if session.user_agent != request.headers.get("user-agent"):
-        session.is_active = False
-        db.commit()
+        deactivate_session(session=session, db=db)
         raise_401("Token used on a different device.")
 
 
@@ -104,6 +110,7 @@ def refresh_tokens(
 
         db.commit()
         db.refresh(session)
+        auth_cache.revoke_session(session.id)
 
         set_jwt_cookies(
             response=response,
@@ -175,7 +182,10 @@ def get_current_user(
                 detail="Invalid or expired token.",
             )
 
-        session = db.get(UserSession, payload.get("sid"))
+        # Session, user, departments and verticals in one query, or none
+        # while the session is in the auth cache
+        auth = load_auth_context_cached(session_id=payload.get("sid"), db=db)
+        session = auth.session if auth else None
         if (
             not session
             or not session.is_active
@@ -202,8 +212,8 @@ def get_current_user(
             request=request,
         )
 
-        # Fetch the user (works for both valid or refreshed tokens)
-        user = db.get(User, payload.get("sub"))
+        # Loaded with the session (works for both valid or refreshed tokens)
+        user = auth.user
         if not user or not user.is_active:
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
@@ -231,6 +241,7 @@ def get_current_user(
                     detail="CSRF token missing or invalid",
                 )
 
+        request.state.auth = auth
         return user
     except HTTPException:
         raise
@@ -304,6 +315,12 @@ def get_current_session(
     return session
 
 
+def get_auth_context(
+    request: Request, current_user: User = Depends(get_current_user)
+) -> AuthContext:
+    return request.state.auth
+
+
 def require_moderator(current_user: User = Depends(get_current_user)) -> User:
     if current_user.role not in ["super_admin", "admin", "moderator"]:
         raise HTTPException(
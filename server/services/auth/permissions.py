@@ -1,9 +1,18 @@
 from sqlalchemy import select
 from sqlalchemy.orm import Session
 from models import DepartmentUsers
+from .context import AuthContext
 
 
-def is_user_of_dept(dept_id: int, user_id: str, db: Session) -> bool:
+def is_user_of_dept(
+    dept_id: int, user_id: str, db: Session, auth: AuthContext | None = None
+) -> bool:
+    # Active departments of the logged in user are already on the request.
+    # Membership here has never looked at is_active, so anything else still
+    # goes to the table
+    if auth is not None and auth.user.id == user_id and auth.is_user_of_dept(dept_id):
+        return True
+
     user_dept = db.scalar(
         select(DepartmentUsers).where(
             DepartmentUsers.user_id == user_id,
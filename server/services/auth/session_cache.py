@@ -0,0 +1,244 @@
+# services/auth/session_cache.py
+"""
+Short-TTL cache of AuthContext snapshots keyed by session id, so steady-state
+authenticated requests skip the auth query.
+
+Entries are plain column values, never ORM objects. A hit is turned back into
+User / UserSession instances with `Session.merge(load=False)`, which attaches
+them to the request's db session without a SELECT. Sensitive user columns are
+left out of the snapshot and load from the DB if something reads them.
+
+Token hashes and the CSRF token rotate on refresh. With redis, the
+`revoke_session` that goes with a rotation reaches every worker, so they are
+cached like the rest and a hit runs no auth query. The local LRU only hears
+about rotations made in its own process; a copy cached before another
+worker rotated would fail `validate_session` and deactivate a healthy
+session. So the local cache leaves them out and a hit still reads them with
+one primary key lookup. That is a deliberate gap from "no auth queries at
+steady state": it only closes with a shared cache.
+
+Revocation:
+  - `revoke_session` on logout, token rotation and session deactivation
+  - `revoke_user` after any committed change to a user or their department /
+    vertical links (db/events.py)
+
+By default the cache is an in-process LRU. Set AUTH_CACHE_REDIS_URL (and
+install `redis`) to share entries and revocations across uvicorn workers.
+A generation counter, bumped on every revocation, stops a request that
+loaded before a revocation from caching what it loaded.
+"""
+
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from datetime import date, datetime
+
+from sqlalchemy import Date, DateTime
+from sqlalchemy.orm import Session, make_transient_to_detached
+
+from models import User, UserSession
+from .context import AuthContext, load_auth_context
+
+AUTH_CACHE_TTL_SECONDS = float(os.getenv("AUTH_CACHE_TTL_SECONDS", "5"))
+AUTH_CACHE_MAX_ENTRIES = int(os.getenv("AUTH_CACHE_MAX_ENTRIES", "2048"))
+AUTH_CACHE_REDIS_URL = os.getenv("AUTH_CACHE_REDIS_URL")
+
+# Not needed to authorize a request, so not worth keeping in memory / redis
+EXCLUDED_USER_COLUMNS = frozenset(
+    {"password_hash", "mfa_secret", "mfa_recovery_codes"}
+)
+# Rotated on every refresh; see the module docstring for who caches them
+ROTATING_SESSION_COLUMNS = frozenset(
+    {"access_token_hash", "refresh_token_hash", "csrf_token"}
+)
+
+
+class LocalAuthCache:
+    # rotations in other workers never revoke this process's entries
+    excluded_session_columns = ROTATING_SESSION_COLUMNS
+
+    def __init__(self, ttl: float, max_entries: int):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[str, tuple[float, str, dict]] = OrderedDict()
+        self._sessions_by_user: dict[str, set[str]] = {}
+        self._generation = 0
+
+    def generation(self) -> int:
+        return self._generation
+
+    def get(self, session_id: str) -> dict | None:
+        with self._lock:
+            entry = self._entries.get(session_id)
+            if entry is None:
+                return None
+            expires_at, user_id, data = entry
+            if expires_at < time.monotonic():
+                self._drop(session_id)
+                return None
+            self._entries.move_to_end(session_id)
+            return data
+
+    def set(self, session_id: str, user_id: str, data: dict, generation: int) -> None:
+        with self._lock:
+            if generation != self._generation:
+                return
+            self._entries[session_id] = (time.monotonic() + self.ttl, user_id, data)
+            self._entries.move_to_end(session_id)
+            self._sessions_by_user.setdefault(user_id, set()).add(session_id)
+            while len(self._entries) > self.max_entries:
+                self._drop(next(iter(self._entries)))
+
+    def revoke_session(self, session_id: str) -> None:
+        with self._lock:
+            self._generation += 1
+            self._drop(session_id)
+
+    def revoke_user(self, user_id: str) -> None:
+        with self._lock:
+            self._generation += 1
+            for session_id in list(self._sessions_by_user.get(user_id, ())):
+                self._drop(session_id)
+
+    def _drop(self, session_id: str) -> None:
+        entry = self._entries.pop(session_id, None)
+        if entry is not None:
+            sessions = self._sessions_by_user.get(entry[1])
+            if sessions is not None:
+                sessions.discard(session_id)
+                if not sessions:
+                    del self._sessions_by_user[entry[1]]
+
+
+class RedisAuthCache:
+    GENERATION_KEY = "auth:generation"
+    # every rotation revokes the shared entry
+    excluded_session_columns = frozenset()
+
+    def __init__(self, url: str, ttl: float):
+        import redis
+
+        self.ttl_ms = int(ttl * 1000)
+        self._redis = redis.Redis.from_url(url)
+
+    @staticmethod
+    def _session_key(session_id: str) -> str:
+        return f"auth:session:{session_id}"
+
+    @staticmethod
+    def _user_key(user_id: str) -> str:
+        return f"auth:user:{user_id}"
+
+    def generation(self) -> int:
+        return int(self._redis.get(self.GENERATION_KEY) or 0)
+
+    def get(self, session_id: str) -> dict | None:
+        raw = self._redis.get(self._session_key(session_id))
+        return json.loads(raw) if raw else None
+
+    def set(self, session_id: str, user_id: str, data: dict, generation: int) -> None:
+        if generation != self.generation():
+            return
+        pipe = self._redis.pipeline()
+        pipe.set(self._session_key(session_id), json.dumps(data), px=self.ttl_ms)
+        pipe.sadd(self._user_key(user_id), session_id)
+        pipe.pexpire(self._user_key(user_id), self.ttl_ms)
+        pipe.execute()
+
+    def revoke_session(self, session_id: str) -> None:
+        pipe = self._redis.pipeline()
+        pipe.incr(self.GENERATION_KEY)
+        pipe.delete(self._session_key(session_id))
+        pipe.execute()
+
+    def revoke_user(self, user_id: str) -> None:
+        session_ids = self._redis.smembers(self._user_key(user_id))
+        pipe = self._redis.pipeline()
+        pipe.incr(self.GENERATION_KEY)
+        for session_id in session_ids:
+            pipe.delete(self._session_key(session_id.decode()))
+        pipe.delete(self._user_key(user_id))
+        pipe.execute()
+
+
+def _build_cache():
+    if AUTH_CACHE_REDIS_URL:
+        try:
+            return RedisAuthCache(url=AUTH_CACHE_REDIS_URL, ttl=AUTH_CACHE_TTL_SECONDS)
+        except ImportError:
+            print("AUTH_CACHE_REDIS_URL is set but redis is not installed, using local cache")
+    return LocalAuthCache(ttl=AUTH_CACHE_TTL_SECONDS, max_entries=AUTH_CACHE_MAX_ENTRIES)
+
+
+auth_cache = _build_cache()
+
+
+# ----------------------- Snapshots -----------------------
+
+
+def _dump_row(obj, exclude: frozenset[str] = frozenset()) -> dict:
+    values = {}
+    for column in obj.__table__.columns:
+        if column.key in exclude:
+            continue
+        value = getattr(obj, column.key)
+        if isinstance(value, (datetime, date)):
+            value = value.isoformat()
+        values[column.key] = value
+    return values
+
+
+def _load_row(model, values: dict, db: Session):
+    columns = model.__table__.columns
+    parsed = {}
+    for key, value in values.items():
+        if value is not None and isinstance(columns[key].type, DateTime):
+            value = datetime.fromisoformat(value)
+        elif value is not None and isinstance(columns[key].type, Date):
+            value = date.fromisoformat(value)
+        parsed[key] = value
+
+    obj = model()
+    for key, value in parsed.items():
+        setattr(obj, key, value)
+    # Columns not in the snapshot stay unloaded and are fetched on access
+    make_transient_to_detached(obj)
+    return db.merge(obj, load=False)
+
+
+def snapshot_auth_context(auth: AuthContext) -> dict:
+    return {
+        "session": _dump_row(
+            auth.session, exclude=auth_cache.excluded_session_columns
+        ),
+        "user": _dump_row(auth.user, exclude=EXCLUDED_USER_COLUMNS),
+        "department_ids": sorted(auth.department_ids),
+        "vertical_ids": sorted(auth.vertical_ids),
+    }
+
+
+def restore_auth_context(data: dict, db: Session) -> AuthContext:
+    return AuthContext(
+        user=_load_row(User, data["user"], db),
+        session=_load_row(UserSession, data["session"], db),
+        department_ids=frozenset(data["department_ids"]),
+        vertical_ids=frozenset(data["vertical_ids"]),
+    )
+
+
+def load_auth_context_cached(session_id: str, db: Session) -> AuthContext | None:
+    """`load_auth_context` behind the cache. Only active sessions are cached."""
+    data = auth_cache.get(session_id)
+    if data is not None:
+        return restore_auth_context(data, db)
+
+    generation = auth_cache.generation()
+    auth = load_auth_context(session_id=session_id, db=db)
+    if auth and auth.session.is_active and auth.user.is_active:
+        auth_cache.set(
+            session_id, auth.user.id, snapshot_auth_context(auth), generation
+        )
+    return auth
@@ -0,0 +1,197 @@
+# services/caching/aggregate_cache.py
+"""
+In-process cache for dashboard aggregates.
+
+`cached_aggregate(*groups)` wraps a controller function that takes a db
+session plus filter params. Entries are keyed by the function, its params
+normalized (list order, dates, pydantic models), today's date and the data
+versions of `groups`. Any committed write to those groups bumps a version
+(db/events.py), so the next call misses in every worker without having to
+broadcast anything; a local commit also drops the now unreachable entries.
+
+Entries are fresh for DASHBOARD_CACHE_TTL_SECONDS. After that, and for up to
+DASHBOARD_CACHE_STALE_SECONDS more, the old value is served while one
+background refresh recomputes it (stale-while-revalidate). The LRU is bounded
+by DASHBOARD_CACHE_MAX_ENTRIES. `aggregate_cache.stats()` reports hit/miss
+counters.
+"""
+
+import os
+import threading
+import time
+from collections import Counter, OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime
+from functools import wraps
+from typing import Any, Callable
+
+from pydantic import BaseModel
+from sqlalchemy.orm import Session
+
+from db.connection import SessionLocal
+from .data_versions import read_versions
+
+DASHBOARD_CACHE_TTL_SECONDS = float(os.getenv("DASHBOARD_CACHE_TTL_SECONDS", "30"))
+DASHBOARD_CACHE_STALE_SECONDS = float(
+    os.getenv("DASHBOARD_CACHE_STALE_SECONDS", "120")
+)
+DASHBOARD_CACHE_MAX_ENTRIES = int(os.getenv("DASHBOARD_CACHE_MAX_ENTRIES", "512"))
+
+
+class AggregateCache:
+    def __init__(self, ttl: float, stale_ttl: float, max_entries: int):
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        # key -> (fresh_until, stale_until, groups, value)
+        self._entries: OrderedDict[tuple, tuple[float, float, tuple, Any]] = (
+            OrderedDict()
+        )
+        self._refreshing: set[tuple] = set()
+        self._refresher = ThreadPoolExecutor(
+            max_workers=2, thread_name_prefix="aggregate-refresh"
+        )
+        self._counters: Counter = Counter()
+
+    def get_or_compute(
+        self,
+        key: tuple,
+        groups: tuple,
+        compute: Callable[[], Any],
+        refresh: Callable[[], Any],
+    ) -> Any:
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                fresh_until, stale_until, _, value = entry
+                if now < fresh_until:
+                    self._entries.move_to_end(key)
+                    self._counters["hits"] += 1
+                    return value
+                if now < stale_until:
+                    self._entries.move_to_end(key)
+                    self._counters["stale_hits"] += 1
+                    if key not in self._refreshing:
+                        self._refreshing.add(key)
+                        self._refresher.submit(self._refresh, key, groups, refresh)
+                    return value
+                self._entries.pop(key)
+            self._counters["misses"] += 1
+
+        value = compute()
+        self._set(key, groups, value)
+        return value
+
+    def _refresh(self, key: tuple, groups: tuple, refresh: Callable[[], Any]) -> None:
+        outcome = "refresh_errors"
+        try:
+            self._set(key, groups, refresh())
+            outcome = "refreshes"
+        except Exception as e:
+            print("Dashboard cache refresh failed:", e)
+        finally:
+            with self._lock:
+                self._counters[outcome] += 1
+                self._refreshing.discard(key)
+
+    def _set(self, key: tuple, groups: tuple, value: Any) -> None:
+        now = time.monotonic()
+        with self._lock:
+            self._entries[key] = (
+                now + self.ttl,
+                now + self.ttl + self.stale_ttl,
+                groups,
+                value,
+            )
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._counters["evictions"] += 1
+
+    def invalidate(self, groups) -> None:
+        groups = set(groups)
+        with self._lock:
+            for key in [k for k, e in self._entries.items() if groups & set(e[2])]:
+                del self._entries[key]
+                self._counters["invalidations"] += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            stats = {
+                name: self._counters[name]
+                for name in (
+                    "hits",
+                    "stale_hits",
+                    "misses",
+                    "refreshes",
+                    "refresh_errors",
+                    "evictions",
+                    "invalidations",
+                )
+            }
+            stats["entries"] = len(self._entries)
+        return stats
+
+
+aggregate_cache = AggregateCache(
+    ttl=DASHBOARD_CACHE_TTL_SECONDS,
+    stale_ttl=DASHBOARD_CACHE_STALE_SECONDS,
+    max_entries=DASHBOARD_CACHE_MAX_ENTRIES,
+)
+
+
+def normalize_params(value: Any) -> Any:
+    """Hashable form of a params value in which list order does not matter."""
+    if isinstance(value, BaseModel):
+        return normalize_params(value.model_dump())
+    if isinstance(value, dict):
+        return tuple(sorted((k, normalize_params(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return tuple(sorted((normalize_params(v) for v in value), key=repr))
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    return value
+
+
+def cached_aggregate(*groups: str):
+    """
+    Decorator for `fn(db, **params)` aggregate functions, e.g.
+        @cached_aggregate("applications", "app_departments")
+        def get_app_status_summary(db: Session, params): ...
+    """
+
+    def decorator(fn):
+        @wraps(fn)
+        def wrapper(*args, **kwargs):
+            if "db" in kwargs:
+                db: Session = kwargs.pop("db")
+            else:
+                db, *args = args
+
+            key = (
+                fn.__module__,
+                fn.__qualname__,
+                tuple(normalize_params(arg) for arg in args),
+                normalize_params(kwargs),
+                # SLA buckets and completion ages are relative to today
+                date.today().isoformat(),
+                tuple(sorted(read_versions(db, groups).items())),
+            )
+
+            def refresh():
+                with SessionLocal() as refresh_db:
+                    return fn(refresh_db, *args, **kwargs)
+
+            return aggregate_cache.get_or_compute(
+                key, groups, lambda: fn(db, *args, **kwargs), refresh
+            )
+
+        return wrapper
+
+    return decorator
@@ -0,0 +1,142 @@
+# services/caching/data_versions.py
+"""
+Data versions and ETags for read endpoints.
+
+Every table group below has a row in `data_versions` whose version goes up
+in the same transaction as any write to the group, once, right before the
+transaction commits (hooks in db/events.py).
+`DataVersionETag` is a route dependency: it reads the versions of the groups
+an endpoint depends on in one primary key lookup, derives an ETag from them,
+the request URL and the caller's authorization scope, and answers
+`If-None-Match` hits with 304 before the endpoint runs any query.
+"""
+
+import hashlib
+from datetime import date
+
+from fastapi import Depends, Request, Response
+from sqlalchemy import insert, select, update
+from sqlalchemy.dialects.mysql import insert as mysql_insert
+from sqlalchemy.orm import Session
+
+from db.connection import get_db_conn
+from models import (
+    Application,
+    ApplicationDepartments,
+    AppStatusSnapshot,
+    Comment,
+    DataVersion,
+    Department,
+    ExecutiveSummary,
+    Vertical,
+)
+from services.auth.context import AuthContext
+from services.auth.deps import get_auth_context
+
+TABLE_GROUPS = {
+    Application: "applications",
+    ApplicationDepartments: "app_departments",
+    Comment: "comments",
+    ExecutiveSummary: "exec_summaries",
+    Department: "reference",
+    Vertical: "reference",
+    AppStatusSnapshot: "snapshots",
+}
+
+ALL_GROUPS = tuple(dict.fromkeys(TABLE_GROUPS.values()))
+
+
+class NotModified(Exception):
+    def __init__(self, etag: str):
+        self.etag = etag
+
+
+def group_of(model) -> str | None:
+    return TABLE_GROUPS.get(model)
+
+
+def bump_versions(connection, groups) -> None:
+    for name in sorted(set(groups)):
+        if connection.dialect.name == "mysql":
+            stmt = mysql_insert(DataVersion).values(name=name, version=1)
+            connection.execute(
+                stmt.on_duplicate_key_update(
+                    version=DataVersion.__table__.c.version + 1
+                )
+            )
+            continue
+
+        result = connection.execute(
+            update(DataVersion)
+            .where(DataVersion.name == name)
+            .values(version=DataVersion.version + 1)
+        )
+        if result.rowcount == 0:
+            connection.execute(insert(DataVersion).values(name=name, version=1))
+
+
+def read_versions(db: Session, groups) -> dict[str, int]:
+    rows = db.execute(
+        select(DataVersion.name, DataVersion.version).where(
+            DataVersion.name.in_(groups)
+        )
+    ).all()
+    versions = {name: 0 for name in groups}
+    versions.update({name: version for name, version in rows})
+    return versions
+
+
+def build_etag(request: Request, auth: AuthContext, versions: dict[str, int]) -> str:
+    parts = [
+        request.url.path,
+        str(sorted(request.query_params.multi_items())),
+        # responses are filtered by role / departments / verticals
+        auth.role,
+        str(sorted(auth.department_ids)),
+        str(sorted(auth.vertical_ids)),
+        # SLA buckets and ages are relative to today
+        date.today().isoformat(),
+        str(sorted(versions.items())),
+    ]
+    digest = hashlib.sha256("|".join(parts).encode("utf-8")).hexdigest()[:32]
+    return f'W/"{digest}"'
+
+
+def _etag_matches(if_none_match: str | None, etag: str) -> bool:
+    if not if_none_match:
+        return False
+    candidates = {tag.strip() for tag in if_none_match.split(",")}
+    return "*" in candidates or etag in candidates
+
+
+class DataVersionETag:
+    """
+    Route dependency, e.g.
+        dependencies=[Depends(DataVersionETag("applications", "comments"))]
+    """
+
+    def __init__(self, *groups: str):
+        self.groups = groups or ALL_GROUPS
+
+    def __call__(
+        self,
+        request: Request,
+        response: Response,
+        db: Session = Depends(get_db_conn),
+        auth: AuthContext = Depends(get_auth_context),
+    ) -> str:
+        etag = build_etag(request, auth, read_versions(db, self.groups))
+
+        if _etag_matches(request.headers.get("if-none-match"), etag):
+            raise NotModified(etag)
+
+        response.headers["ETag"] = etag
+        response.headers["Cache-Control"] = "private, no-cache"
+        return etag
+
+
+async def not_modified_handler(request: Request, exc: NotModified) -> Response:
+    return Response(
+        status_code=304,
+        headers={"ETag": exc.etag, "Cache-Control": "private, no-cache"},
+    )
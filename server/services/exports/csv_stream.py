@@ -0,0 +1,42 @@
+# services/exports/csv_stream.py
+"""
+CSV bodies for StreamingResponse.
+
+`iter_csv` writes rows into a small StringIO and yields its contents every
+`chunk_rows` rows, so the client gets the header and first rows while the
+query is still streaming and memory stays at one chunk regardless of the
+export size.
+"""
+
+import csv
+from collections.abc import Iterable, Iterator
+from io import StringIO
+
+CSV_CHUNK_ROWS = 500
+
+
+def iter_csv(
+    columns: list[str],
+    rows: Iterable[dict],
+    chunk_rows: int = CSV_CHUNK_ROWS,
+) -> Iterator[str]:
+    buffer = StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=columns, extrasaction="ignore")
+    writer.writeheader()
+
+    pending = 0
+    for row in rows:
+        writer.writerow(row)
+        pending += 1
+        if pending >= chunk_rows:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+            pending = 0
+
+    if buffer.tell():
+        yield buffer.getvalue()
+
+
+def attachment_headers(filename: str) -> dict[str, str]:
+    return {"Content-Disposition": f"attachment; filename={filename}"}
@@ -0,0 +1,258 @@
+# services/exports/export_jobs.py
+"""
+Background export jobs with cached artifacts.
+
+`export_jobs.submit(db, export_type)` returns a job right away; a worker
+thread builds the file with its own session and writes it under
+EXPORT_ARTIFACT_DIR. Artifacts are named by export type plus a digest of the
+data versions the export reads (services/caching/data_versions.py), so:
+
+- a request for data that hasn't changed since the last build is done
+  immediately from the existing file, in any worker process;
+- a request while the same artifact is being built joins that job instead
+  of building it twice. Across processes this goes by the build's .part
+  file, so two workers that start the same build at the same moment may
+  both build it; the rename makes that harmless.
+
+The job id is the artifact's name without its extension, so any worker can
+answer for a job from the artifact directory alone: the artifact means done,
+a recently written .part file means running. Records in this process add
+what the disk can't tell (queued, failed, bytes written by a finished
+build) for EXPORT_JOB_RETENTION_SECONDS after the job finishes; a build that
+failed in another process reads as not found, and submitting again retries.
+
+Artifacts older than EXPORT_ARTIFACT_TTL_SECONDS are deleted, and past
+EXPORT_ARTIFACT_MAX_FILES the least recently used ones go first.
+"""
+
+import glob
+import hashlib
+import os
+import re
+import tempfile
+import threading
+import time
+import uuid
+from collections.abc import Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+
+from sqlalchemy.orm import Session
+
+from db.connection import SessionLocal
+from services.caching.data_versions import read_versions
+
+EXPORT_ARTIFACT_DIR = os.getenv(
+    "EXPORT_ARTIFACT_DIR", os.path.join(tempfile.gettempdir(), "exports")
+)
+EXPORT_ARTIFACT_TTL_SECONDS = float(os.getenv("EXPORT_ARTIFACT_TTL_SECONDS", "86400"))
+EXPORT_ARTIFACT_MAX_FILES = int(os.getenv("EXPORT_ARTIFACT_MAX_FILES", "20"))
+EXPORT_JOB_RETENTION_SECONDS = float(
+    os.getenv("EXPORT_JOB_RETENTION_SECONDS", "3600")
+)
+EXPORT_JOB_WORKERS = int(os.getenv("EXPORT_JOB_WORKERS", "2"))
+# a .part file not written to for this long belongs to a dead build
+EXPORT_PARTIAL_STALE_SECONDS = float(
+    os.getenv("EXPORT_PARTIAL_STALE_SECONDS", "300")
+)
+
+# <export type>-<16 hex digest>, the artifact name without its extension
+_JOB_ID_RE = re.compile(r"(?P<name>\w+)-[0-9a-f]{16}")
+
+
+@dataclass(frozen=True)
+class ExportType:
+    filename: str
+    media_type: str
+    # data version groups the export reads
+    groups: tuple[str, ...]
+    # db -> body chunks (str is written as UTF-8)
+    build: Callable[[Session], Iterable[str | bytes]]
+
+
+@dataclass
+class ExportJob:
+    id: str
+    export_type: str
+    filename: str
+    media_type: str
+    path: str
+    status: str = "queued"  # queued | running | done | failed
+    cached: bool = False
+    bytes_written: int = 0
+    error: str | None = None
+    created_at: float = field(default_factory=time.time)
+    finished_at: float | None = None
+
+
+class ExportJobQueue:
+    def __init__(self, artifact_dir: str, workers: int):
+        self.artifact_dir = artifact_dir
+        self.types: dict[str, ExportType] = {}
+        self._lock = threading.Lock()
+        self._jobs: dict[str, ExportJob] = {}
+        # artifact path -> job building it
+        self._building: dict[str, ExportJob] = {}
+        self._workers = ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="export-job"
+        )
+
+    def register(self, name: str, export_type: ExportType) -> None:
+        self.types[name] = export_type
+
+    def _artifact_path(self, name: str, versions: dict[str, int]) -> str:
+        export_type = self.types[name]
+        digest = hashlib.sha256(
+            f"{name}|{sorted(versions.items())}".encode("utf-8")
+        ).hexdigest()[:16]
+        extension = os.path.splitext(export_type.filename)[1]
+        return os.path.join(self.artifact_dir, f"{name}-{digest}{extension}")
+
+    def _new_job(self, name: str, path: str) -> ExportJob:
+        export_type = self.types[name]
+        return ExportJob(
+            id=os.path.splitext(os.path.basename(path))[0],
+            export_type=name,
+            filename=export_type.filename,
+            media_type=export_type.media_type,
+            path=path,
+        )
+
+    def _job_on_disk(self, job: ExportJob) -> ExportJob | None:
+        """`job` as the artifact directory shows it, None if nothing is there."""
+        try:
+            stat = os.stat(job.path)
+        except FileNotFoundError:
+            pass
+        else:
+            job.status = "done"
+            job.cached = True
+            job.bytes_written = stat.st_size
+            job.created_at = job.finished_at = stat.st_mtime
+            return job
+
+        cutoff = time.time() - EXPORT_PARTIAL_STALE_SECONDS
+        for partial in glob.glob(f"{glob.escape(job.path)}.*.part"):
+            try:
+                stat = os.stat(partial)
+            except FileNotFoundError:
+                continue
+            if stat.st_mtime >= cutoff:
+                job.status = "running"
+                job.bytes_written = stat.st_size
+                job.created_at = stat.st_ctime
+                return job
+        return None
+
+    def submit(self, db: Session, name: str) -> ExportJob:
+        export_type = self.types[name]
+        path = self._artifact_path(name, read_versions(db, export_type.groups))
+
+        with self._lock:
+            self._forget_finished_jobs()
+
+            building = self._building.get(path)
+            if building is not None:
+                return building
+
+            # done, or being built by another worker; get() follows that
+            # build from the disk, so only done jobs are recorded here
+            job = self._job_on_disk(self._new_job(name, path))
+            if job is not None:
+                if job.status == "done":
+                    os.utime(path)
+                    job.created_at = job.finished_at = time.time()
+                    self._jobs[job.id] = job
+                return job
+
+            job = self._new_job(name, path)
+            self._jobs[job.id] = job
+            self._building[path] = job
+
+        self._workers.submit(self._run, job)
+        return job
+
+    def get(self, job_id: str) -> ExportJob | None:
+        with self._lock:
+            job = self._jobs.get(job_id)
+        if job is not None:
+            return job
+
+        # submitted to another worker, or this one has forgotten it
+        match = _JOB_ID_RE.fullmatch(job_id)
+        if match is None or match["name"] not in self.types:
+            return None
+        extension = os.path.splitext(self.types[match["name"]].filename)[1]
+        path = os.path.join(self.artifact_dir, f"{job_id}{extension}")
+        return self._job_on_disk(self._new_job(match["name"], path))
+
+    def _run(self, job: ExportJob) -> None:
+        job.status = "running"
+        os.makedirs(self.artifact_dir, exist_ok=True)
+        # unique per build, in case another worker builds the same artifact
+        partial = f"{job.path}.{uuid.uuid4().hex}.part"
+
+        db = SessionLocal()
+        try:
+            with open(partial, "wb") as out:
+                for chunk in self.types[job.export_type].build(db):
+                    if isinstance(chunk, str):
+                        chunk = chunk.encode("utf-8")
+                    out.write(chunk)
+                    job.bytes_written += len(chunk)
+            # readers only ever see a complete file
+            os.replace(partial, job.path)
+            job.status = "done"
+        except Exception as e:
+            print("ERROR:", e)
+            job.status = "failed"
+            job.error = "Export failed"
+            if os.path.exists(partial):
+                os.remove(partial)
+        finally:
+            db.close()
+            job.finished_at = time.time()
+            with self._lock:
+                self._building.pop(job.path, None)
+            self._evict_artifacts()
+
+    def _forget_finished_jobs(self) -> None:
+        cutoff = time.time() - EXPORT_JOB_RETENTION_SECONDS
+        for job_id in [
+            job_id
+            for job_id, job in self._jobs.items()
+            if job.finished_at is not None and job.finished_at < cutoff
+        ]:
+            del self._jobs[job_id]
+
+    def _evict_artifacts(self) -> None:
+        """Drop expired artifacts, then the least recently used past the cap."""
+        with self._lock:
+            in_use = set(self._building)
+        try:
+            entries = [
+                entry
+                for entry in os.scandir(self.artifact_dir)
+                if entry.is_file() and entry.path not in in_use
+            ]
+        except FileNotFoundError:
+            return
+
+        entries.sort(key=lambda entry: entry.stat().st_mtime, reverse=True)
+        cutoff = time.time() - EXPORT_ARTIFACT_TTL_SECONDS
+        kept = 0
+        for entry in entries:
+            # .part files are only left behind by a worker that died mid build
+            partial = entry.name.endswith(".part")
+            if entry.stat().st_mtime >= cutoff and (
+                partial or kept < EXPORT_ARTIFACT_MAX_FILES
+            ):
+                kept += not partial
+                continue
+            try:
+                os.remove(entry.path)
+            except FileNotFoundError:
+                pass
+
+
+export_jobs = ExportJobQueue(EXPORT_ARTIFACT_DIR, EXPORT_JOB_WORKERS)
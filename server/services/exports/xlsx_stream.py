@@ -0,0 +1,95 @@
+# services/exports/xlsx_stream.py
+"""
+XLSX bodies for StreamingResponse, using openpyxl's write-only mode.
+
+Write-only worksheets serialize each appended row straight to the sheet's
+XML (in a temp file openpyxl removes on save) instead of keeping a cell
+tree, so building a workbook costs one row of memory however many rows it
+has. The finished archive is spooled (in memory while small, on disk past
+XLSX_SPOOL_BYTES) and sent in chunks.
+"""
+
+import re
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass, field
+from tempfile import SpooledTemporaryFile
+
+from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.cell.cell import ILLEGAL_CHARACTERS_RE
+from openpyxl.styles import Font
+from openpyxl.utils import get_column_letter
+
+XLSX_MEDIA_TYPE = "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+
+XLSX_SPOOL_BYTES = 8 * 1024 * 1024
+XLSX_CHUNK_BYTES = 64 * 1024
+
+DEFAULT_COLUMN_WIDTH = 16
+
+_SHEET_TITLE_RE = re.compile(r"[\[\]:*?/\\]")
+_SHEET_TITLE_MAX = 31
+
+
+@dataclass
+class Sheet:
+    title: str
+    columns: list[str]
+    rows: Iterable[dict]
+    # column name -> width in characters; DEFAULT_COLUMN_WIDTH otherwise
+    widths: dict[str, float] = field(default_factory=dict)
+
+
+def _sheet_title(title: str, used: set[str]) -> str:
+    """Excel titles are unique (case-insensitively), <= 31 chars, no []:*?/\\."""
+    base = _SHEET_TITLE_RE.sub("_", title).strip("'") or "Sheet"
+    candidate, n = base[:_SHEET_TITLE_MAX], 1
+    while candidate.lower() in used:
+        n += 1
+        suffix = f" ({n})"
+        candidate = base[: _SHEET_TITLE_MAX - len(suffix)] + suffix
+    used.add(candidate.lower())
+    return candidate
+
+
+def _cell_value(value):
+    # control characters make the sheet XML invalid
+    if isinstance(value, str):
+        return ILLEGAL_CHARACTERS_RE.sub("", value)
+    return value
+
+
+def _write_sheet(workbook: Workbook, sheet: Sheet, used_titles: set[str]) -> None:
+    ws = workbook.create_sheet(title=_sheet_title(sheet.title, used_titles))
+    ws.freeze_panes = "A2"
+    for idx, column in enumerate(sheet.columns, start=1):
+        ws.column_dimensions[get_column_letter(idx)].width = sheet.widths.get(
+            column, DEFAULT_COLUMN_WIDTH
+        )
+
+    bold = Font(bold=True)
+    header = []
+    for column in sheet.columns:
+        cell = WriteOnlyCell(ws, value=column)
+        cell.font = bold
+        header.append(cell)
+    ws.append(header)
+
+    for row in sheet.rows:
+        ws.append([_cell_value(row.get(column)) for column in sheet.columns])
+
+
+def iter_xlsx(sheets: Iterable[Sheet]) -> Iterator[bytes]:
+    workbook = Workbook(write_only=True)
+    used_titles: set[str] = set()
+    for sheet in sheets:
+        _write_sheet(workbook, sheet, used_titles)
+    if not used_titles:
+        # a workbook needs at least one sheet
+        _write_sheet(workbook, Sheet("Sheet", [], []), used_titles)
+
+    with SpooledTemporaryFile(max_size=XLSX_SPOOL_BYTES) as out:
+        workbook.save(out)
+        out.seek(0)
+        while chunk := out.read(XLSX_CHUNK_BYTES):
+            yield chunk
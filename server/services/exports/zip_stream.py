@@ -0,0 +1,65 @@
+# services/exports/zip_stream.py
+"""
+ZIP archives for StreamingResponse, built without a temp file.
+
+zipfile can write to a stream that can't seek: each entry's sizes and CRC
+then go in a data descriptor after its data instead of being patched into
+the local header. `iter_zip` hands zipfile such a sink and yields whatever
+it has written after every chunk, so only the compressor's window and the
+chunk being written are held in memory.
+
+Entry names are made unique (case-insensitively, as most unzip tools on
+Windows and macOS compare them) with a " (2)", " (3)", ... suffix; a
+repeated name would otherwise be extracted over the first one.
+"""
+
+import posixpath
+import zipfile
+from collections.abc import Iterable, Iterator
+
+
+class _ChunkSink:
+    """Write-only file object that keeps bytes until they are drained."""
+
+    def __init__(self):
+        self._chunks: list[bytes] = []
+
+    def write(self, data: bytes) -> int:
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def flush(self) -> None:
+        pass
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+def _unique_name(name: str, used: set[str]) -> str:
+    stem, extension = posixpath.splitext(name)
+    candidate, n = name, 1
+    while candidate.lower() in used:
+        n += 1
+        candidate = f"{stem} ({n}){extension}"
+    used.add(candidate.lower())
+    return candidate
+
+
+def iter_zip(entries: Iterable[tuple[str, Iterable[str]]]) -> Iterator[bytes]:
+    """Deflated archive of (name, text chunks) entries, encoded as UTF-8."""
+    sink = _ChunkSink()
+    used_names: set[str] = set()
+    with zipfile.ZipFile(sink, "w", zipfile.ZIP_DEFLATED) as archive:
+        for name, chunks in entries:
+            with archive.open(_unique_name(name, used_names), "w") as entry:
+                for chunk in chunks:
+                    entry.write(chunk.encode("utf-8"))
+                    if data := sink.drain():
+                        yield data
+            if data := sink.drain():
+                yield data
+
+    # central directory
+    yield sink.drain()
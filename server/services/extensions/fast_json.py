@@ -0,0 +1,28 @@
+# services/extensions/fast_json.py
+
+from typing import Any
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from pydantic_core import to_json
+
+
+class FastJSONResponse(JSONResponse):
+    """
+    JSON response that serializes straight to bytes in pydantic-core.
+
+    Returning a plain dict from a route makes FastAPI walk the whole payload
+    through jsonable_encoder (model_dump + copying every dict/list) before
+    json.dumps walks it again. Routes that return this response directly skip
+    that pass: pydantic models, datetimes, enums and UUIDs are written by the
+    Rust serializer in one go. Anything it does not know falls back to
+    jsonable_encoder for that value only.
+
+    FastAPI does not merge headers set by dependencies into a response the
+    route returns itself, so pass them on explicitly:
+
+        return FastJSONResponse(data, headers=response.headers)
+    """
+
+    def render(self, content: Any) -> bytes:
+        return to_json(content, fallback=jsonable_encoder)
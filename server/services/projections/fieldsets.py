@@ -0,0 +1,119 @@
+# services/projections/fieldsets.py
+"""
+Sparse fieldsets (`fields=name,status,departments`) for list endpoints and
+exports.
+
+A FieldSet maps public field names to columns. Requested column fields
+compile to a Core select of just those columns, so rows come back as plain
+tuples with no ORM identity map or eager loads. Relation fields are not
+columns; the endpoint loads them in one batch per page for the rows it
+returns.
+"""
+
+from sqlalchemy import ColumnElement
+
+from models import Application
+
+
+class FieldSet:
+    def __init__(
+        self,
+        columns: dict[str, ColumnElement],
+        relations: set[str] | None = None,
+        key: str = "id",
+    ):
+        self.columns = columns
+        self.relations = relations or set()
+        # always selected and returned, rows are identified by it
+        self.key = key
+
+    @property
+    def names(self) -> set[str]:
+        return set(self.columns) | self.relations
+
+    def parse(self, fields: list[str] | None) -> list[str] | None:
+        """Validate requested names. None means "no projection, full rows"."""
+        if not fields:
+            return None
+
+        requested = [f.strip() for f in fields if f and f.strip()]
+        unknown = set(requested) - self.names
+        if unknown:
+            raise ValueError(
+                f"Unknown fields {sorted(unknown)}, allowed: {sorted(self.names)}"
+            )
+
+        # keep request order, drop duplicates, key first
+        return list(dict.fromkeys([self.key, *requested]))
+
+    def select_columns(self, fields: list[str], extra: tuple[str, ...] = ()) -> list:
+        """Labelled columns for the requested fields plus any `extra` ones."""
+        names = dict.fromkeys(
+            [f for f in fields if f in self.columns]
+            + [f for f in extra if f in self.columns]
+        )
+        return [self.columns[name].label(name) for name in names]
+
+    def relations_in(self, fields: list[str]) -> set[str]:
+        return self.relations & set(fields)
+
+    def to_dicts(self, rows, fields: list[str]) -> list[dict]:
+        column_fields = [f for f in fields if f in self.columns]
+        return [{f: getattr(row, f) for f in column_fields} for row in rows]
+
+
+APP_LIST_FIELDS = FieldSet(
+    columns={
+        "id": Application.id,
+        "name": Application.name,
+        "description": Application.description,
+        "vertical": Application.vertical,
+        "vertical_id": Application.vertical_id,
+        "imitra_ticket_id": Application.imitra_ticket_id,
+        "status": Application.status,
+        "app_priority": Application.app_priority,
+        "environment": Application.environment,
+        "region": Application.region,
+        "owner_name": Application.owner_name,
+        "started_at": Application.started_at,
+        "completed_at": Application.completed_at,
+        "due_date": Application.due_date,
+        "created_at": Application.created_at,
+        "updated_at": Application.updated_at,
+        "app_type": Application.app_type,
+        "is_app_ai": Application.is_app_ai,
+        "is_privacy_applicable": Application.is_privacy_applicable,
+        "requested_date": Application.requested_date,
+        "vendor_company": Application.vendor_company,
+        "titan_spoc": Application.titan_spoc,
+        "app_url": Application.app_url,
+        "severity": Application.severity,
+    },
+    relations={"departments", "app_vertical", "latest_executive_summary"},
+)
+
+
+# /export/applications overview, CSV and XLSX. Names are the column headers;
+# "departments" is the <department>_status / <department>_comment columns.
+APP_EXPORT_FIELDS = FieldSet(
+    columns={
+        "application_id": Application.id,
+        "application_name": Application.name,
+        "description": Application.description,
+        "environment": Application.environment,
+        "region": Application.region,
+        "vendor_company": Application.vendor_company,
+        "app_priority": Application.app_priority,
+        "app_technology": Application.app_tech,
+        "vertical": Application.vertical,
+        "imitra_ticket_id": Application.imitra_ticket_id,
+        "overall_status": Application.status,
+        "titan_spoc": Application.titan_spoc,
+        "start_date": Application.started_at,
+        "app_url": Application.app_url,
+        "user_type": Application.user_type,
+        "data_type": Application.data_type,
+    },
+    relations={"departments"},
+    key="application_id",
+)
@@ -0,0 +1,240 @@
+# services/search/app_search.py
+"""
+Application search for /applications/list.
+
+On MySQL the name / vendor_company / owner_name / imitra_ticket_id columns
+carry an ngram FULLTEXT index (ftx_applications_search); MATCH ... AGAINST
+narrows the candidates and the original ILIKE re-checks them, so results are
+the same substring matches as before without a full table scan. The index
+must be built without stopwords (migration 3f9a6c1d8e27, and create_all
+through the DDL events in models/applications.py): the ngram parser
+drops every token containing one, so "ai" or "api" would match nothing.
+
+Other dialects use an in-process trigram index over the same columns. It is
+refreshed on every search from rows whose `updated_at` is past the newest
+one seen, minus SEARCH_LOOKBACK_SECONDS for writers that commit late, and
+rebuilt from scratch every SEARCH_FULL_RELOAD_SECONDS. A write that commits
+more than the lookback after its updated_at is picked up by that rebuild, so
+until then it can be missing from results. Postings are otherwise only
+added, which makes stale trigrams cost a few extra candidates, never wrong
+results, because SQL still applies the ILIKE.
+
+Ticket ids match by prefix so the plain index on imitra_ticket_id is used.
+"""
+
+import os
+import threading
+import time
+from collections import defaultdict
+from datetime import datetime, timedelta
+
+from sqlalchemy import case, literal, or_, select, union
+from sqlalchemy.dialects.mysql import match
+from sqlalchemy.orm import Session
+
+from models import Application
+
+# FULLTEXT ngram_token_size defaults to 2, trigrams need 3
+MIN_FULLTEXT_TERM = 2
+TRIGRAM = 3
+
+SEARCH_LOOKBACK_SECONDS = float(os.getenv("SEARCH_LOOKBACK_SECONDS", "300"))
+SEARCH_FULL_RELOAD_SECONDS = float(os.getenv("SEARCH_FULL_RELOAD_SECONDS", "900"))
+
+# columns covered by the search index (in FULLTEXT order) -> relevance weight
+SEARCH_FIELDS = {
+    "name": 4,
+    "vendor_company": 2,
+    "owner_name": 1,
+    "imitra_ticket_id": 3,
+}
+
+TEXT_FIELDS = ("name", "vendor_company", "owner_name")
+
+
+def _trigrams(text: str) -> set[str]:
+    text = text.lower()
+    return {text[i : i + TRIGRAM] for i in range(len(text) - TRIGRAM + 1)}
+
+
+class TrigramIndex:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._docs: dict[str, dict[str, str]] = {}
+        self._postings: dict[str, set[str]] = defaultdict(set)
+        self._watermark: datetime | None = None
+        self._loaded_at = 0.0
+
+    def refresh(self, db: Session) -> None:
+        stmt = select(
+            Application.id,
+            Application.updated_at,
+            *(getattr(Application, field) for field in SEARCH_FIELDS),
+        )
+        full = (
+            self._watermark is None
+            or time.monotonic() - self._loaded_at >= SEARCH_FULL_RELOAD_SECONDS
+        )
+        if not full:
+            since = self._watermark - timedelta(seconds=SEARCH_LOOKBACK_SECONDS)
+            stmt = stmt.where(Application.updated_at >= since)
+
+        rows = db.execute(stmt).all()
+
+        with self._lock:
+            if full:
+                self._docs = {}
+                self._postings = defaultdict(set)
+                self._watermark = None
+                self._loaded_at = time.monotonic()
+            for row in rows:
+                doc = {
+                    field: (getattr(row, field) or "").lower()
+                    for field in SEARCH_FIELDS
+                }
+                self._docs[row.id] = doc
+                for text in doc.values():
+                    for gram in _trigrams(text):
+                        self._postings[gram].add(row.id)
+
+                if self._watermark is None or row.updated_at > self._watermark:
+                    self._watermark = row.updated_at
+
+    def search(self, term: str, fields) -> dict[str, int]:
+        """app_id -> relevance for apps whose `fields` contain `term`."""
+        term = term.lower()
+
+        with self._lock:
+            grams = _trigrams(term)
+            candidates = set.intersection(*(self._postings.get(g, set()) for g in grams))
+
+            scores = {}
+            for app_id in candidates:
+                doc = self._docs[app_id]
+                score = 0
+                for field in fields:
+                    text = doc[field]
+                    if field == "imitra_ticket_id":
+                        hit = text.startswith(term)
+                    else:
+                        hit = term in text
+                    if not hit:
+                        continue
+                    # exact > prefix > somewhere in the middle
+                    if text == term:
+                        score += SEARCH_FIELDS[field] * 3
+                    elif text.startswith(term):
+                        score += SEARCH_FIELDS[field] * 2
+                    else:
+                        score += SEARCH_FIELDS[field]
+                if score:
+                    scores[app_id] = score
+
+            return scores
+
+
+trigram_index = TrigramIndex()
+
+
+def _fulltext_query(term: str) -> str:
+    # one quoted phrase, boolean operators stripped
+    return '"' + term.replace('"', " ") + '"'
+
+
+def _fulltext_match(term: str):
+    return match(
+        *(getattr(Application, field) for field in SEARCH_FIELDS),
+        against=literal(_fulltext_query(term)),
+    ).in_boolean_mode()
+
+
+def _ticket_prefix(term: str):
+    return Application.imitra_ticket_id.startswith(term, autoescape=True)
+
+
+def _field_rank(fields, term: str):
+    """exact > prefix > substring per field, weighted like the trigram index."""
+    score = literal(0)
+    for field in fields:
+        column = getattr(Application, field)
+        weight = SEARCH_FIELDS[field]
+        score = score + case(
+            (column == term, weight * 3),
+            (column.startswith(term, autoescape=True), weight * 2),
+            (column.contains(term, autoescape=True), weight),
+            else_=0,
+        )
+    return score
+
+
+def _is_mysql(db: Session) -> bool:
+    return db.get_bind().dialect.name == "mysql"
+
+
+def search_condition(db: Session, term: str, search_by: str | None):
+    """WHERE clause for `search`/`search_by` from AppQueryParams."""
+    term = term.strip()
+    search_value = f"%{term}%"
+
+    if search_by == "ticket_id":
+        return _ticket_prefix(term)
+
+    # Columns outside the index (environment, region, vertical) are short
+    # low-cardinality fields; plain ILIKE stays.
+    if search_by is not None and search_by not in TEXT_FIELDS:
+        return getattr(Application, search_by).ilike(search_value)
+
+    fields = (search_by,) if search_by else TEXT_FIELDS
+    substring = or_(*(getattr(Application, f).ilike(search_value) for f in fields))
+
+    if _is_mysql(db):
+        if len(term) < MIN_FULLTEXT_TERM:
+            indexed = substring
+        else:
+            indexed = _fulltext_match(term) & substring
+    elif len(term) < TRIGRAM:
+        indexed = substring
+    else:
+        trigram_index.refresh(db)
+        app_ids = trigram_index.search(term, fields)
+        indexed = Application.id.in_(list(app_ids)) & substring
+
+    if search_by:
+        return indexed
+
+    # MATCH inside an OR can't use the FULLTEXT index, so union the two
+    # index lookups instead
+    return Application.id.in_(
+        union(
+            select(Application.id).where(indexed),
+            select(Application.id).where(_ticket_prefix(term)),
+        )
+    )
+
+
+def search_rank(db: Session, term: str, search_by: str | None):
+    """Relevance expression for ORDER BY, higher is better."""
+    term = term.strip()
+
+    if search_by == "ticket_id":
+        fields = ("imitra_ticket_id",)
+    elif search_by in TEXT_FIELDS:
+        fields = (search_by,)
+    elif search_by is None:
+        fields = tuple(SEARCH_FIELDS)
+    else:
+        return literal(0)
+
+    # MATCH needs the full FULLTEXT column list, so it can only rank the
+    # unrestricted search; a single field is ranked on the filtered page
+    if _is_mysql(db) and search_by is None and len(term) >= MIN_FULLTEXT_TERM:
+        return _fulltext_match(term)
+
+    if _is_mysql(db) or len(term) < TRIGRAM:
+        return _field_rank(fields, term)
+
+    trigram_index.refresh(db)
+    scores = trigram_index.search(term, fields)
+    if not scores:
+        return literal(0)
+    return case(scores, value=Application.id, else_=0)
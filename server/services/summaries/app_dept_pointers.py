@@ -0,0 +1,152 @@
+# services/summaries/app_dept_pointers.py
+"""
+latest_comment_id / latest_exec_summary_id / comment_count on
+application_departments.
+
+The write paths (create_comment, create_app_exec_summary) call the
+`record_*` helpers before their commit so the pointer moves in the same
+transaction as the new row. The pointer only moves forward in
+(created_at, id) order, the order the backfill ranks by, so a transaction
+that commits after a newer row's does not point back at the older one.
+`backfill_app_dept_pointers` recomputes every row from comments /
+executive_summaries, for existing data or after manual edits.
+"""
+
+from sqlalchemy import and_, case, exists, func, or_, select, update
+from sqlalchemy.orm import Session
+
+from models import ApplicationDepartments, Comment, ExecutiveSummary
+
+
+def _app_dept_row(application_id: str, department_id: int):
+    return update(ApplicationDepartments).where(
+        ApplicationDepartments.application_id == application_id,
+        ApplicationDepartments.department_id == department_id,
+    )
+
+
+def _newer_pointer(model, pointer, row):
+    """`row.id` if it sorts after the row `pointer` references, else `pointer`."""
+    pointed_is_newer = exists().where(
+        model.id == pointer,
+        or_(
+            model.created_at > row.created_at,
+            and_(model.created_at == row.created_at, model.id > row.id),
+        ),
+    )
+    return case((pointed_is_newer, pointer), else_=row.id)
+
+
+def record_new_comment(db: Session, comment: Comment) -> None:
+    """Point the app department at `comment` and bump its comment count."""
+    db.flush()
+    db.execute(
+        _app_dept_row(comment.application_id, comment.department_id).values(
+            latest_comment_id=_newer_pointer(
+                Comment, ApplicationDepartments.latest_comment_id, comment
+            ),
+            comment_count=ApplicationDepartments.comment_count + 1,
+            # pointer bookkeeping is not a change to the department row
+            updated_at=ApplicationDepartments.updated_at,
+        )
+    )
+
+
+def record_new_exec_summary(db: Session, exec_summary: ExecutiveSummary) -> None:
+    """Point the app department at a new department scoped summary."""
+    if exec_summary.scope != "department" or exec_summary.department_id is None:
+        return
+
+    db.flush()
+    db.execute(
+        _app_dept_row(exec_summary.application_id, exec_summary.department_id).values(
+            latest_exec_summary_id=_newer_pointer(
+                ExecutiveSummary,
+                ApplicationDepartments.latest_exec_summary_id,
+                exec_summary,
+            ),
+            updated_at=ApplicationDepartments.updated_at,
+        )
+    )
+
+
+def _latest_ids(model, *criteria):
+    ranked = (
+        select(
+            model.id,
+            model.application_id,
+            model.department_id,
+            func.row_number()
+            .over(
+                partition_by=(model.application_id, model.department_id),
+                order_by=(model.created_at.desc(), model.id.desc()),
+            )
+            .label("rn"),
+        )
+        .where(*criteria)
+        .subquery()
+    )
+    return select(ranked.c.application_id, ranked.c.department_id, ranked.c.id).where(
+        ranked.c.rn == 1
+    )
+
+
+def backfill_app_dept_pointers(db: Session) -> int:
+    """Recompute the pointers and counts of every row. Returns rows changed."""
+    latest_comments = {
+        (app_id, dept_id): comment_id
+        for app_id, dept_id, comment_id in db.execute(_latest_ids(Comment)).all()
+    }
+    latest_exec_summaries = {
+        (app_id, dept_id): summary_id
+        for app_id, dept_id, summary_id in db.execute(
+            _latest_ids(ExecutiveSummary, ExecutiveSummary.scope == "department")
+        ).all()
+    }
+    comment_counts = {
+        (app_id, dept_id): count
+        for app_id, dept_id, count in db.execute(
+            select(Comment.application_id, Comment.department_id, func.count())
+            .group_by(Comment.application_id, Comment.department_id)
+        ).all()
+    }
+
+    changed = []
+    rows = db.execute(
+        select(
+            ApplicationDepartments.id,
+            ApplicationDepartments.application_id,
+            ApplicationDepartments.department_id,
+            ApplicationDepartments.latest_comment_id,
+            ApplicationDepartments.latest_exec_summary_id,
+            ApplicationDepartments.comment_count,
+        )
+    ).all()
+
+    for row in rows:
+        key = (row.application_id, row.department_id)
+        values = {
+            "latest_comment_id": latest_comments.get(key),
+            "latest_exec_summary_id": latest_exec_summaries.get(key),
+            "comment_count": comment_counts.get(key, 0),
+        }
+        if values != {field: getattr(row, field) for field in values}:
+            changed.append({"id": row.id, **values})
+
+    if changed:
+        db.execute(update(ApplicationDepartments), changed)
+    db.commit()
+
+    return len(changed)
+
+
+if __name__ == "__main__":
+    from db.connection import SessionLocal
+
+    session = SessionLocal()
+    try:
+        print(
+            f"Backfilled pointers on {backfill_app_dept_pointers(session)} application departments"
+        )
+    finally:
+        session.close()
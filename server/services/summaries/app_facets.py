@@ -0,0 +1,188 @@
+# services/summaries/app_facets.py
+"""
+Facet counts over a filtered applications subquery in one round trip.
+
+Dialects with GROUPING SETS (PostgreSQL, SQL Server, Oracle) aggregate every
+application level dimension in a single grouped SELECT. MySQL and SQLite get
+one GROUP BY per dimension glued together with UNION ALL. Department status
+counts need a join to application_departments, so they are always a separate
+UNION ALL branch of the same statement.
+"""
+
+from collections import defaultdict
+
+from sqlalchemy import String, and_, case, cast, func, literal, null, select, tuple_, union_all
+from sqlalchemy.orm import Session
+
+from models import ApplicationDepartments
+from schemas.app_schemas import AppFacetsOut, AppsSummaryOut, AppStatuses
+from services.summaries.app_summary import normalize_status
+
+# facet name -> column of the applications subquery
+FACET_COLUMNS = {
+    "status": "status",
+    "priority": "app_priority",
+    "severity": "severity",
+    "app_type": "app_type",
+    "vertical": "vertical_id",
+    "environment": "environment",
+    "ai": "is_app_ai",
+    "privacy": "is_privacy_applicable",
+}
+
+BOOLEAN_FACETS = {"ai", "privacy"}
+
+GROUPING_SETS_DIALECTS = {"postgresql", "mssql", "oracle"}
+
+UNKNOWN = "unknown"
+
+
+def _grouping_sets_stmt(filtered):
+    columns = {name: filtered.c[col] for name, col in FACET_COLUMNS.items()}
+
+    facet = case(
+        *(
+            (func.grouping(column) == 0, literal(name))
+            for name, column in columns.items()
+        ),
+        else_=literal("total"),
+    )
+    value = case(
+        *(
+            (func.grouping(column) == 0, cast(column, String))
+            for column in columns.values()
+        ),
+        else_=cast(null(), String),
+    )
+
+    return (
+        select(
+            facet.label("facet"),
+            value.label("value"),
+            func.count().label("facet_count"),
+        )
+        .select_from(filtered)
+        .group_by(func.grouping_sets(*columns.values(), tuple_()))
+    )
+
+
+def _union_all_stmts(filtered) -> list:
+    stmts = [
+        select(
+            literal("total").label("facet"),
+            cast(null(), String).label("value"),
+            func.count().label("facet_count"),
+        ).select_from(filtered)
+    ]
+
+    for name, col in FACET_COLUMNS.items():
+        column = filtered.c[col]
+        stmts.append(
+            select(
+                literal(name).label("facet"),
+                cast(column, String).label("value"),
+                func.count().label("facet_count"),
+            )
+            .select_from(filtered)
+            .group_by(column)
+        )
+
+    return stmts
+
+
+def _department_status_stmt(filtered):
+    return (
+        select(
+            literal("department_status").label("facet"),
+            (
+                cast(ApplicationDepartments.department_id, String)
+                + ":"
+                + ApplicationDepartments.status
+            ).label("value"),
+            func.count().label("facet_count"),
+        )
+        .select_from(filtered)
+        .join(
+            ApplicationDepartments,
+            and_(
+                ApplicationDepartments.application_id == filtered.c.id,
+                ApplicationDepartments.is_active,
+            ),
+        )
+        .group_by(ApplicationDepartments.department_id, ApplicationDepartments.status)
+    )
+
+
+def _normalize_value(facet: str, value: str | None) -> str:
+    if value is None:
+        return UNKNOWN
+    if facet in BOOLEAN_FACETS:
+        return "true" if value.lower() in ("1", "true", "t") else "false"
+    if facet == "status":
+        return normalize_status(value)
+    return value
+
+
+def compute_app_facets(db: Session, filtered) -> AppFacetsOut:
+    """
+    Counts for every filter dimension of the applications in `filtered`
+    (a subquery of Application rows).
+
+    Department status values are "<department_id>:<status>".
+    """
+    if db.get_bind().dialect.name in GROUPING_SETS_DIALECTS:
+        stmts = [_grouping_sets_stmt(filtered)]
+    else:
+        stmts = _union_all_stmts(filtered)
+
+    stmts.append(_department_status_stmt(filtered))
+
+    facets: dict[str, dict[str, int]] = defaultdict(lambda: defaultdict(int))
+    total_apps = 0
+
+    for row in db.execute(union_all(*stmts)).all():
+        if row.facet == "total":
+            total_apps = int(row.facet_count)
+            continue
+        facets[row.facet][_normalize_value(row.facet, row.value)] += int(
+            row.facet_count
+        )
+
+    return AppFacetsOut(
+        total_apps=total_apps,
+        facets={
+            name: dict(facets.get(name, {}))
+            for name in [*FACET_COLUMNS, "department_status"]
+        },
+    )
+
+
+def apps_summary_from_facets(facets: AppFacetsOut) -> AppsSummaryOut:
+    statuses = facets.facets.get("status", {})
+    app_types = facets.facets.get("app_type", {})
+
+    internal = external = 0
+    for environment, count in facets.facets.get("environment", {}).items():
+        if environment == UNKNOWN:
+            continue
+        internal += count if "internal" in environment.lower() else 0
+        external += count if "external" in environment.lower() else 0
+
+    return AppsSummaryOut(
+        total_apps=facets.total_apps,
+        app_statuses=AppStatuses(
+            **{field: statuses.get(field, 0) for field in AppStatuses.model_fields}
+        ),
+        priority_counts={
+            int(priority): count
+            for priority, count in facets.facets.get("priority", {}).items()
+            if priority != UNKNOWN
+        },
+        ai_app_count=facets.facets.get("ai", {}).get("true", 0),
+        privacy_app_count=facets.facets.get("privacy", {}).get("true", 0),
+        mobile_app_count=app_types.get("mobile", 0),
+        web_app_count=app_types.get("web", 0),
+        mobile_web_app_count=app_types.get("mobile_web", 0),
+        internal_environment_count=internal,
+        external_environment_count=external,
+    )
@@ -0,0 +1,245 @@
+# services/summaries/app_summary.py
+"""
+Incrementally maintained counters behind the unfiltered `apps_summary` of
+/applications/list.
+
+Every flush that inserts, updates or deletes an Application adjusts the
+matching AppSummaryCounter rows in the same transaction (see db/events.py),
+so reading the summary never scans `applications`. `check_app_summary` and
+`rebuild_app_summary` compare against / recompute from the live table. The
+rebuild replaces every counter, so run it only when nothing is writing,
+e.g. for a database created with create_all instead of the migrations:
+
+    python -m services.summaries.app_summary            # report drift
+    python -m services.summaries.app_summary --rebuild  # recompute
+"""
+
+from collections import Counter
+
+from sqlalchemy import and_, case, delete, func, insert, select, update
+from sqlalchemy.dialects.mysql import insert as mysql_insert
+from sqlalchemy.orm import Session
+
+from models import Application, AppSummaryCounter
+from schemas.app_schemas import AppsSummaryOut, AppStatuses
+
+# Application attributes that decide which counter an app belongs to
+SUMMARY_FIELDS = (
+    "status",
+    "app_type",
+    "environment",
+    "is_app_ai",
+    "is_privacy_applicable",
+    "app_priority",
+    "is_active",
+)
+
+KEY_FIELDS = (
+    "status",
+    "app_type",
+    "env_internal",
+    "env_external",
+    "is_app_ai",
+    "is_privacy_applicable",
+    "app_priority",
+)
+
+
+def normalize_status(value: str | None) -> str:
+    return (value or "").lower().replace(" ", "_").replace("-", "_")
+
+
+def summary_key(values: dict) -> tuple | None:
+    """Counter key for an application's field values, None if not counted."""
+    if values.get("is_active") is False:
+        return None
+
+    environment = (values.get("environment") or "").lower()
+
+    return (
+        normalize_status(values.get("status")),
+        values.get("app_type") or "",
+        "internal" in environment,
+        "external" in environment,
+        bool(values.get("is_app_ai")),
+        bool(values.get("is_privacy_applicable")),
+        values.get("app_priority") or 0,
+    )
+
+
+def apply_summary_deltas(connection, deltas: dict[tuple, int]) -> None:
+    for key, delta in deltas.items():
+        if not delta:
+            continue
+
+        values = dict(zip(KEY_FIELDS, key))
+
+        if connection.dialect.name == "mysql":
+            stmt = mysql_insert(AppSummaryCounter).values(**values, app_count=delta)
+            connection.execute(
+                stmt.on_duplicate_key_update(
+                    app_count=AppSummaryCounter.__table__.c.app_count + delta
+                )
+            )
+            continue
+
+        result = connection.execute(
+            update(AppSummaryCounter)
+            .where(
+                and_(
+                    *(
+                        getattr(AppSummaryCounter, field) == value
+                        for field, value in values.items()
+                    )
+                )
+            )
+            .values(app_count=AppSummaryCounter.app_count + delta)
+        )
+        if result.rowcount == 0:
+            connection.execute(
+                insert(AppSummaryCounter).values(**values, app_count=delta)
+            )
+
+
+def _live_counts(db: Session) -> Counter:
+    environment = func.lower(func.coalesce(Application.environment, ""))
+
+    rows = db.execute(
+        select(
+            Application.status,
+            Application.app_type,
+            case((environment.like("%internal%"), True), else_=False).label(
+                "env_internal"
+            ),
+            case((environment.like("%external%"), True), else_=False).label(
+                "env_external"
+            ),
+            Application.is_app_ai,
+            Application.is_privacy_applicable,
+            Application.app_priority,
+            func.count().label("app_count"),
+        )
+        .where(Application.is_active)
+        .group_by(
+            Application.status,
+            Application.app_type,
+            "env_internal",
+            "env_external",
+            Application.is_app_ai,
+            Application.is_privacy_applicable,
+            Application.app_priority,
+        )
+    ).all()
+
+    counts: Counter = Counter()
+    for row in rows:
+        key = (
+            normalize_status(row.status),
+            row.app_type or "",
+            bool(row.env_internal),
+            bool(row.env_external),
+            bool(row.is_app_ai),
+            bool(row.is_privacy_applicable),
+            row.app_priority or 0,
+        )
+        counts[key] += int(row.app_count)
+
+    return counts
+
+
+def _stored_counts(db: Session) -> Counter:
+    counts: Counter = Counter()
+    for counter in db.scalars(select(AppSummaryCounter)).all():
+        key = tuple(getattr(counter, field) for field in KEY_FIELDS)
+        counts[key] += counter.app_count
+    return counts
+
+
+def rebuild_app_summary(db: Session) -> int:
+    """Recompute every counter from `applications`. Returns the apps counted."""
+    counts = _live_counts(db)
+
+    db.execute(delete(AppSummaryCounter))
+    if counts:
+        db.execute(
+            insert(AppSummaryCounter),
+            [
+                {**dict(zip(KEY_FIELDS, key)), "app_count": count}
+                for key, count in counts.items()
+            ],
+        )
+    db.commit()
+
+    return sum(counts.values())
+
+
+def check_app_summary(db: Session) -> dict[tuple, tuple[int, int]]:
+    """Keys whose stored count differs from the live one: key -> (stored, live)."""
+    stored = _stored_counts(db)
+    live = _live_counts(db)
+
+    return {
+        key: (stored.get(key, 0), live.get(key, 0))
+        for key in set(stored) | set(live)
+        if stored.get(key, 0) != live.get(key, 0)
+    }
+
+
+def read_apps_summary(db: Session) -> AppsSummaryOut:
+    # Read only: the counters are backfilled by the 7c41d2e9b5a3 migration or
+    # `--rebuild`; without them every count is 0
+    counts = _stored_counts(db)
+
+    statuses: Counter = Counter()
+    app_types: Counter = Counter()
+    priority_counts: Counter = Counter()
+    internal = external = ai = privacy = 0
+
+    for key, count in counts.items():
+        status_, app_type, env_internal, env_external, is_ai, is_privacy, priority = (
+            key
+        )
+        statuses[status_] += count
+        app_types[app_type] += count
+        priority_counts[priority] += count
+        internal += count if env_internal else 0
+        external += count if env_external else 0
+        ai += count if is_ai else 0
+        privacy += count if is_privacy else 0
+
+    return AppsSummaryOut(
+        total_apps=sum(counts.values()),
+        app_statuses=AppStatuses(
+            **{field: statuses.get(field, 0) for field in AppStatuses.model_fields}
+        ),
+        priority_counts={p: c for p, c in priority_counts.items() if c},
+        ai_app_count=ai,
+        privacy_app_count=privacy,
+        mobile_app_count=app_types.get("mobile", 0),
+        web_app_count=app_types.get("web", 0),
+        mobile_web_app_count=app_types.get("mobile_web", 0),
+        internal_environment_count=internal,
+        external_environment_count=external,
+    )
+
+
+if __name__ == "__main__":
+    import argparse
+
+    from db.connection import SessionLocal
+
+    parser = argparse.ArgumentParser(description="Check or rebuild app summary counters")
+    parser.add_argument("--rebuild", action="store_true")
+    args = parser.parse_args()
+
+    session = SessionLocal()
+    try:
+        if args.rebuild:
+            print(f"Rebuilt app summary counters for {rebuild_app_summary(session)} apps")
+        else:
+            drift = check_app_summary(session)
+            for key, (stored, live) in sorted(drift.items(), key=str):
+                print(f"{dict(zip(KEY_FIELDS, key))}: stored={stored} live={live}")
+            print("Counters are consistent" if not drift else f"{len(drift)} keys drifted")
+    finally:
+        session.close()
@@ -0,0 +1,124 @@
+# services/summaries/cycle_times.py
+"""
+Cycle time percentiles in days: Application started_at -> completed_at and
+ApplicationDepartments started_at -> ended_at, optionally split by
+department, vertical, priority or the month the work finished.
+
+PostgreSQL computes percentile_cont per group in the database. MySQL has no
+percentile aggregate, so elsewhere only the group key and the two timestamps
+are streamed (yield_per) into one float array per group and numpy takes the
+percentiles, interpolating the same way percentile_cont does. That is a few
+bytes per finished row; a quantile sketch would only pay off at millions.
+"""
+
+from collections import defaultdict
+import numpy as np
+from sqlalchemy import func, literal, select
+from sqlalchemy.orm import Session
+
+from models import Application, ApplicationDepartments
+from schemas import dashboard_schemas as ds
+from .date_ranges import day_range
+
+PERCENTILES = (50, 90, 99)
+
+PERCENTILE_DIALECTS = {"postgresql"}
+
+SECONDS_PER_DAY = 86400
+
+GROUP_COLUMNS = {
+    "department": ApplicationDepartments.department_id,
+    "vertical": Application.vertical_id,
+    "priority": Application.app_priority,
+}
+
+
+def _span(params: ds.CycleTimeParams):
+    """(start, end, criteria) of the durations to measure."""
+    if params.level == "application":
+        start, end = Application.started_at, Application.completed_at
+        criteria = [Application.is_active]
+    else:
+        start, end = ApplicationDepartments.started_at, ApplicationDepartments.ended_at
+        criteria = [Application.is_active, ApplicationDepartments.is_active]
+        if params.department_id is not None:
+            criteria.append(
+                ApplicationDepartments.department_id == params.department_id
+            )
+
+    criteria += [start.is_not(None), end.is_not(None), end >= start]
+    criteria += day_range(end, params.from_date, params.to_date)
+    if params.vertical_ids:
+        criteria.append(Application.vertical_id.in_(params.vertical_ids))
+    if params.priority:
+        criteria.append(Application.app_priority.in_(params.priority))
+
+    return start, end, criteria
+
+
+def _base(stmt, params: ds.CycleTimeParams):
+    if params.level == "application":
+        return stmt.select_from(Application)
+    return stmt.select_from(ApplicationDepartments).join(
+        Application, Application.id == ApplicationDepartments.application_id
+    )
+
+
+def _percentiles_in_db(db: Session, params: ds.CycleTimeParams) -> dict:
+    start, end, criteria = _span(params)
+    if params.group_by == "month":
+        group = func.to_char(end, "YYYY-MM")
+    else:
+        group = GROUP_COLUMNS.get(params.group_by, literal(None))
+    days = func.extract("epoch", end - start) / SECONDS_PER_DAY
+
+    stmt = _base(
+        select(
+            group.label("group_key"),
+            func.count().label("item_count"),
+            *(
+                func.percentile_cont(p / 100).within_group(days).label(f"p{p}")
+                for p in PERCENTILES
+            ),
+        ),
+        params,
+    ).where(*criteria)
+    if params.group_by:
+        stmt = stmt.group_by(group)
+
+    return {
+        row.group_key: (
+            row.item_count,
+            *(float(getattr(row, f"p{p}")) for p in PERCENTILES),
+        )
+        for row in db.execute(stmt)
+        if row.item_count
+    }
+
+
+def _percentiles_streamed(db: Session, params: ds.CycleTimeParams) -> dict:
+    start, end, criteria = _span(params)
+    group = GROUP_COLUMNS.get(params.group_by, literal(None))
+
+    stmt = _base(select(group, start, end), params).where(*criteria)
+
+    durations: dict = defaultdict(list)
+    for key, started_at, ended_at in db.execute(
+        stmt.execution_options(yield_per=5000)
+    ):
+        if params.group_by == "month":
+            key = ended_at.strftime("%Y-%m")
+        durations[key].append((ended_at - started_at).total_seconds())
+
+    result = {}
+    for key, seconds in durations.items():
+        days = np.asarray(seconds, dtype=float) / SECONDS_PER_DAY
+        result[key] = (len(days), *np.percentile(days, PERCENTILES).tolist())
+    return result
+
+
+def compute_cycle_times(db: Session, params: ds.CycleTimeParams) -> dict:
+    """group key -> (count, p50, p90, p99) in days. The key is None when ungrouped."""
+    if db.get_bind().dialect.name in PERCENTILE_DIALECTS:
+        return _percentiles_in_db(db, params)
+    return _percentiles_streamed(db, params)
@@ -0,0 +1,72 @@
+# services/summaries/date_ranges.py
+"""
+Date filters as half-open [start, end) ranges on the raw timestamp columns.
+
+`func.date(col) between a and b` or `datediff(now(), col) <= n` evaluate a
+function per row, so MySQL can't range-scan an index on `col`. The same
+conditions written as `col >= midnight(a) and col < midnight(b + 1 day)` can,
+and also include every timestamp on the last day, where a bare
+`col <= b` stops at midnight.
+"""
+
+from datetime import date, datetime, time, timedelta
+
+# sla_filter -> (oldest, newest) age in days of started_at; None is open
+SLA_BUCKETS: dict[int, tuple[int | None, int | None]] = {
+    30: (30, None),
+    60: (60, 30),
+    90: (90, 60),
+    91: (None, 90),
+}
+
+
+def day_start(day: date) -> datetime:
+    return datetime.combine(day, time.min)
+
+
+def day_bounds(
+    from_date: date | None = None, to_date: date | None = None
+) -> tuple[datetime | None, datetime | None]:
+    """[start, end) covering the whole of from_date through to_date."""
+    start = day_start(from_date) if from_date else None
+    end = day_start(to_date + timedelta(days=1)) if to_date else None
+    return start, end
+
+
+def timestamp_range(column, start: datetime | None, end: datetime | None) -> list:
+    criteria = []
+    if start is not None:
+        criteria.append(column >= start)
+    if end is not None:
+        criteria.append(column < end)
+    return criteria
+
+
+def day_range(column, from_date: date | None = None, to_date: date | None = None):
+    """Criteria for `column` falling on from_date .. to_date, both inclusive."""
+    return timestamp_range(column, *day_bounds(from_date, to_date))
+
+
+def sla_bounds(
+    sla_filter: int, today: date | None = None
+) -> tuple[datetime | None, datetime | None]:
+    """[start, end) of started_at for an SLA bucket. The buckets don't overlap."""
+    today = today or date.today()
+    oldest, newest = SLA_BUCKETS[sla_filter]
+    start = day_start(today - timedelta(days=oldest)) if oldest is not None else None
+    end = day_start(today - timedelta(days=newest)) if newest is not None else None
+    return start, end
+
+
+def sla_range(column, sla_filter: int | None, today: date | None = None) -> list:
+    """Criteria for the 30 / 60 / 90 / 91 (older) day buckets; [] for no filter."""
+    if sla_filter not in SLA_BUCKETS:
+        return []
+    start, end = sla_bounds(sla_filter, today)
+    return [column.is_not(None), *timestamp_range(column, start, end)]
+
+
+def age_cutoffs(days: list[int], today: date | None = None) -> list[datetime]:
+    """Midnight n days ago for each n; `col >= cutoff` <=> datediff(today, col) <= n."""
+    today = today or date.today()
+    return [day_start(today - timedelta(days=n)) for n in days]
@@ -0,0 +1,137 @@
+# services/summaries/status_snapshots.py
+"""
+Daily AppStatusSnapshot rows behind the trend dashboards.
+
+`take_status_snapshot` aggregates the live applications / application
+departments into the fact table for one day. It replaces that day's rows, so
+re-running it later the same day only refreshes them. History can't be
+rebuilt after the fact, so run it once a day, e.g. from cron shortly after
+midnight:
+
+    python -m services.summaries.status_snapshots                    # today
+    python -m services.summaries.status_snapshots --date 2026-10-01
+"""
+
+from collections import Counter
+from datetime import date
+
+from sqlalchemy import delete, func, insert, select
+from sqlalchemy.orm import Session
+
+from models import Application, ApplicationDepartments, AppStatusSnapshot
+from .app_summary import normalize_status
+
+_APP_KEY_COLUMNS = (
+    func.coalesce(Application.vertical_id, 0),
+    func.coalesce(Application.scope, ""),
+    func.coalesce(Application.app_priority, 0),
+    func.coalesce(Application.severity, 0),
+    Application.status,
+)
+
+
+def _snapshot_counts(db: Session) -> Counter:
+    counts: Counter = Counter()
+
+    app_rows = db.execute(
+        select(*_APP_KEY_COLUMNS, func.count(Application.id))
+        .where(Application.is_active)
+        .group_by(*_APP_KEY_COLUMNS)
+    ).all()
+    for vertical_id, scope, priority, severity, app_status, count in app_rows:
+        key = (vertical_id, scope, priority, severity, normalize_status(app_status))
+        counts[(*key, 0, "")] += count
+
+    dept_rows = db.execute(
+        select(
+            *_APP_KEY_COLUMNS,
+            ApplicationDepartments.department_id,
+            ApplicationDepartments.status,
+            func.count(ApplicationDepartments.id),
+        )
+        .join(
+            ApplicationDepartments,
+            ApplicationDepartments.application_id == Application.id,
+        )
+        .where(Application.is_active, ApplicationDepartments.is_active)
+        .group_by(
+            *_APP_KEY_COLUMNS,
+            ApplicationDepartments.department_id,
+            ApplicationDepartments.status,
+        )
+    ).all()
+    for (
+        vertical_id,
+        scope,
+        priority,
+        severity,
+        app_status,
+        department_id,
+        dept_status,
+        count,
+    ) in dept_rows:
+        key = (vertical_id, scope, priority, severity, normalize_status(app_status))
+        counts[(*key, department_id, normalize_status(dept_status))] += count
+
+    return counts
+
+
+def take_status_snapshot(db: Session, snapshot_date: date | None = None) -> int:
+    """Write the snapshot for `snapshot_date` (default today). Returns rows written."""
+    snapshot_date = snapshot_date or date.today()
+
+    rows = [
+        {
+            "snapshot_date": snapshot_date,
+            "vertical_id": vertical_id,
+            "scope": scope,
+            "app_priority": priority,
+            "severity": severity,
+            "app_status": app_status,
+            "department_id": department_id,
+            "dept_status": dept_status,
+            "item_count": count,
+        }
+        for (
+            vertical_id,
+            scope,
+            priority,
+            severity,
+            app_status,
+            department_id,
+            dept_status,
+        ), count in _snapshot_counts(db).items()
+    ]
+
+    db.execute(
+        delete(AppStatusSnapshot).where(
+            AppStatusSnapshot.snapshot_date == snapshot_date
+        )
+    )
+    if rows:
+        db.execute(insert(AppStatusSnapshot), rows)
+    db.commit()
+
+    return len(rows)
+
+
+if __name__ == "__main__":
+    import argparse
+
+    from db.connection import SessionLocal
+
+    parser = argparse.ArgumentParser(description="Write the daily status snapshot")
+    parser.add_argument(
+        "--date",
+        type=date.fromisoformat,
+        default=None,
+        help="date to record the current state under, e.g. after a missed run",
+    )
+    args = parser.parse_args()
+
+    session = SessionLocal()
+    try:
+        written = take_status_snapshot(session, args.date)
+        print(f"Wrote {written} snapshot rows for {args.date or date.today()}")
+    finally:
+        session.close()
@@ -0,0 +1,51 @@
+"""
+Shared fixtures: the seeded SQLite database from support.py, sessions on it
+and an authenticated TestClient.
+"""
+
+import pytest
+
+# support has to come first, it points the app at the test database
+from support import CSRF_TOKEN, create_database, drop_database, login
+import main
+from db.connection import SessionLocal
+from models import User
+from services.caching.aggregate_cache import aggregate_cache
+
+
+@pytest.fixture(scope="session")
+def seeded():
+    yield create_database()
+    drop_database()
+
+
+@pytest.fixture
+def db(seeded):
+    session = SessionLocal()
+    try:
+        yield session
+    finally:
+        session.rollback()
+        session.close()
+
+
+@pytest.fixture
+def admin(db, seeded):
+    return db.get(User, seeded["admin_id"])
+
+
+@pytest.fixture(autouse=True)
+def _fresh_aggregate_cache():
+    # every test sees the SQL it triggers, not an earlier test's cached result
+    aggregate_cache.clear()
+    yield
+
+
+@pytest.fixture
+def client(db, admin):
+    from fastapi.testclient import TestClient
+
+    with TestClient(main.app, headers={"X-CSRF-Token": CSRF_TOKEN}) as test_client:
+        for name, value in login(db, admin).items():
+            test_client.cookies.set(name, value)
+        yield test_client
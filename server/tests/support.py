@@ -0,0 +1,210 @@
+"""
+A throwaway SQLite database for tests and benchmarks, created from the
+models, plus the seed data and a login helper.
+
+Import this before anything from the app: db/config.py and the
+module-level engine read the environment at import time.
+"""
+
+import os
+import random
+import shutil
+import tempfile
+import uuid
+from datetime import datetime, timedelta
+
+TMP_DIR = tempfile.mkdtemp(prefix="server-tests-")
+
+os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(TMP_DIR, 'test.db')}"
+os.environ["EXPORT_ARTIFACT_DIR"] = os.path.join(TMP_DIR, "exports")
+os.environ.setdefault("POOL_SIZE", "5")
+os.environ.setdefault("MAX_OVERFLOW", "5")
+os.environ.setdefault("POOL_TIMEOUT", "30")
+os.environ.setdefault("POOL_RECYCLE", "3600")
+os.environ.setdefault("PROD_ENV", "false")
+
+import main  # noqa: E402  registers the session events
+from db.base import Base  # noqa: E402
+from db.connection import SessionLocal, engine  # noqa: E402
+from models import (  # noqa: E402
+    Application,
+    ApplicationControlResult,
+    ApplicationDepartments,
+    Comment,
+    Department,
+    DepartmentControl,
+    DepartmentUsers,
+    ExecutiveSummary,
+    User,
+    UserSession,
+    Vertical,
+)
+from services.auth.jwt_handler import create_tokens  # noqa: E402
+from services.summaries.app_dept_pointers import (  # noqa: E402
+    backfill_app_dept_pointers,
+)
+
+SEED_APPS = 120
+CSRF_TOKEN = "test-csrf"
+
+APP_STATUSES = ["new_request", "in_progress", "completed", "closed", "hold"]
+DEPT_STATUSES = ["yet_to_connect", "in_progress", "cleared"]
+DEPARTMENTS = ["IAM", "SOC Integration", "Web VAPT", "Mobile VAPT", "TPRM", "Privacy"]
+
+
+def seed_database(db, n_apps: int = SEED_APPS, seed: int = 1) -> dict:
+    rng = random.Random(seed)
+    now = datetime.now().replace(microsecond=0)
+
+    admin = User(
+        email="admin@example.com",
+        password_hash="x",
+        role="admin",
+        full_name="Admin",
+        must_change_password=False,
+    )
+    db.add(admin)
+    db.flush()
+
+    verticals = [Vertical(name=f"Vertical {i}") for i in range(3)]
+    departments = [Department(name=name) for name in DEPARTMENTS]
+    db.add_all(verticals + departments)
+    db.flush()
+    db.add(DepartmentUsers(department_id=departments[0].id, user_id=admin.id))
+
+    controls = [
+        DepartmentControl(department_id=dept.id, name=f"{dept.name} control")
+        for dept in departments
+    ]
+    db.add_all(controls)
+    db.flush()
+
+    for i in range(n_apps):
+        started_at = (
+            now - timedelta(days=rng.randint(0, 200), hours=rng.randint(0, 23))
+            if i % 7
+            else None
+        )
+        app = Application(
+            name=f"App {i:03d}",
+            creator_id=admin.id,
+            status=rng.choice(APP_STATUSES),
+            app_priority=rng.choice([1, 2, 3]),
+            severity=rng.choice([1, 2, 3, None]),
+            app_type=rng.choice(["web", "mobile", "mobile_web", "api", None]),
+            environment=rng.choice(["Internal", "External", None]),
+            vendor_company=f"Vendor {i % 5}",
+            owner_name=f"Owner {i}",
+            imitra_ticket_id=f"TCK-{1000 + i}",
+            started_at=started_at,
+            vertical_id=verticals[i % 3].id,
+            vertical=verticals[i % 3].name,
+            is_app_ai=bool(i % 2),
+            is_privacy_applicable=i % 3 == 0,
+            scope=rng.choice(["is_assessment", "is_assessment", "vapt_only"]),
+            is_active=i % 11 != 0,
+        )
+        if app.status in ("completed", "closed"):
+            app.completed_at = (
+                started_at + timedelta(days=rng.randint(1, 60)) if started_at else now
+            )
+        db.add(app)
+        db.flush()
+
+        for dept in rng.sample(departments, 3):
+            app_dept = ApplicationDepartments(
+                application_id=app.id,
+                department_id=dept.id,
+                status=rng.choice(DEPT_STATUSES),
+                started_at=started_at,
+            )
+            if app_dept.status == "cleared" and started_at:
+                app_dept.ended_at = started_at + timedelta(days=rng.randint(1, 40))
+            db.add(app_dept)
+
+            for k in range(rng.randint(0, 3)):
+                db.add(
+                    Comment(
+                        content=f"comment {k}",
+                        application_id=app.id,
+                        department_id=dept.id,
+                        author_id=admin.id,
+                        created_at=now - timedelta(hours=k * 3 + i),
+                    )
+                )
+            if rng.random() < 0.5:
+                db.add(
+                    ExecutiveSummary(
+                        content="summary",
+                        application_id=app.id,
+                        department_id=dept.id,
+                        author_id=admin.id,
+                        scope="department",
+                    )
+                )
+        db.add(
+            ApplicationControlResult(
+                application_id=app.id,
+                department_control_id=controls[i % len(controls)].id,
+                status="pass",
+                updated_by=admin.id,
+            )
+        )
+
+    db.commit()
+    # the pointers are maintained by the write paths, which seeding skips
+    backfill_app_dept_pointers(db)
+    return {
+        "admin_id": admin.id,
+        "department_ids": [dept.id for dept in departments],
+        "vertical_ids": [vertical.id for vertical in verticals],
+    }
+
+
+def create_database(n_apps: int = SEED_APPS) -> dict:
+    Base.metadata.create_all(engine)
+    db = SessionLocal()
+    try:
+        return seed_database(db, n_apps=n_apps)
+    finally:
+        db.close()
+
+
+def drop_database() -> None:
+    engine.dispose()
+    shutil.rmtree(TMP_DIR, ignore_errors=True)
+
+
+def login(db, user) -> dict:
+    session_id = str(uuid.uuid4())
+    access_token, refresh_token = create_tokens(
+        user_id=user.id, role=user.role, sid=session_id, mfa_verified=True
+    )
+    user_session = UserSession(
+        id=session_id,
+        user_id=user.id,
+        user_agent="testclient",
+        csrf_token=CSRF_TOKEN,
+        expires_at=datetime.now() + timedelta(hours=1),
+    )
+    user_session.set_access_token(access_token)
+    user_session.set_refresh_token(refresh_token)
+    db.add(user_session)
+    db.commit()
+    return {
+        "access_token": access_token,
+        "refresh_token": refresh_token,
+        "session_id": session_id,
+        "csrf_token": CSRF_TOKEN,
+    }
+
+
+def explain(statement: str, parameters) -> list[str]:
+    """SQLite's EXPLAIN QUERY PLAN details for a statement as executed."""
+    raw = engine.raw_connection()
+    try:
+        cursor = raw.cursor()
+        cursor.execute(f"EXPLAIN QUERY PLAN {statement}", parameters)
+        return [row[3] for row in cursor.fetchall()]
+    finally:
+        raw.close()
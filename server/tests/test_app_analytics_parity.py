@@ -0,0 +1,163 @@
+"""
+The in-memory analytics engine must answer every dashboard split exactly
+like the SQL in dashboard_controller, both right after a full load and after
+an incremental refresh picked up writes.
+"""
+
+from datetime import date, datetime, timedelta
+
+import pytest
+from sqlalchemy import select
+
+from api.controllers import dashboard_controller as dc
+from models import Application, ApplicationDepartments
+from schemas import dashboard_schemas as ds
+from services.analytics import app_analytics as analytics_module
+from services.analytics.app_analytics import AppAnalytics
+
+
+def _parity_cases():
+    today = date.today()
+    ages = [(None, None), (today - timedelta(days=180), today)]
+    filters = [
+        {"severity": severity, "priority": priority, "app_age_from": f, "app_age_to": t}
+        for severity in ([], [1, 2])
+        for priority in ([], [3])
+        for f, t in ages
+    ]
+
+    for f in filters:
+        for scope in ("is_assessment", "vapt_only"):
+            yield "get_app_status_summary", ds.AppSummaryQueryParams(**f, scope=scope)
+        for app_status in (None, "all", "in_progress"):
+            yield "get_department_status_summary", ds.DeptSummaryQueryParams(
+                **f, status=app_status
+            )
+            yield "get_app_types_summary", ds.AppTypeSummaryParams(
+                **f, app_status=app_status
+            )
+        for app_status in ("in_progress", "completed"):
+            for dept_status in ("in_progress", "cleared", "yet_to_connect"):
+                yield "get_statuses_per_dept", ds.StatusPerDepartmentParams(
+                    **f, app_status=app_status, dept_status=dept_status
+                )
+        yield "get_status_matrix", ds.StatusMatrixParams(**f)
+    for status_filter in (None, "all", "in_progress"):
+        yield "get_priority_wise_grouped_summary", status_filter
+    for scope in ("is_assessment", "vapt_only"):
+        yield "get_vertical_wise_app_statuses", ds.VerticalWiseSummaryParams(
+            scope=scope
+        )
+
+
+CASES = list(_parity_cases())
+CASE_IDS = [f"{name}-{i}" for i, (name, _) in enumerate(CASES)]
+
+
+def _canonical(value):
+    if hasattr(value, "model_dump"):
+        value = value.model_dump()
+    if isinstance(value, dict):
+        return {key: _canonical(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return sorted((_canonical(item) for item in value), key=repr)
+    return value
+
+
+@pytest.fixture(autouse=True)
+def _sql_dashboards(monkeypatch):
+    # the controllers must answer from SQL, they are the reference
+    monkeypatch.setattr(analytics_module.app_analytics, "enabled", False)
+
+
+@pytest.fixture(scope="module")
+def engine(seeded):
+    from db.connection import SessionLocal
+
+    analytics = AppAnalytics(enabled=True)
+    db = SessionLocal()
+    try:
+        analytics.snapshot(db)
+    finally:
+        db.close()
+    return analytics
+
+
+@pytest.fixture(scope="module")
+def refreshed_engine(engine, seeded):
+    """`engine` after writes it has to pick up without a full reload."""
+    from db.connection import SessionLocal
+
+    db = SessionLocal()
+    try:
+        apps = db.scalars(
+            select(Application)
+            .where(Application.is_active)
+            .order_by(Application.id)
+            .limit(6)
+        ).all()
+        apps[0].status = "completed"
+        apps[0].completed_at = datetime.now()
+        apps[1].status = "hold"
+        apps[2].app_type = "api"
+        apps[3].is_active = False
+        apps[4].started_at = datetime.now() - timedelta(days=3)
+
+        app_dept = db.scalars(
+            select(ApplicationDepartments)
+            .where(ApplicationDepartments.application_id == apps[5].id)
+            .limit(1)
+        ).one()
+        app_dept.status = "cleared"
+        app_dept.ended_at = datetime.now()
+
+        new_app = Application(
+            name="Parity App",
+            creator_id=seeded["admin_id"],
+            status="in_progress",
+            app_priority=3,
+            severity=1,
+            app_type="web",
+            started_at=datetime.now() - timedelta(days=10),
+            vertical_id=seeded["vertical_ids"][0],
+            scope="is_assessment",
+        )
+        db.add(new_app)
+        db.flush()
+        for dept_id, status in zip(
+            seeded["department_ids"][:2], ("in_progress", "yet_to_connect")
+        ):
+            db.add(
+                ApplicationDepartments(
+                    application_id=new_app.id,
+                    department_id=dept_id,
+                    status=status,
+                    started_at=new_app.started_at,
+                )
+            )
+        db.commit()
+
+        loaded_at, versions = engine._loaded_at, engine._versions
+        engine.snapshot(db)
+        assert engine._versions != versions, "the writes bumped no data version"
+        assert engine._loaded_at == loaded_at, "expected an incremental refresh"
+    finally:
+        db.close()
+    return engine
+
+
+def _assert_parity(db, analytics, name, params):
+    # __wrapped__ skips the aggregate cache
+    expected = getattr(dc, name).__wrapped__(db, params)
+    actual = getattr(analytics, name)(db, params)
+    assert _canonical(actual) == _canonical(expected)
+
+
+@pytest.mark.parametrize(("name", "params"), CASES, ids=CASE_IDS)
+def test_parity_after_full_load(db, engine, name, params):
+    _assert_parity(db, engine, name, params)
+
+
+@pytest.mark.parametrize(("name", "params"), CASES, ids=CASE_IDS)
+def test_parity_after_incremental_refresh(db, refreshed_engine, name, params):
+    _assert_parity(db, refreshed_engine, name, params)
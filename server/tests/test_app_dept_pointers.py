@@ -0,0 +1,48 @@
+from datetime import datetime, timedelta
+
+from sqlalchemy import select
+
+from models import ApplicationDepartments, Comment
+from services.summaries.app_dept_pointers import record_new_comment
+
+
+def _app_dept(db):
+    return db.execute(
+        select(ApplicationDepartments).order_by(ApplicationDepartments.id).limit(1)
+    ).scalar_one()
+
+
+def _add_comment(db, app_dept, created_at):
+    comment = Comment(
+        content="pointer test",
+        application_id=app_dept.application_id,
+        department_id=app_dept.department_id,
+        created_at=created_at,
+    )
+    db.add(comment)
+    record_new_comment(db=db, comment=comment)
+    db.commit()
+    db.refresh(app_dept)
+    return comment
+
+
+def test_pointer_moves_to_newer_comment(db):
+    app_dept = _app_dept(db)
+    count = app_dept.comment_count
+
+    comment = _add_comment(db, app_dept, datetime.now() + timedelta(days=1))
+
+    assert app_dept.latest_comment_id == comment.id
+    assert app_dept.comment_count == count + 1
+
+
+def test_pointer_ignores_older_comment_committed_later(db):
+    app_dept = _app_dept(db)
+    newer = _add_comment(db, app_dept, datetime.now() + timedelta(days=2))
+    count = app_dept.comment_count
+
+    # e.g. a slow request whose row was stamped before `newer`
+    _add_comment(db, app_dept, datetime.now() + timedelta(days=1, hours=23))
+
+    assert app_dept.latest_comment_id == newer.id
+    assert app_dept.comment_count == count + 1
@@ -0,0 +1,109 @@
+"""
+/applications/list pages count applications, never joined rows: every page
+but the last is exactly `page_size` long and each application shows up once.
+"""
+
+import pytest
+from sqlalchemy import or_, select
+
+from api.controllers.application_controller import SORT_COLUMNS
+from models import Application, ApplicationDepartments
+
+PAGE_SIZE = 7
+
+
+def _visible_app_ids(db, *criteria) -> set[str]:
+    return set(
+        db.scalars(
+            select(Application.id).where(
+                Application.is_active,
+                or_(Application.scope == "is_assessment", Application.scope.is_(None)),
+                *criteria,
+            )
+        )
+    )
+
+
+def _list(client, **params) -> dict:
+    response = client.get("/applications/list", params=params)
+    assert response.status_code == 200, response.text
+    return response.json()["data"]
+
+
+def _offset_pages(client, **params) -> tuple[list[list[str]], int]:
+    pages, page = [], 1
+    while True:
+        body = _list(client, page=page, page_size=PAGE_SIZE, **params)
+        ids = [app["id"] for app in body["apps"]]
+        if not ids:
+            return pages, body["facets"]["total_apps"]
+        pages.append(ids)
+        page += 1
+
+
+def _assert_exact_pages(pages: list[list[str]], total: int) -> None:
+    sizes = [len(page) for page in pages]
+    full, rest = divmod(total, PAGE_SIZE)
+    assert sizes == [PAGE_SIZE] * full + ([rest] if rest else [])
+
+    ids = [app_id for page in pages for app_id in page]
+    assert len(ids) == len(set(ids)) == total
+
+
+@pytest.mark.parametrize("sort_order", ["asc", "desc"])
+@pytest.mark.parametrize("sort_by", sorted(SORT_COLUMNS))
+def test_offset_pages_are_exact(client, db, sort_by, sort_order):
+    pages, total = _offset_pages(client, sort_by=sort_by, sort_order=sort_order)
+
+    _assert_exact_pages(pages, total)
+    assert {app_id for page in pages for app_id in page} == _visible_app_ids(db)
+
+
+def test_offset_pages_are_exact_with_department_filter(client, db, seeded):
+    dept_id = seeded["department_ids"][0]
+    pages, total = _offset_pages(
+        client, dept_filter_id=dept_id, dept_status="cleared,in_progress"
+    )
+
+    _assert_exact_pages(pages, total)
+    expected = _visible_app_ids(
+        db,
+        Application.id.in_(
+            select(ApplicationDepartments.application_id).where(
+                ApplicationDepartments.department_id == dept_id,
+                ApplicationDepartments.status.in_(["cleared", "in_progress"]),
+            )
+        ),
+    )
+    assert {app_id for page in pages for app_id in page} == expected
+
+
+@pytest.mark.parametrize("sort_by", ["started_at", "name", "priority"])
+def test_cursor_pages_are_exact(client, db, sort_by):
+    pages, cursor = [], None
+    while True:
+        params = {"pagination": "cursor", "page_size": PAGE_SIZE, "sort_by": sort_by}
+        if cursor:
+            params["cursor"] = cursor
+        body = _list(client, **params)
+        pages.append([app["id"] for app in body["apps"]])
+        cursor = body["next_cursor"]
+        if not cursor:
+            break
+
+    visible = _visible_app_ids(db)
+    _assert_exact_pages([page for page in pages if page], len(visible))
+    assert {app_id for page in pages for app_id in page} == visible
+
+
+def test_page_carries_every_department(client, db):
+    body = _list(client, page_size=PAGE_SIZE)
+
+    for app in body["apps"]:
+        linked = db.scalar(
+            select(ApplicationDepartments.id)
+            .where(ApplicationDepartments.application_id == app["id"])
+            .limit(1)
+        )
+        if linked is not None:
+            assert app["departments"], app["id"]
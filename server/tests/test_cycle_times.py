@@ -0,0 +1,80 @@
+from collections import defaultdict
+
+import pytest
+from sqlalchemy import select
+
+from models import Application, ApplicationDepartments
+from schemas import dashboard_schemas as ds
+from services.summaries.cycle_times import PERCENTILES, compute_cycle_times
+
+
+def _percentile_cont(values: list[float], p: float) -> float:
+    """Linear interpolation between closest ranks, as percentile_cont does."""
+    values = sorted(values)
+    rank = p / 100 * (len(values) - 1)
+    low = int(rank)
+    high = min(low + 1, len(values) - 1)
+    return values[low] + (values[high] - values[low]) * (rank - low)
+
+
+def _expected(db, params: ds.CycleTimeParams) -> dict:
+    durations = defaultdict(list)
+    if params.level == "application":
+        rows = [
+            (app, None, app.started_at, app.completed_at)
+            for app in db.scalars(select(Application).where(Application.is_active))
+        ]
+    else:
+        rows = [
+            (app, app_dept.department_id, app_dept.started_at, app_dept.ended_at)
+            for app_dept, app in db.execute(
+                select(ApplicationDepartments, Application)
+                .join(Application)
+                .where(Application.is_active, ApplicationDepartments.is_active)
+            )
+        ]
+
+    for app, department_id, started_at, ended_at in rows:
+        if started_at is None or ended_at is None or ended_at < started_at:
+            continue
+        key = {
+            None: None,
+            "department": department_id,
+            "vertical": app.vertical_id,
+            "priority": app.app_priority,
+            "month": ended_at.strftime("%Y-%m"),
+        }[params.group_by]
+        durations[key].append((ended_at - started_at).total_seconds() / 86400)
+
+    return {
+        key: (len(days), *(_percentile_cont(days, p) for p in PERCENTILES))
+        for key, days in durations.items()
+    }
+
+
+@pytest.mark.parametrize(
+    ("level", "group_by"),
+    [
+        ("application", None),
+        ("application", "vertical"),
+        ("application", "priority"),
+        ("application", "month"),
+        ("department", None),
+        ("department", "department"),
+    ],
+)
+def test_percentiles_match_percentile_cont(db, level, group_by):
+    params = ds.CycleTimeParams(level=level, group_by=group_by)
+
+    actual = compute_cycle_times(db, params)
+    expected = _expected(db, params)
+
+    assert actual.keys() == expected.keys()
+    for key, (count, *percentiles) in expected.items():
+        assert actual[key][0] == count
+        assert actual[key][1:] == pytest.approx(percentiles)
+
+
+def test_application_level_cannot_split_by_department(client):
+    response = client.get("/dashboard/cycle-times/application?group_by=department")
+    assert response.status_code == 400
@@ -0,0 +1,95 @@
+from datetime import datetime
+
+import pytest
+from sqlalchemy import event, select, update
+
+from db.connection import engine
+from models import Application, Comment
+from services.caching.data_versions import ALL_GROUPS, read_versions
+
+
+@pytest.fixture
+def version_writes():
+    writes = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        if "data_versions" in statement and not statement.lstrip().startswith(
+            "SELECT"
+        ):
+            writes.append(parameters)
+
+    event.listen(engine, "before_cursor_execute", capture)
+    yield writes
+    event.remove(engine, "before_cursor_execute", capture)
+
+
+def _versions(db):
+    db.rollback()
+    return read_versions(db, ALL_GROUPS)
+
+
+def _first_app(db):
+    return db.scalars(select(Application).order_by(Application.id).limit(1)).one()
+
+
+def test_each_group_bumped_once_at_commit(db, seeded, version_writes):
+    before = _versions(db)
+    app = _first_app(db)
+
+    app.description = "first flush"
+    db.flush()
+    app.description = "second flush"
+    db.flush()
+    db.add(
+        Comment(
+            content="bump test",
+            application_id=app.id,
+            department_id=seeded["department_ids"][0],
+            created_at=datetime.now(),
+        )
+    )
+    db.flush()
+    # nothing is locked until the transaction is about to commit
+    assert version_writes == []
+
+    db.commit()
+    after = _versions(db)
+
+    assert after["applications"] == before["applications"] + 1
+    assert after["comments"] == before["comments"] + 1
+    assert after["app_departments"] == before["app_departments"]
+    assert len(version_writes) == 2
+
+
+def test_writes_flushed_by_commit_are_bumped(db):
+    before = _versions(db)
+    _first_app(db).description = "flushed by commit"
+
+    db.commit()
+
+    assert _versions(db)["applications"] == before["applications"] + 1
+
+
+def test_orm_dml_is_bumped(db):
+    before = _versions(db)
+    app_id = _first_app(db).id
+
+    db.execute(
+        update(Application)
+        .where(Application.id == app_id)
+        .values(description="bulk update")
+    )
+    db.commit()
+
+    assert _versions(db)["applications"] == before["applications"] + 1
+
+
+def test_rollback_bumps_nothing(db, version_writes):
+    before = _versions(db)
+    _first_app(db).description = "rolled back"
+    db.flush()
+
+    db.rollback()
+
+    assert version_writes == []
+    assert _versions(db) == before
@@ -0,0 +1,263 @@
+"""
+Date filters are half-open [start, end) ranges on the raw timestamp columns:
+the edges land on the right side of each boundary, the SLA buckets partition
+the timeline, and the ranges are served by the indexes added for them.
+"""
+
+from datetime import date, datetime, time, timedelta
+
+import pytest
+from sqlalchemy import event, func, select
+
+from db.connection import engine
+from models import Application, ApplicationDepartments
+from services.summaries.date_ranges import (
+    SLA_BUCKETS,
+    age_cutoffs,
+    day_bounds,
+    day_range,
+    sla_bounds,
+    sla_range,
+)
+from support import explain
+
+TODAY = date(2026, 3, 15)
+EDGE = "date-range-edge"
+
+
+def _midnight(day: date) -> datetime:
+    return datetime.combine(day, time.min)
+
+
+def _add_apps(db, seeded, started: list[datetime | None]) -> dict[str, datetime]:
+    """Flush one application per timestamp; the `db` fixture rolls them back."""
+    apps = [
+        Application(
+            name=f"{EDGE}-{i}",
+            creator_id=seeded["admin_id"],
+            status="in_progress",
+            app_priority=3,
+            severity=1,
+            app_type="web",
+            started_at=started_at,
+            vertical_id=seeded["vertical_ids"][0],
+            scope="is_assessment",
+        )
+        for i, started_at in enumerate(started)
+    ]
+    db.add_all(apps)
+    db.flush()
+    return {app.id: app.started_at for app in apps}
+
+
+def _matching(db, criteria) -> set[str]:
+    return set(
+        db.scalars(
+            select(Application.id).where(
+                Application.name.startswith(EDGE), *criteria
+            )
+        )
+    )
+
+
+# ---------- bounds ----------
+
+
+def test_day_bounds_cover_whole_days():
+    assert day_bounds(date(2026, 2, 27), date(2026, 2, 28)) == (
+        datetime(2026, 2, 27),
+        datetime(2026, 3, 1),
+    )
+    assert day_bounds(None, date(2026, 12, 31)) == (None, datetime(2027, 1, 1))
+    assert day_bounds(date(2026, 1, 1), None) == (datetime(2026, 1, 1), None)
+    assert day_bounds() == (None, None)
+
+
+def test_day_range_without_dates_adds_no_criteria():
+    assert day_range(Application.started_at) == []
+
+
+def test_sla_bounds_are_contiguous():
+    assert sla_bounds(30, TODAY) == (_midnight(TODAY - timedelta(days=30)), None)
+    for newer, older in zip([30, 60, 90], [60, 90, 91]):
+        assert sla_bounds(older, TODAY)[1] == sla_bounds(newer, TODAY)[0]
+    assert sla_bounds(91, TODAY) == (None, _midnight(TODAY - timedelta(days=90)))
+
+
+def test_sla_range_ignores_unknown_filters():
+    assert sla_range(Application.started_at, None, TODAY) == []
+    assert sla_range(Application.started_at, 45, TODAY) == []
+
+
+def test_age_cutoffs_are_midnights():
+    assert age_cutoffs([0, 30], TODAY) == [
+        _midnight(TODAY),
+        _midnight(TODAY - timedelta(days=30)),
+    ]
+
+
+# ---------- edges against the database ----------
+
+
+def test_day_range_edges(db, seeded):
+    from_date, to_date = date(2026, 1, 10), date(2026, 1, 20)
+    inside = [
+        _midnight(from_date),
+        _midnight(to_date),
+        datetime.combine(to_date, time.max),
+    ]
+    outside = [
+        _midnight(from_date) - timedelta(microseconds=1),
+        _midnight(to_date + timedelta(days=1)),
+    ]
+    apps = _add_apps(db, seeded, inside + outside)
+
+    matched = _matching(db, day_range(Application.started_at, from_date, to_date))
+
+    assert {apps[app_id] for app_id in matched} == set(inside)
+
+
+def test_open_ended_day_ranges(db, seeded):
+    day = date(2026, 1, 10)
+    last_before = _midnight(day) - timedelta(microseconds=1)
+    apps = _add_apps(db, seeded, [last_before, _midnight(day)])
+
+    since = _matching(db, day_range(Application.started_at, from_date=day))
+    until = _matching(db, day_range(Application.started_at, to_date=day))
+
+    assert {apps[app_id] for app_id in since} == {_midnight(day)}
+    assert {apps[app_id] for app_id in until} == {last_before, _midnight(day)}
+
+
+def _expected_bucket(started_at: datetime) -> int:
+    age = (TODAY - started_at.date()).days
+    if age <= 30:
+        return 30
+    if age <= 60:
+        return 60
+    if age <= 90:
+        return 90
+    return 91
+
+
+def test_sla_buckets_partition_the_timeline(db, seeded):
+    started = [
+        _midnight(TODAY - timedelta(days=age)) + offset
+        for age in range(0, 121)
+        for offset in (timedelta(0), timedelta(days=1, microseconds=-1))
+    ]
+    apps = _add_apps(db, seeded, [*started, None])
+
+    buckets = {
+        sla: _matching(db, sla_range(Application.started_at, sla, TODAY))
+        for sla in SLA_BUCKETS
+    }
+
+    seen = [app_id for members in buckets.values() for app_id in members]
+    assert len(seen) == len(set(seen)), "an application is in two buckets"
+    assert set(seen) == {app_id for app_id, at in apps.items() if at is not None}
+    for sla, members in buckets.items():
+        for app_id in members:
+            assert _expected_bucket(apps[app_id]) == sla, apps[app_id]
+
+
+# ---------- index use ----------
+
+
+def _plan(db, stmt) -> list[str]:
+    statements = []
+
+    def listener(conn, cursor, statement, parameters, context, executemany):
+        statements.append((statement, parameters))
+
+    event.listen(engine, "before_cursor_execute", listener)
+    try:
+        db.execute(stmt).all()
+    finally:
+        event.remove(engine, "before_cursor_execute", listener)
+    (statement, parameters), = statements
+    return explain(statement, parameters)
+
+
+def _range_scans(plan: list[str], table: str, index: str, column: str) -> bool:
+    """Whether `table` is searched through `index` with a range on `column`."""
+    return any(
+        detail.startswith(f"SEARCH {table} USING")
+        and f"INDEX {index} (" in detail
+        and f"{column}>?" in detail
+        for detail in plan
+    )
+
+
+@pytest.mark.parametrize(
+    "criteria",
+    [
+        pytest.param(
+            lambda: day_range(
+                Application.started_at, date(2026, 1, 10), date(2026, 1, 20)
+            ),
+            id="day_range",
+        ),
+        pytest.param(
+            lambda: day_range(Application.started_at, from_date=date(2026, 1, 10)),
+            id="day_range_from",
+        ),
+        *(
+            pytest.param(
+                lambda sla=sla: sla_range(Application.started_at, sla, TODAY),
+                id=f"sla_{sla}",
+            )
+            for sla in SLA_BUCKETS
+        ),
+    ],
+)
+def test_started_at_ranges_use_index(db, seeded, criteria):
+    plan = _plan(db, select(func.count()).where(*criteria()))
+
+    assert _range_scans(
+        plan, "applications", "ix_applications_started_at", "started_at"
+    ), plan
+
+
+def test_completed_at_range_uses_index(db, seeded):
+    within_30, = age_cutoffs([30], TODAY)
+    stmt = select(func.count()).where(
+        Application.is_active,
+        Application.status == "completed",
+        Application.completed_at >= within_30,
+    )
+
+    plan = _plan(db, stmt)
+
+    assert _range_scans(
+        plan, "applications", "ix_applications_active_status_completed", "completed_at"
+    ), plan
+
+
+def test_ended_at_range_uses_index(db, seeded):
+    stmt = select(func.count()).where(
+        ApplicationDepartments.is_active,
+        ApplicationDepartments.status == "cleared",
+        *day_range(
+            ApplicationDepartments.ended_at, date(2026, 1, 10), date(2026, 1, 20)
+        ),
+    )
+
+    plan = _plan(db, stmt)
+
+    assert _range_scans(
+        plan, "application_departments", "ix_app_depts_status_active_ended", "ended_at"
+    ), plan
+
+
+def test_date_function_defeats_the_index(db, seeded):
+    # the shape the range helpers replaced; guards the assertions above
+    stmt = select(func.count()).where(
+        func.date(Application.started_at) >= date(2026, 1, 10)
+    )
+
+    plan = _plan(db, stmt)
+
+    assert not _range_scans(
+        plan, "applications", "ix_applications_started_at", "started_at"
+    ), plan
@@ -0,0 +1,105 @@
+"""
+/export/applications takes the same sparse fieldsets as /applications/list:
+`fields=` picks the overview columns, and the full export is unchanged
+without it.
+"""
+
+import csv
+import io
+
+import pytest
+from sqlalchemy import event, select
+
+from db.connection import engine
+from models import Application, ApplicationDepartments, Department
+from support import DEPARTMENTS
+
+APP_COLUMNS = [
+    "application_name",
+    "description",
+    "environment",
+    "region",
+    "vendor_company",
+    "app_priority",
+    "app_technology",
+    "vertical",
+    "imitra_ticket_id",
+    "overall_status",
+    "titan_spoc",
+    "start_date",
+    "app_url",
+    "user_type",
+    "data_type",
+]
+
+
+def _export(client, **params) -> list[list[str]]:
+    response = client.get("/export/applications", params=params)
+    assert response.status_code == 200, response.text
+    return list(csv.reader(io.StringIO(response.text)))
+
+
+def test_full_export_keeps_its_columns(client):
+    header, *rows = _export(client)
+
+    assert header == APP_COLUMNS + [
+        f"{name}_{kind}" for name in DEPARTMENTS for kind in ("status", "comment")
+    ]
+    assert rows
+
+
+def test_fields_select_columns(client, db):
+    statements = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", capture)
+    try:
+        header, *rows = _export(client, fields="overall_status,application_name")
+    finally:
+        event.remove(engine, "before_cursor_execute", capture)
+
+    assert header == ["application_id", "overall_status", "application_name"]
+    expected = {
+        app_id: [status, name]
+        for app_id, status, name in db.execute(
+            select(Application.id, Application.status, Application.name)
+        )
+    }
+    assert {row[0]: row[1:] for row in rows} == expected
+    assert len(rows) == len(expected)
+    # no department columns asked for, so no department join
+    assert not any("application_departments" in s for s in statements)
+
+
+def test_fields_with_departments(client, db):
+    header, *rows = _export(client, fields="application_name,departments")
+
+    assert header[:2] == ["application_id", "application_name"]
+    assert header[2:] == [
+        f"{name}_{kind}" for name in DEPARTMENTS for kind in ("status", "comment")
+    ]
+    statuses = {
+        (app_id, name): status
+        for app_id, name, status in db.execute(
+            select(
+                ApplicationDepartments.application_id,
+                Department.name,
+                ApplicationDepartments.status,
+            ).join(Department)
+        )
+    }
+    for row in rows:
+        values = dict(zip(header, row))
+        for name in DEPARTMENTS:
+            assert values[f"{name}_status"] == statuses.get(
+                (values["application_id"], name), ""
+            )
+
+
+@pytest.mark.parametrize("fields", ["application_name,owner_email", "id"])
+def test_unknown_fields_are_rejected(client, fields):
+    response = client.get("/export/applications", params={"fields": fields})
+
+    assert response.status_code == 400
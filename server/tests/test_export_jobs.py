@@ -0,0 +1,147 @@
+"""
+Export job ids are the artifact names, so a job submitted to one worker
+process can be followed and downloaded through any other. Two queues on one
+artifact directory stand in for two workers.
+"""
+
+import os
+import threading
+import time
+
+import pytest
+
+from services.exports import export_jobs as export_jobs_module
+from services.exports.export_jobs import ExportJobQueue, ExportType, export_jobs
+
+NAME = "test_csv"
+
+
+class Build:
+    """An export body that counts its builds and can be held mid build."""
+
+    def __init__(self):
+        self.calls = 0
+        self.release = threading.Event()
+        self.release.set()
+
+    def __call__(self, db):
+        self.calls += 1
+        yield "id,name\n"
+        self.release.wait(timeout=10)
+        yield "1,first\n"
+
+
+def _queue(artifact_dir, build: Build) -> ExportJobQueue:
+    queue = ExportJobQueue(str(artifact_dir), workers=1)
+    queue.register(NAME, ExportType("test.csv", "text/csv", ("applications",), build))
+    return queue
+
+
+def _wait(queue: ExportJobQueue, job_id: str, status: str):
+    deadline = time.monotonic() + 10
+    while time.monotonic() < deadline:
+        job = queue.get(job_id)
+        if job is not None and job.status == status:
+            return job
+        time.sleep(0.01)
+    pytest.fail(f"job {job_id} never got to {status}")
+
+
+@pytest.fixture
+def workers(tmp_path):
+    builds = Build(), Build()
+    return [_queue(tmp_path, build) for build in builds], builds
+
+
+def test_job_id_is_the_artifact_name(db, workers):
+    (queue, _), _ = workers
+
+    job = queue.submit(db, NAME)
+
+    assert os.path.basename(job.path) == f"{job.id}.csv"
+    assert job.id.startswith(f"{NAME}-")
+
+
+def test_done_job_resolves_in_another_worker(db, workers):
+    (first, second), (_, second_build) = workers
+    job = first.submit(db, NAME)
+    _wait(first, job.id, "done")
+
+    seen = second.get(job.id)
+    again = second.submit(db, NAME)
+
+    assert seen is not None and seen.status == "done"
+    assert seen.path == job.path and seen.bytes_written == os.path.getsize(job.path)
+    assert again.id == job.id and again.cached
+    assert second_build.calls == 0
+
+
+def test_running_job_is_joined_by_another_worker(db, workers):
+    (first, second), (first_build, second_build) = workers
+    first_build.release.clear()
+    job = first.submit(db, NAME)
+    try:
+        _wait(second, job.id, "running")
+
+        joined = second.submit(db, NAME)
+
+        assert joined.id == job.id and joined.status == "running"
+    finally:
+        first_build.release.set()
+
+    assert _wait(second, job.id, "done").path == job.path
+    assert first_build.calls == 1
+    assert second_build.calls == 0
+
+
+def test_stale_partial_file_is_rebuilt(db, workers, monkeypatch):
+    (first, second), (first_build, second_build) = workers
+    first_build.release.clear()
+    job = first.submit(db, NAME)
+    try:
+        _wait(second, job.id, "running")
+        # as if the first worker died mid build
+        monkeypatch.setattr(export_jobs_module, "EXPORT_PARTIAL_STALE_SECONDS", -1)
+
+        assert second.get(job.id) is None
+        rebuilt = second.submit(db, NAME)
+        _wait(second, rebuilt.id, "done")
+    finally:
+        first_build.release.set()
+
+    assert rebuilt.id == job.id
+    assert second_build.calls == 1
+
+
+@pytest.mark.parametrize(
+    "job_id",
+    [
+        "unknown_type-0123456789abcdef",
+        f"{NAME}-0123456789ABCDEF",
+        f"{NAME}-0123",
+        f"../{NAME}-0123456789abcdef",
+        "0123456789abcdef",
+    ],
+)
+def test_unknown_job_ids_are_not_found(workers, job_id):
+    (queue, _), _ = workers
+
+    assert queue.get(job_id) is None
+
+
+def test_download_through_a_worker_that_never_saw_the_job(client, monkeypatch):
+    response = client.post("/exports/jobs", json={"export_type": "applications_csv"})
+    assert response.status_code == 202, response.text
+    job_id = response.json()["id"]
+    _wait(export_jobs, job_id, "done")
+
+    # the worker answering the next requests has no record of the job
+    monkeypatch.setattr(export_jobs, "_jobs", {})
+
+    status = client.get(f"/exports/jobs/{job_id}")
+    download = client.get(f"/exports/jobs/{job_id}/download")
+
+    assert status.status_code == 200, status.text
+    assert status.json()["status"] == "done"
+    assert download.status_code == 200
+    assert download.content.startswith(b"application_name")
@@ -0,0 +1,38 @@
+from sqlalchemy import delete
+
+from support import login
+from models import DepartmentUsers
+from services.auth.context import load_auth_context
+from services.auth.permissions import is_user_of_dept
+
+
+def test_context_and_table_agree_on_inactive_membership(db, admin, seeded):
+    dept_id = seeded["department_ids"][1]
+    db.add(DepartmentUsers(department_id=dept_id, user_id=admin.id, is_active=False))
+    db.commit()
+    try:
+        auth = load_auth_context(login(db, admin)["session_id"], db)
+
+        # the context only carries active departments (used for list scoping)
+        assert dept_id not in auth.department_ids
+        assert is_user_of_dept(dept_id=dept_id, user_id=admin.id, db=db)
+        assert is_user_of_dept(dept_id=dept_id, user_id=admin.id, db=db, auth=auth)
+    finally:
+        db.execute(
+            delete(DepartmentUsers).where(
+                DepartmentUsers.department_id == dept_id,
+                DepartmentUsers.user_id == admin.id,
+            )
+        )
+        db.commit()
+
+
+def test_active_membership_comes_from_context(db, admin, seeded):
+    auth = load_auth_context(login(db, admin)["session_id"], db)
+    dept_id = seeded["department_ids"][0]
+
+    assert dept_id in auth.department_ids
+    assert is_user_of_dept(dept_id=dept_id, user_id=admin.id, db=db, auth=auth)
+    assert not is_user_of_dept(
+        dept_id=seeded["department_ids"][-1], user_id=admin.id, db=db, auth=auth
+    )
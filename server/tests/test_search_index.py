@@ -0,0 +1,34 @@
+"""
+create_all builds the MySQL FULLTEXT search index like migration
+3f9a6c1d8e27 does: with InnoDB's stopword list switched off.
+"""
+
+from sqlalchemy import create_mock_engine
+
+from db.base import Base
+from models import Application
+
+
+def test_create_all_builds_search_index_without_stopwords():
+    statements = []
+    mysql = create_mock_engine(
+        "mysql+pymysql://",
+        lambda sql, *args, **kwargs: statements.append(
+            str(sql.compile(dialect=mysql.dialect)).split()
+        ),
+    )
+
+    Base.metadata.create_all(
+        mysql, tables=[Application.__table__], checkfirst=False
+    )
+
+    fulltext = next(
+        i for i, words in enumerate(statements) if words[:2] == ["CREATE", "FULLTEXT"]
+    )
+    settings = [
+        (i, words[-1])
+        for i, words in enumerate(statements)
+        if words[:3] == ["SET", "SESSION", "innodb_ft_enable_stopword"]
+    ]
+    assert [value for _, value in settings] == ["0", "DEFAULT"]
+    assert settings[0][0] < fulltext < settings[1][0]
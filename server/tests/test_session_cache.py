@@ -0,0 +1,104 @@
+import uuid
+
+from sqlalchemy import event, update
+
+from db.connection import SessionLocal, engine
+from models import UserSession
+from services.auth.jwt_handler import create_tokens
+from services.auth.session_cache import (
+    ROTATING_SESSION_COLUMNS,
+    auth_cache,
+    load_auth_context_cached,
+)
+from services.auth.utils import hash_token
+from support import login
+
+
+def _rotate_elsewhere(client, admin):
+    """Rotate the session's tokens the way another worker's refresh would:
+    committed to the DB, but never revoked in this process's cache."""
+    session_id = client.cookies.get("session_id")
+    access_token, refresh_token = create_tokens(
+        user_id=admin.id, role=admin.role, sid=session_id, mfa_verified=True
+    )
+    csrf_token = uuid.uuid4().hex
+    with engine.begin() as conn:
+        conn.execute(
+            update(UserSession)
+            .where(UserSession.id == session_id)
+            .values(
+                access_token_hash=hash_token(access_token),
+                refresh_token_hash=hash_token(refresh_token),
+                csrf_token=csrf_token,
+            )
+        )
+    client.cookies.set("access_token", access_token)
+    client.cookies.set("refresh_token", refresh_token)
+    client.cookies.set("csrf_token", csrf_token)
+    client.headers["X-CSRF-Token"] = csrf_token
+    return session_id
+
+
+def test_cached_context_survives_rotation_by_another_worker(client, admin, db):
+    assert client.get("/applications/list").status_code == 200
+    session_id = client.cookies.get("session_id")
+    assert auth_cache.get(session_id) is not None
+
+    _rotate_elsewhere(client, admin)
+    assert auth_cache.get(session_id) is not None
+
+    response = client.get("/applications/list")
+    assert response.status_code == 200, response.text
+
+    user_session = db.get(UserSession, session_id)
+    db.refresh(user_session)
+    assert user_session.is_active
+
+
+def test_local_snapshot_has_no_rotating_secrets(client):
+    client.get("/applications/list")
+    snapshot = auth_cache.get(client.cookies.get("session_id"))
+
+    assert ROTATING_SESSION_COLUMNS.isdisjoint(snapshot["session"])
+    assert "password_hash" not in snapshot["user"]
+
+
+def _queries_on_cache_hit(db, admin) -> list[str]:
+    """SELECTs a cache hit runs, up to everything validate_session reads."""
+    session_id = login(db, admin)["session_id"]
+    warm = SessionLocal()
+    try:
+        load_auth_context_cached(session_id, warm)
+    finally:
+        warm.close()
+
+    statements = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    hit = SessionLocal()
+    event.listen(engine, "before_cursor_execute", capture)
+    try:
+        auth = load_auth_context_cached(session_id, hit)
+        for column in sorted(ROTATING_SESSION_COLUMNS):
+            getattr(auth.session, column)
+        _ = auth.session.user_agent, auth.user.role
+    finally:
+        event.remove(engine, "before_cursor_execute", capture)
+        hit.close()
+    return statements
+
+
+def test_local_cache_hit_reads_rotating_secrets(db, admin):
+    statements = _queries_on_cache_hit(db, admin)
+
+    assert len(statements) == 1
+    assert "FROM user_sessions" in statements[0]
+
+
+def test_shared_cache_hit_runs_no_auth_query(db, admin, monkeypatch):
+    # what RedisAuthCache keeps, since every rotation revokes its entries
+    monkeypatch.setattr(auth_cache, "excluded_session_columns", frozenset())
+
+    assert _queries_on_cache_hit(db, admin) == []
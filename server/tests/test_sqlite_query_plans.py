@@ -0,0 +1,122 @@
+"""
+SQLite smoke test for the dashboard and list queries: EXPLAIN every query
+the endpoints run against the seeded database and fail if one of them reads
+a whole table without an index.
+
+This only shows that SQLite, with these indexes, can avoid full scans. It
+says nothing about the plans MySQL picks, which depend on its optimizer and
+statistics; check those with EXPLAIN on a production-sized copy. Within
+that limit:
+
+- plans come from EXPLAIN QUERY PLAN, where a full scan shows up as a bare
+  `SCAN <table>`; `SCAN <table> USING [COVERING] INDEX` walks an index and
+  is allowed;
+- small lookup tables are allowed to be scanned;
+- search is left out, its indexed path (FULLTEXT) only exists on MySQL.
+"""
+
+import re
+
+import pytest
+from sqlalchemy import event
+
+from db.base import Base
+from db.connection import engine
+from support import explain
+
+# a handful of rows each, bounded by configuration rather than by traffic
+LOOKUP_TABLES = {
+    "app_summary_counters",
+    "data_versions",
+    "departments",
+    "department_users",
+    "verticals",
+}
+
+FULL_SCAN_RE = re.compile(r"^SCAN (\w+)$")
+
+DASHBOARD_URLS = [
+    "/dashboard/summary/applications",
+    "/dashboard/summary/applications?severity=1,2&priority=1",
+    "/dashboard/summary/applications?app_age_from=2026-01-01&app_age_to=2026-06-30",
+    "/dashboard/summary/departments",
+    "/dashboard/summary/departments?app_status=completed",
+    "/dashboard/summary/department/{department_id}/category"
+    "?dept_status=cleared&app_status=completed",
+    "/dashboard/summary/department/{department_id}/category"
+    "?dept_status=cleared&app_status=all&sla_filter=60",
+    "/dashboard/summary/priority-wise",
+    "/dashboard/summary/vertical-wise",
+    "/dashboard/summary/departments/status?app_status=completed&dept_status=cleared",
+    "/dashboard/summary/departments/status-matrix",
+    "/dashboard/summary/app_type",
+    "/dashboard/summary/vapt",
+    "/dashboard/summary/completion",
+    "/dashboard/summary/dept_completions",
+    "/dashboard/summary/dept_completions?from_date=2026-01-01&to_date=2026-06-30",
+    "/dashboard/bundle",
+    "/dashboard/cycle-times/application",
+    "/dashboard/cycle-times/department?group_by=department",
+]
+
+# no search: on SQLite it goes through the in-process trigram index and LIKE
+LIST_URLS = [
+    "/applications/list",
+    "/applications/list?page=3&page_size=10",
+    "/applications/list?pagination=cursor&page_size=10",
+    "/applications/list?status=completed,closed",
+    "/applications/list?dept_filter_id={department_id}&dept_status=cleared",
+    "/applications/list?sla_filter=30",
+    "/applications/list?app_age_from=2026-01-01&app_age_to=2026-06-30",
+    "/applications/list?sort_by=name&sort_order=asc",
+    "/applications/list?scope=all",
+]
+
+
+def _table_name(name: str) -> str | None:
+    """Real table behind a plan entry, None for subqueries and CTEs."""
+    if name in Base.metadata.tables:
+        return name
+    # SQLAlchemy aliases: applications_1, application_departments_2, ...
+    base = re.sub(r"_\d+$", "", name)
+    return base if base in Base.metadata.tables else None
+
+
+def _full_scans(statement: str, parameters) -> list[str]:
+    scanned = []
+    for detail in explain(statement, parameters):
+        found = FULL_SCAN_RE.match(detail)
+        if not found:
+            continue
+        table = _table_name(found.group(1))
+        if table is not None and table not in LOOKUP_TABLES:
+            scanned.append(table)
+    return scanned
+
+
+@pytest.fixture
+def captured_selects():
+    statements: list[tuple[str, object]] = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith(("SELECT", "WITH")):
+            statements.append((statement, parameters))
+
+    event.listen(engine, "before_cursor_execute", capture)
+    yield statements
+    event.remove(engine, "before_cursor_execute", capture)
+
+
+@pytest.mark.parametrize("url", DASHBOARD_URLS + LIST_URLS)
+def test_no_full_table_scans_on_sqlite(url, client, seeded, captured_selects):
+    response = client.get(url.format(department_id=seeded["department_ids"][0]))
+    assert response.status_code == 200, response.text
+    assert captured_selects, "the endpoint ran no queries"
+
+    offenders = []
+    for statement, parameters in captured_selects:
+        scanned = _full_scans(statement, parameters)
+        if scanned:
+            offenders.append(f"{sorted(set(scanned))}: {' '.join(statement.split())}")
+
+    assert not offenders, "full table scan:\n" + "\n\n".join(offenders)
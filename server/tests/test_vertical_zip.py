@@ -0,0 +1,95 @@
+"""
+The per-vertical ZIP export has one entry per vertical, even when two
+vertical names clean up to the same file name.
+"""
+
+import io
+import zipfile
+
+import pytest
+from sqlalchemy import delete
+
+from db.connection import SessionLocal
+from models import Application, ApplicationDepartments
+from services.exports.zip_stream import iter_zip
+
+COLLIDING_VERTICALS = ["Retail/Online", "Retail_Online", "retail_online"]
+
+
+@pytest.fixture
+def colliding_verticals(seeded):
+    db = SessionLocal()
+    app_ids = []
+    try:
+        apps = [
+            Application(
+                name=f"Zip App {i}",
+                creator_id=seeded["admin_id"],
+                status="in_progress",
+                app_priority=3,
+                vertical=vertical,
+            )
+            for i, vertical in enumerate(COLLIDING_VERTICALS)
+        ]
+        db.add_all(apps)
+        db.flush()
+        db.add_all(
+            ApplicationDepartments(
+                application_id=app.id,
+                department_id=seeded["department_ids"][0],
+                status="in_progress",
+            )
+            for app in apps
+        )
+        db.commit()
+        app_ids = [app.id for app in apps]
+        yield app_ids
+    finally:
+        db.rollback()
+        db.execute(
+            delete(ApplicationDepartments).where(
+                ApplicationDepartments.application_id.in_(app_ids)
+            )
+        )
+        db.execute(delete(Application).where(Application.id.in_(app_ids)))
+        db.commit()
+        db.close()
+
+
+def _entries(content: bytes) -> list[tuple[str, str]]:
+    with zipfile.ZipFile(io.BytesIO(content)) as archive:
+        return [
+            (info.filename, archive.open(info).read().decode())
+            for info in archive.infolist()
+        ]
+
+
+def test_colliding_vertical_names_get_their_own_entries(client, colliding_verticals):
+    response = client.get("/export/applications/verticals/csv")
+    assert response.status_code == 200
+
+    entries = _entries(response.content)
+
+    names = [name.lower() for name, _ in entries]
+    assert len(names) == len(set(names))
+    retail = [
+        (name, body) for name, body in entries if name.lower().startswith("retail")
+    ]
+    assert sorted(name for name, _ in retail) == [
+        "Retail_Online (2).csv",
+        "Retail_Online.csv",
+        "retail_online (3).csv",
+    ]
+    apps = sorted(
+        line.split(",")[0] for _, body in retail for line in body.splitlines()[1:]
+    )
+    assert apps == ["Zip App 0", "Zip App 1", "Zip App 2"]
+
+
+def test_unique_names_keep_the_extension():
+    entries = [("a.csv", ["x\n"]), ("A.csv", ["y\n"]), ("a.csv", [])]
+
+    content = b"".join(iter_zip(entries))
+
+    names = [name for name, _ in _entries(content)]
+    assert names == ["a.csv", "A (2).csv", "a (3).csv"]